@@ -1,9 +1,16 @@
 """Analyze repository state and detect issues."""
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextlib
+import itertools
+import os
+import queue
+import threading
+from collections.abc import Callable, Collection, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from git_repo_checker import git_ops, scanner
+from git_repo_checker.manifest import ScanManifest
 from git_repo_checker.models import (
     Config,
     PullResult,
@@ -13,8 +20,27 @@ from git_repo_checker.models import (
     WarningType,
 )
 
+MAX_PULL_WORKERS = 8
 
-def analyze_repo(repo_path: Path, config: Config) -> RepoInfo:
+# Concurrent fetches allowed against one remote host within a scan, so a
+# large batch of repos on one server does not open a session per worker.
+MAX_FETCHES_PER_HOST = 8
+
+HostSlot = Callable[[Path], threading.BoundedSemaphore]
+
+# Scans that find at most this many repos are analyzed on the calling thread.
+# Kept at one: with two or more repos their fetches overlap in the pool,
+# which saves far more than the pool costs to start.
+INLINE_SCAN_LIMIT = 1
+
+
+def analyze_repo(
+    repo_path: Path,
+    config: Config,
+    cache: git_ops.GitCache | None = None,
+    host_slot: HostSlot | None = None,
+    fetch: bool = True,
+) -> RepoInfo:
     """Analyze a single repository and return its info.
 
     Gathers branch, status, remote state, and generates warnings.
@@ -22,58 +48,92 @@ def analyze_repo(repo_path: Path, config: Config) -> RepoInfo:
     Args:
         repo_path: Path to repository root.
         config: Application configuration for main branch detection.
+        cache: Optional cache for upstream lookups and recent fetches.
+        host_slot: Optional per-host fetch limiter from make_host_slots.
+        fetch: Whether to fetch first; False when the caller already did.
 
     Returns:
         RepoInfo with all gathered information.
     """
     try:
-        branch = git_ops.get_current_branch(repo_path)
-        status, changed, untracked = git_ops.get_repo_status(repo_path)
-        has_remote = git_ops.has_upstream(repo_path)
-        repo_has_stash = git_ops.has_stash(repo_path)
-
         # Fetch to get latest remote state before checking ahead/behind
-        if has_remote:
-            git_ops.fetch_repo(repo_path)
+        if fetch:
+            _fetch_upstream(repo_path, cache, host_slot)
 
-        ahead, behind = git_ops.get_remote_status(repo_path)
+        snap = git_ops.get_repo_snapshot(repo_path)
 
-        final_status = git_ops.determine_remote_status(ahead, behind, status)
-        is_main = is_main_branch(branch, config.main_branches)
-        warnings = detect_warnings(branch, status, is_main, has_remote, repo_has_stash)
+        final_status = git_ops.determine_remote_status(snap.ahead, snap.behind, snap.status)
+        is_main = is_main_branch(snap.branch, config.main_branches_lower)
+        warnings = detect_warnings(
+            snap.branch, snap.status, is_main, snap.has_upstream, snap.has_stash
+        )
 
         return RepoInfo(
             path=repo_path,
-            branch=branch,
+            branch=snap.branch,
             status=final_status,
             is_main_branch=is_main,
-            ahead_count=ahead,
-            behind_count=behind,
-            changed_files=changed,
-            untracked_files=untracked,
-            has_stash=repo_has_stash,
+            ahead_count=snap.ahead,
+            behind_count=snap.behind,
+            changed_files=snap.changed,
+            untracked_files=snap.untracked,
+            has_stash=snap.has_stash,
             warnings=warnings,
         )
     except git_ops.GitError as e:
-        return RepoInfo(
-            path=repo_path,
-            branch="unknown",
-            status=RepoStatus.ERROR,
-            error_message=str(e),
-        )
+        return _error_info(repo_path, e)
+
+
+def _fetch_upstream(
+    repo_path: Path,
+    cache: git_ops.GitCache | None = None,
+    host_slot: HostSlot | None = None,
+) -> None:
+    """Fetch a repository if its current branch tracks an upstream.
+
+    Args:
+        repo_path: Path to repository root.
+        cache: Optional cache; a fetch within its TTL is skipped.
+        host_slot: Optional per-host fetch limiter from make_host_slots.
+
+    Raises:
+        GitError: If a git command times out.
+    """
+    if git_ops.has_upstream(repo_path, cache):
+        slot = host_slot(repo_path) if host_slot is not None else contextlib.nullcontext()
+        with slot:
+            git_ops.fetch_repo(repo_path, cache)
+
+
+def _error_info(repo_path: Path, error: git_ops.GitError) -> RepoInfo:
+    """Build the RepoInfo reported for a repository git failed on.
+
+    Args:
+        repo_path: Path to repository root.
+        error: The git failure.
+
+    Returns:
+        RepoInfo with ERROR status and the error message.
+    """
+    return RepoInfo(
+        path=repo_path,
+        branch="unknown",
+        status=RepoStatus.ERROR,
+        error_message=str(error),
+    )
 
 
-def is_main_branch(branch: str, main_branches: list[str]) -> bool:
+def is_main_branch(branch: str, main_branches: Collection[str]) -> bool:
     """Check if branch name is considered a main branch.
 
     Args:
         branch: Current branch name.
-        main_branches: List of main branch names from config.
+        main_branches: Lowercased main branch names, e.g. Config.main_branches_lower.
 
     Returns:
         True if branch is a main branch.
     """
-    return branch.lower() in [b.lower() for b in main_branches]
+    return branch.lower() in main_branches
 
 
 def detect_warnings(
@@ -122,25 +182,39 @@ def should_auto_pull(repo_info: RepoInfo, config: Config) -> bool:
     Returns:
         True if repo should be auto-pulled.
     """
-    if not config.auto_pull.enabled:
-        return False
+    return make_pull_filter(config)(repo_info)
+
+
+def make_pull_filter(config: Config) -> Callable[[RepoInfo], bool]:
+    """Build an auto-pull predicate with the config settings captured once.
 
-    if repo_info.status == RepoStatus.ERROR:
-        return False
+    Checks run cheapest and most selective first: most repos in a scan are
+    not behind, so behind_count rejects them before any config lookup or
+    pattern match.
+
+    Args:
+        config: Application configuration.
 
-    if config.auto_pull.require_clean and repo_info.status not in (
-        RepoStatus.CLEAN,
-        RepoStatus.BEHIND,
-    ):
-        return False
+    Returns:
+        Predicate returning True if a repo should be auto-pulled.
+    """
+    if not config.auto_pull.enabled:
+        return lambda repo_info: False
 
-    if repo_info.behind_count == 0:
-        return False
+    require_clean = config.auto_pull.require_clean
+    skip_patterns = config.auto_pull.skip_patterns
 
-    if matches_skip_pattern(repo_info.path, config.auto_pull.skip_patterns):
-        return False
+    def pull_filter(repo_info: RepoInfo) -> bool:
+        if repo_info.behind_count == 0:
+            return False
+        status = repo_info.status
+        if status == RepoStatus.ERROR:
+            return False
+        if require_clean and status not in (RepoStatus.CLEAN, RepoStatus.BEHIND):
+            return False
+        return not matches_skip_pattern(repo_info.path, skip_patterns)
 
-    return True
+    return pull_filter
 
 
 def matches_skip_pattern(path: Path, patterns: list[str]) -> bool:
@@ -156,8 +230,226 @@ def matches_skip_pattern(path: Path, patterns: list[str]) -> bool:
     return scanner.matches_any_pattern(path, patterns)
 
 
+def auto_pull_repos(
+    repos: list[RepoInfo],
+    config: Config,
+    cache: git_ops.GitCache | None = None,
+    max_workers: int = MAX_PULL_WORKERS,
+) -> list[PullResult]:
+    """Pull eligible repositories, in parallel across remote hosts.
+
+    Pulls of different repos never touch the same working tree, so they
+    run concurrently. Pulls against the same remote host are serialized
+    to avoid piling many sessions onto one server. Repos that pull
+    successfully are marked clean and no longer behind.
+
+    Args:
+        repos: Analyzed repositories, in display order.
+        config: Application configuration.
+        cache: Optional cache invalidated for each pulled repo.
+        max_workers: Maximum concurrent pulls.
+
+    Returns:
+        Pull results in the same order as the eligible repos.
+    """
+    pull_filter = make_pull_filter(config)
+    candidates = [r for r in repos if pull_filter(r)]
+    if not candidates:
+        return []
+
+    host_locks: dict[str, threading.Lock] = {}
+    registry_lock = threading.Lock()
+
+    def pull_with_host_lock(repo_info: RepoInfo) -> PullResult:
+        host = git_ops.remote_host(git_ops.get_remote_url(repo_info.path))
+        with registry_lock:
+            lock = host_locks.setdefault(host, threading.Lock())
+        with lock:
+            return git_ops.pull_repo(repo_info.path, cache)
+
+    workers = min(max_workers, len(candidates))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pull_results = list(executor.map(pull_with_host_lock, candidates))
+
+    for repo_info, result in zip(candidates, pull_results, strict=True):
+        if result.success:
+            repo_info.status = RepoStatus.CLEAN
+            repo_info.behind_count = 0
+
+    return pull_results
+
+
+def make_host_slots(limit: int = MAX_FETCHES_PER_HOST) -> HostSlot:
+    """Build a per-host fetch limiter shared by the threads of one pool.
+
+    Fetches to different hosts never wait on each other; fetches to the
+    same host beyond the limit wait for a slot.
+
+    Args:
+        limit: Maximum concurrent fetches per remote host.
+
+    Returns:
+        Function mapping a repo path to the semaphore for its origin host.
+    """
+    host_slots: dict[str, threading.BoundedSemaphore] = {}
+    registry_lock = threading.Lock()
+
+    def host_slot(repo_path: Path) -> threading.BoundedSemaphore:
+        host = git_ops.remote_host(git_ops.get_remote_url(repo_path))
+        with registry_lock:
+            return host_slots.setdefault(host, threading.BoundedSemaphore(limit))
+
+    return host_slot
+
+
+def scan_and_analyze_stream(
+    config: Config,
+    max_workers: int | None = None,
+    cache: git_ops.GitCache | None = None,
+    errors: list[str] | None = None,
+) -> Iterator[RepoInfo]:
+    """Scan configured paths and yield each repository's info as it completes.
+
+    Results arrive in completion order, not path order, so callers can show
+    early repos while slower ones are still fetching.
+
+    Args:
+        config: Application configuration.
+        max_workers: Maximum number of threads for parallel analysis.
+            Defaults to git_ops.io_worker_count.
+        cache: Optional cache for upstream lookups and recent fetches.
+        errors: Optional list that receives scan error messages.
+
+    Yields:
+        RepoInfo for each discovered repository.
+    """
+    for _index, repo_info in _iter_analyzed(config, max_workers, cache, errors):
+        yield repo_info
+
+
+def _iter_analyzed(
+    config: Config,
+    max_workers: int | None,
+    cache: git_ops.GitCache | None,
+    errors: list[str] | None,
+    manifest: ScanManifest | None = None,
+) -> Iterator[tuple[int, RepoInfo]]:
+    """Analyze repos as the walk finds them, yielding (walk index, info) pairs.
+
+    Args:
+        config: Application configuration.
+        max_workers: Maximum number of analysis threads.
+        cache: Optional cache for upstream lookups and recent fetches.
+        errors: Optional list that receives scan error messages.
+        manifest: Optional previous results to reuse for unchanged repos.
+
+    Yields:
+        Each repo's discovery index and its info, in completion order.
+    """
+    discovered = scanner.iter_git_repos(
+        scan_paths=config.scan_paths,
+        exclude_patterns=config.exclude_patterns,
+        exclude_paths=config.exclude_paths,
+        errors=errors,
+    )
+
+    head = list(itertools.islice(discovered, INLINE_SCAN_LIMIT + 1))
+    if len(head) <= INLINE_SCAN_LIMIT:
+        for index, repo_path in enumerate(head):
+            repo_info = _analyze_if_present(repo_path, config, cache, manifest)
+            if repo_info is not None:
+                yield index, repo_info
+        return
+
+    # Analyze repos in parallel; threads mostly wait on git subprocesses.
+    # Each repo is submitted as soon as the walk finds it, so traversal
+    # overlaps with fetching and status checks, and finished repos are
+    # yielded between submissions rather than after the walk ends.
+    host_slot = make_host_slots()
+    finished: queue.SimpleQueue[Future[RepoInfo | None]] = queue.SimpleQueue()
+    future_to_index: dict[Future[RepoInfo | None], int] = {}
+    with ThreadPoolExecutor(max_workers=git_ops.io_worker_count(None, max_workers)) as executor:
+        for index, repo_path in enumerate(itertools.chain(head, discovered)):
+            future = executor.submit(
+                _analyze_if_present, repo_path, config, cache, manifest, host_slot
+            )
+            future_to_index[future] = index
+            future.add_done_callback(finished.put)
+            while not finished.empty():
+                yield from _take_finished(finished.get(), future_to_index)
+        while future_to_index:
+            yield from _take_finished(finished.get(), future_to_index)
+
+
+def _take_finished(
+    future: Future[RepoInfo | None], future_to_index: dict[Future[RepoInfo | None], int]
+) -> Iterator[tuple[int, RepoInfo]]:
+    """Pop a completed analysis and yield its (walk index, info) pair, if any.
+
+    Args:
+        future: Completed future from the analysis pool.
+        future_to_index: Outstanding futures by discovery index; updated.
+
+    Yields:
+        The repo's discovery index and info, unless the repo vanished.
+    """
+    index = future_to_index.pop(future)
+    repo_info = future.result()
+    if repo_info is not None:
+        yield index, repo_info
+
+
+def _analyze_if_present(
+    repo_path: Path,
+    config: Config,
+    cache: git_ops.GitCache | None,
+    manifest: ScanManifest | None = None,
+    host_slot: HostSlot | None = None,
+) -> RepoInfo | None:
+    """Analyze a discovered repo unless its .git vanished since the walk.
+
+    A single stat here is far cheaper than forking git processes that would
+    only fail on a deleted or moved checkout. With a manifest, the repo is
+    fetched first and reuses the last scan's result if its git metadata,
+    remote-tracking refs included, is unchanged.
+
+    Args:
+        repo_path: Path to repository root.
+        config: Application configuration.
+        cache: Optional cache for upstream lookups and recent fetches.
+        manifest: Optional previous results to reuse for unchanged repos.
+        host_slot: Optional per-host fetch limiter from make_host_slots.
+
+    Returns:
+        RepoInfo, or None if the repository no longer exists.
+    """
+    if not os.path.lexists(repo_path / ".git"):
+        return None
+    if manifest is None:
+        return analyze_repo(repo_path, config, cache, host_slot)
+
+    # Fetch before fingerprinting, so new upstream commits invalidate the entry.
+    try:
+        _fetch_upstream(repo_path, cache, host_slot)
+    except git_ops.GitError as e:
+        return _error_info(repo_path, e)
+    state = manifest.state(repo_path)
+    reused = manifest.lookup(repo_path, state)
+    if reused is not None:
+        return reused
+    repo_info = analyze_repo(repo_path, config, cache, host_slot, fetch=False)
+    if repo_info.status != RepoStatus.ERROR:
+        manifest.record(repo_path, state, repo_info)
+    return repo_info
+
+
 def scan_and_analyze(
-    config: Config, auto_pull: bool = True, max_workers: int | None = None
+    config: Config,
+    auto_pull: bool = True,
+    max_workers: int | None = None,
+    cache: git_ops.GitCache | None = None,
+    on_repo: Callable[[RepoInfo], None] | None = None,
+    manifest: ScanManifest | None = None,
 ) -> ScanResult:
     """Scan all configured paths and analyze each repository.
 
@@ -168,44 +460,33 @@ def scan_and_analyze(
         config: Application configuration.
         auto_pull: Whether to perform auto-pull on eligible repos.
         max_workers: Maximum number of threads for parallel analysis.
-            Defaults to min(32, cpu_count + 4).
+            Defaults to git_ops.io_worker_count.
+        cache: Cache shared across scans in the same process. A fresh one using
+            auto_pull.fetch_ttl_seconds is created when omitted.
+        on_repo: Called with each repo as soon as its analysis finishes,
+            e.g. the callback from Reporter.live_results.
+        manifest: Previous results to reuse for repos whose git metadata is
+            unchanged. The caller saves it once the scan is done.
 
     Returns:
         ScanResult with all repos and pull results.
     """
-    repos: list[RepoInfo] = []
-    pull_results: list[PullResult] = []
-
-    walk = scanner.walk_git_repos(
-        scan_paths=config.scan_paths,
-        exclude_patterns=config.exclude_patterns,
-        exclude_paths=config.exclude_paths,
-    )
-    scan_errors = walk.errors
-
-    # Analyze repos in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_path = {
-            executor.submit(analyze_repo, repo_path, config): repo_path for repo_path in walk.repos
-        }
-
-        for future in as_completed(future_to_path):
-            repo_info = future.result()
-            repos.append(repo_info)
-
-    # Sort by path for consistent output
-    repos.sort(key=lambda r: r.path)
-
-    # Auto-pull must be sequential to avoid conflicts
-    if auto_pull:
-        for repo_info in repos:
-            if should_auto_pull(repo_info, config):
-                result = git_ops.pull_repo(repo_info.path)
-                pull_results.append(result)
-
-                if result.success:
-                    repo_info.status = RepoStatus.CLEAN
-                    repo_info.behind_count = 0
+    if cache is None:
+        cache = git_ops.GitCache(fetch_ttl_seconds=config.auto_pull.fetch_ttl_seconds)
+
+    scan_errors: list[str] = []
+    # The walk yields repos in path order and each result is stored in its
+    # discovery slot, so the list comes out sorted without a final sort.
+    slots: list[RepoInfo | None] = []
+    for index, repo_info in _iter_analyzed(config, max_workers, cache, scan_errors, manifest):
+        if index >= len(slots):
+            slots.extend([None] * (index + 1 - len(slots)))
+        slots[index] = repo_info
+        if on_repo is not None:
+            on_repo(repo_info)
+    repos = [r for r in slots if r is not None]
+
+    pull_results = auto_pull_repos(repos, config, cache) if auto_pull else []
 
     return ScanResult(
         repos=repos,
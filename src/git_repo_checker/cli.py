@@ -1,25 +1,35 @@
 """git-repo-checker CLI."""
 
+from __future__ import annotations
+
+import functools
 import json
+import os
+import sys
+import textwrap
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, TextIO
 
 import typer
 from rich.console import Console
 
-from git_repo_checker import config as config_module
 from git_repo_checker import schedule as schedule_module
-from git_repo_checker import sync as sync_module
-from git_repo_checker.analyzer import analyze_repo, scan_and_analyze
-from git_repo_checker.models import (
-    Config,
-    OutputConfig,
-    RepoStatus,
-    ScanResult,
-    SyncAction,
-)
-from git_repo_checker.reporter import Reporter
-from git_repo_checker.schedule import ScheduleStatus
+
+# Modules that pull in pydantic, yaml and the git helpers are imported inside
+# the commands that use them so `grc --help` and `grc schedule` start fast.
+if TYPE_CHECKING:
+    from git_repo_checker.models import (
+        Config,
+        PullResult,
+        RepoInfo,
+        RepoStatus,
+        ScanResult,
+        SyncRepoResult,
+        SyncResult,
+    )
+    from git_repo_checker.schedule import ScheduleStatus
 
 app = typer.Typer(
     name="git-repo-checker",
@@ -32,6 +42,9 @@ app.add_typer(schedule_app, name="schedule")
 
 console = Console()
 
+# Home directory with a trailing separator, for prefix checks in shorten_path.
+_HOME_PREFIX = str(Path.home()).rstrip(os.sep) + os.sep
+
 
 def get_config(config_path: Path | None, verbose: bool, quiet: bool) -> Config:
     """Load config and apply CLI overrides.
@@ -44,6 +57,8 @@ def get_config(config_path: Path | None, verbose: bool, quiet: bool) -> Config:
     Returns:
         Config with CLI overrides applied.
     """
+    from git_repo_checker import config as config_module
+
     config = config_module.load_config(config_path)
 
     if verbose:
@@ -83,6 +98,8 @@ def _auto_track(
         path_prefix: Prefix used to relativize repo paths.
         quiet: When True, suppress console output.
     """
+    from git_repo_checker import sync as sync_module
+
     added, skipped, collisions = sync_module.auto_track_repos(result.repos, target, path_prefix)
     if not quiet and added:
         console.print(f"[green]Tracked {added} new repo(s) in[/] {target}")
@@ -146,14 +163,18 @@ def main(
     if ctx.invoked_subcommand is not None:
         return
 
+    from git_repo_checker.analyzer import scan_and_analyze
+    from git_repo_checker.reporter import Reporter
+
     try:
         config = get_config(config_path, verbose, quiet)
     except FileNotFoundError as e:
         console.print(f"[red]Error:[/] {e}")
         raise typer.Exit(1) from e
 
-    result = scan_and_analyze(config)
     reporter = Reporter(console, config.output)
+    with reporter.live_results() as on_repo:
+        result = scan_and_analyze(config, on_repo=on_repo)
     reporter.display_results(result)
     _print_scan_errors(result, quiet)
 
@@ -186,7 +207,7 @@ def scan(
     ] = None,
     check_ci: Annotated[
         bool,
-        typer.Option("--ci", help="Check GitHub Actions CI status (requires gh CLI)"),
+        typer.Option("--ci", help="Check GitHub Actions CI status (requires gh CLI or GH_TOKEN)"),
     ] = False,
     json_output: Annotated[
         bool,
@@ -216,11 +237,20 @@ def scan(
         int | None,
         typer.Option("--workers", "-j", help="Number of parallel workers (default: auto)"),
     ] = None,
+    cached: Annotated[
+        bool,
+        typer.Option(
+            "--cached",
+            help="Reuse last --cached scan for repos whose git metadata is unchanged",
+        ),
+    ] = False,
 ) -> None:
     """Scan directories for git repositories.
 
     Reports status and optionally auto-pulls clean repos behind remote.
     """
+    from git_repo_checker.reporter import Reporter
+
     try:
         config = get_config(config_path, verbose, quiet)
     except FileNotFoundError as e:
@@ -239,10 +269,10 @@ def scan(
     if warnings_only:
         config.output.show_clean = False
 
-    result = scan_and_analyze(config, auto_pull=config.auto_pull.enabled, max_workers=workers)
-
     if check_ci:
-        _add_ci_status(result)
+        result = _scan_with_ci(config, workers, cached)
+    else:
+        result = _run_scan(config, workers, cached)
 
     if status_filter:
         result = _filter_by_status(result, status_filter)
@@ -262,6 +292,39 @@ def scan(
     _print_scan_errors(result, quiet)
 
 
+def _run_scan(
+    config: Config,
+    workers: int | None,
+    cached: bool,
+    on_repo: Callable[[RepoInfo], None] | None = None,
+) -> ScanResult:
+    """Run the scan, reusing and updating the last scan's manifest when cached.
+
+    Args:
+        config: Application configuration.
+        workers: Maximum analysis threads, or None for auto.
+        cached: Whether to reuse results for repos with unchanged git metadata.
+        on_repo: Called with each repo as soon as its analysis finishes.
+
+    Returns:
+        ScanResult for the configured paths.
+    """
+    from git_repo_checker.analyzer import scan_and_analyze
+    from git_repo_checker.manifest import ScanManifest
+
+    manifest = ScanManifest.load(config=config) if cached else None
+    result = scan_and_analyze(
+        config,
+        auto_pull=config.auto_pull.enabled,
+        max_workers=workers,
+        on_repo=on_repo,
+        manifest=manifest,
+    )
+    if manifest is not None:
+        manifest.save()
+    return result
+
+
 def _maybe_auto_track(
     result: ScanResult,
     config: Config,
@@ -280,6 +343,8 @@ def _maybe_auto_track(
         json_output: When True, suppress all console output.
         quiet: When True, suppress non-essential output.
     """
+    from git_repo_checker import sync as sync_module
+
     if not result.repos or not _should_auto_track(None, no_track, config):
         return
     effective_prefix = path_prefix if path_prefix != "~" else config.auto_track.path_prefix
@@ -304,6 +369,8 @@ def _run_export_repos(
         path_prefix: Prefix for relative paths.
         merge: Whether to merge with an existing file.
     """
+    from git_repo_checker import sync as sync_module
+
     try:
         added, skipped, collisions = sync_module.export_repos_to_file(
             result.repos, export_repos, path_prefix, merge
@@ -324,6 +391,8 @@ def init(
     ] = Path("./git-repo-checker.yml"),
 ) -> None:
     """Create a default configuration file."""
+    from git_repo_checker import config as config_module
+
     try:
         config_module.create_default_config(path)
         console.print(f"[green]Created config file:[/] {path}")
@@ -345,9 +414,13 @@ def check(
     ] = False,
 ) -> None:
     """Check status of a single repository."""
+    from git_repo_checker.analyzer import analyze_repo
+    from git_repo_checker.models import Config, OutputConfig
+    from git_repo_checker.reporter import Reporter
+
     repo_path = repo_path.expanduser().resolve()
 
-    if not (repo_path / ".git").exists():
+    if not os.path.exists(os.path.join(repo_path, ".git")):
         console.print(f"[red]Error:[/] Not a git repository: {repo_path}")
         raise typer.Exit(1)
 
@@ -362,6 +435,51 @@ def check(
         reporter.display_warnings([repo_info])
 
 
+@app.command()
+def watch(
+    config_path: Annotated[
+        Path | None,
+        typer.Option("-c", "--config", help="Path to config file"),
+    ] = None,
+    interval: Annotated[
+        float,
+        typer.Option("--interval", "-i", help="Seconds between polls"),
+    ] = 5.0,
+    count: Annotated[
+        int,
+        typer.Option("--count", help="Stop after this many polls (0 = until Ctrl-C)"),
+    ] = 0,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", "-j", help="Number of parallel workers (default: auto)"),
+    ] = None,
+) -> None:
+    """Keep a live status table, re-checking only repos whose git state changed."""
+    from rich.live import Live
+
+    from git_repo_checker import watch as watch_module
+    from git_repo_checker.reporter import Reporter
+
+    try:
+        config = get_config(config_path, False, False)
+    except FileNotFoundError as e:
+        console.print(f"[red]Error:[/] {e}")
+        raise typer.Exit(1) from e
+
+    reporter = Reporter(console, config.output)
+    watcher = watch_module.RepoWatcher(config, max_workers=workers)
+
+    with Live(console=console) as live:
+
+        def on_update(w: watch_module.RepoWatcher, _changed: list[Path]) -> None:
+            live.update(reporter.build_repo_table(reporter.filter_repos(w.repos())))
+
+        try:
+            watch_module.run_watch(watcher, on_update, interval, max_cycles=count or None)
+        except KeyboardInterrupt:
+            pass
+
+
 def _load_config_or_default(config_path: Path | None) -> Config:
     """Load config, falling back to defaults when none is found.
 
@@ -371,6 +489,9 @@ def _load_config_or_default(config_path: Path | None) -> Config:
     Returns:
         Loaded Config, or a default Config if no file exists.
     """
+    from git_repo_checker import config as config_module
+    from git_repo_checker.models import Config
+
     try:
         return config_module.load_config(config_path)
     except FileNotFoundError:
@@ -405,6 +526,8 @@ def add(
     ] = "~",
 ) -> None:
     """Add a single repository to repos.yml for syncing."""
+    from git_repo_checker import sync as sync_module
+
     config = _load_config_or_default(config_path)
     target = repos_path or sync_module.default_repos_target(config.auto_track.repos_file)
     effective_prefix = path_prefix if path_prefix != "~" else config.auto_track.path_prefix
@@ -465,14 +588,16 @@ def sync(
     Uses repos.yml to define which repositories should exist locally.
     Override paths for different machines with --path-prefix or local.yml.
     """
+    from git_repo_checker import sync as sync_module
+
     if init_repos:
         _init_repos_file(repos_path)
         return
 
     if repos_url:
-        repos_path = _fetch_repos_from_url(repos_url)
-
-    repos = _load_repos_or_exit(repos_path, path_prefix)
+        repos = _fetch_repos_from_url(repos_url, path_prefix)
+    else:
+        repos = _load_repos_or_exit(repos_path, path_prefix)
     if not repos:
         console.print("[yellow]No repositories defined in repos file.[/]")
         return
@@ -482,7 +607,10 @@ def sync(
         return
 
     console.print(f"Syncing [bold]{len(repos)}[/] tracked repositories...\n")
-    result = sync_module.sync_all(repos, pull_existing=not no_pull, max_workers=workers)
+    with _sync_progress(len(repos), quiet) as on_result:
+        result = sync_module.sync_all(
+            repos, pull_existing=not no_pull, max_workers=workers, on_result=on_result
+        )
     _display_sync_results(result, quiet)
 
 
@@ -576,6 +704,8 @@ def _init_repos_file(repos_path: Path | None) -> None:
     Args:
         repos_path: Optional target path; defaults to ./repos.yml.
     """
+    from git_repo_checker import sync as sync_module
+
     output_path = repos_path or Path("./repos.yml")
     try:
         sync_module.create_repos_file(output_path)
@@ -596,6 +726,8 @@ def _load_repos_or_exit(repos_path: Path | None, path_prefix: str | None = None)
     Returns:
         List of TrackedRepo objects.
     """
+    from git_repo_checker import sync as sync_module
+
     try:
         return sync_module.load_repos_file(repos_path, path_prefix)
     except FileNotFoundError as e:
@@ -603,28 +735,67 @@ def _load_repos_or_exit(repos_path: Path | None, path_prefix: str | None = None)
         raise typer.Exit(1) from e
 
 
-def _fetch_repos_from_url(url: str) -> Path:
-    """Fetch repos file from URL and return local path.
+def _fetch_repos_from_url(url: str, path_prefix: str | None = None) -> list:
+    """Fetch repos file from URL, save it locally, and load its repos.
+
+    Freshly downloaded content is parsed from memory rather than read back
+    from the saved file.
 
     Args:
         url: URL to fetch repos.yml from.
+        path_prefix: Optional path prefix override.
 
     Returns:
-        Local path where the file was saved.
+        List of TrackedRepo objects.
     """
     from urllib.error import URLError
 
+    from git_repo_checker import sync as sync_module
+
     try:
         console.print(f"Fetching repos.yml from [cyan]{url}[/]...")
-        path = sync_module.fetch_repos_from_url(url)
-        console.print(f"[green]Saved to:[/] {path}\n")
-        return path
+        path, content = sync_module.download_repos_file(url)
     except URLError as e:
         console.print(f"[red]Error fetching URL:[/] {e}")
         raise typer.Exit(1) from e
 
+    if content is None:
+        console.print(f"[green]Unchanged:[/] {path}\n")
+        return _load_repos_or_exit(path, path_prefix)
+    console.print(f"[green]Saved to:[/] {path}\n")
+    return sync_module.load_repos_from_bytes(content, path_prefix)
+
+
+@contextmanager
+def _sync_progress(total: int, quiet: bool) -> Iterator[Callable[[SyncRepoResult], None]]:
+    """Show a transient "N/total" status line while repos sync.
+
+    Yields a callback to pass as sync_all's on_result. On non-terminal
+    consoles or in quiet mode the callback does nothing.
+
+    Args:
+        total: Number of repos being synced.
+        quiet: When True, show nothing.
+
+    Yields:
+        Callback that records one finished repo.
+    """
+    if quiet or not console.is_terminal:
+        yield lambda repo_result: None
+        return
+
+    done = 0
+    with console.status(f"Synced 0/{total}") as status:
+
+        def advance(repo_result: SyncRepoResult) -> None:
+            nonlocal done
+            done += 1
+            status.update(f"Synced {done}/{total}: {shorten_path(repo_result.repo.path)}")
 
-def _display_sync_results(result: sync_module.SyncResult, quiet: bool) -> None:
+        yield advance
+
+
+def _display_sync_results(result: SyncResult, quiet: bool) -> None:
     """Display sync results to console.
 
     Args:
@@ -639,7 +810,7 @@ def _display_sync_results(result: sync_module.SyncResult, quiet: bool) -> None:
         _print_sync_summary(result)
 
 
-def _print_repo_result(repo_result: sync_module.SyncRepoResult, path_str: str, quiet: bool) -> None:
+def _print_repo_result(repo_result: SyncRepoResult, path_str: str, quiet: bool) -> None:
     """Print a single repo sync result.
 
     Args:
@@ -647,6 +818,8 @@ def _print_repo_result(repo_result: sync_module.SyncRepoResult, path_str: str, q
         path_str: Display path string.
         quiet: When True, skip non-notable results.
     """
+    from git_repo_checker.models import SyncAction
+
     if repo_result.action == SyncAction.CLONED:
         console.print(f"  [green]+[/] {path_str}: {repo_result.message}")
     elif repo_result.action == SyncAction.PULLED:
@@ -657,7 +830,7 @@ def _print_repo_result(repo_result: sync_module.SyncRepoResult, path_str: str, q
         console.print(f"  [dim]·[/] {path_str}: {repo_result.message}")
 
 
-def _print_sync_summary(result: sync_module.SyncResult) -> None:
+def _print_sync_summary(result: SyncResult) -> None:
     """Print sync summary line.
 
     Args:
@@ -685,26 +858,52 @@ def shorten_path(path: Path) -> str:
     Returns:
         Path string shortened relative to home, or absolute.
     """
-    try:
-        return "~/" + str(path.relative_to(Path.home()))
-    except ValueError:
-        return str(path)
+    path_str = str(path)
+    if path_str.startswith(_HOME_PREFIX):
+        return "~/" + path_str[len(_HOME_PREFIX) :]
+    return path_str
 
 
-def _add_ci_status(result: ScanResult) -> None:
-    """Add CI status to all repos in the result.
+def _scan_with_ci(config: Config, workers: int | None, cached: bool) -> ScanResult:
+    """Run the scan with CI lookups starting as each repo is analyzed.
 
     Args:
-        result: ScanResult to update with CI status.
+        config: Application configuration.
+        workers: Maximum analysis threads, or None for auto.
+        cached: Whether to reuse results for repos with unchanged git metadata.
+
+    Returns:
+        ScanResult with ci_status set on every repo when CI can be queried.
     """
     from git_repo_checker import github_ops
 
-    if not github_ops.is_gh_available():
-        console.print("[yellow]Warning: gh CLI not available, skipping CI status checks[/]")
-        return
+    if not github_ops.is_ci_available():
+        console.print(
+            "[yellow]Warning: gh CLI not available and no GH_TOKEN set, "
+            "skipping CI status checks[/]"
+        )
+        return _run_scan(config, workers, cached)
 
+    with github_ops.CIStatusPrefetcher(cache_ttl_seconds=config.ci.cache_ttl_seconds) as prefetcher:
+        result = _run_scan(config, workers, cached, lambda repo: prefetcher.submit(repo.path))
+        statuses = prefetcher.results()
     for repo in result.repos:
-        repo.ci_status = github_ops.get_ci_status(repo.path)
+        repo.ci_status = statuses[repo.path]
+    return result
+
+
+@functools.cache
+def _statuses_by_value() -> dict[str, RepoStatus]:
+    """Map each RepoStatus value to its member, built on first use.
+
+    Kept out of module scope so importing the CLI does not load models.
+
+    Returns:
+        Dict of status value to RepoStatus.
+    """
+    from git_repo_checker.models import RepoStatus
+
+    return {s.value: s for s in RepoStatus}
 
 
 def _filter_by_status(result: ScanResult, status_filter: str) -> ScanResult:
@@ -717,15 +916,19 @@ def _filter_by_status(result: ScanResult, status_filter: str) -> ScanResult:
     Returns:
         Filtered ScanResult with only matching repos.
     """
+    from git_repo_checker.models import ScanResult
+
     statuses = {s.strip().lower() for s in status_filter.split(",")}
-    valid_statuses = {s.value for s in RepoStatus}
+    valid_statuses = _statuses_by_value()
 
-    invalid = statuses - valid_statuses
+    invalid = statuses - valid_statuses.keys()
     if invalid:
         console.print(f"[yellow]Warning: Unknown status values: {', '.join(invalid)}[/]")
         console.print(f"[dim]Valid values: {', '.join(sorted(valid_statuses))}[/]")
 
-    filtered_repos = [r for r in result.repos if r.status.value in statuses]
+    # Compare enum members (identity hash) rather than .value per repo.
+    wanted = {valid_statuses[s] for s in statuses if s in valid_statuses}
+    filtered_repos = [r for r in result.repos if r.status in wanted]
 
     return ScanResult(
         repos=filtered_repos,
@@ -738,40 +941,80 @@ def _filter_by_status(result: ScanResult, status_filter: str) -> ScanResult:
 def _output_json(result: ScanResult) -> None:
     """Output scan results as JSON.
 
+    Writes one repo at a time instead of building the whole document first,
+    so memory stays flat for large scans. The text matches json.dumps with
+    indent=2.
+
     Args:
         result: The scan result to output.
     """
-    output = {
-        "total_scanned": result.total_scanned,
-        "repos": [
-            {
-                "path": str(r.path),
-                "branch": r.branch,
-                "status": r.status.value,
-                "is_main_branch": r.is_main_branch,
-                "ahead_count": r.ahead_count,
-                "behind_count": r.behind_count,
-                "changed_files": r.changed_files,
-                "untracked_files": r.untracked_files,
-                "has_stash": r.has_stash,
-                "ci_status": r.ci_status.value if r.ci_status else None,
-                "warnings": [w.value for w in r.warnings],
-                "error_message": r.error_message,
-            }
-            for r in result.repos
-        ],
-        "pull_results": [
-            {
-                "path": str(p.path),
-                "success": p.success,
-                "message": p.message,
-                "files_changed": p.files_changed,
-            }
-            for p in result.pull_results
-        ],
-        "scan_errors": result.scan_errors,
+    out = sys.stdout
+    out.write("{\n")
+    out.write(f'  "total_scanned": {json.dumps(result.total_scanned)},\n')
+    _write_json_list(out, "repos", (_repo_json(r) for r in result.repos))
+    out.write(",\n")
+    _write_json_list(out, "pull_results", (_pull_json(p) for p in result.pull_results))
+    out.write(",\n")
+    _write_json_list(out, "scan_errors", result.scan_errors)
+    out.write("\n}\n")
+
+
+def _write_json_list(out: TextIO, key: str, items: Iterable[object]) -> None:
+    """Write one top-level list member, serializing items as they are produced.
+
+    Args:
+        out: Stream to write to.
+        key: Member name.
+        items: JSON-serializable items.
+    """
+    out.write(f"  {json.dumps(key)}: [")
+    separator = "\n"
+    for item in items:
+        out.write(separator + textwrap.indent(json.dumps(item, indent=2), "    "))
+        separator = ",\n"
+    out.write("]" if separator == "\n" else "\n  ]")
+
+
+def _repo_json(r: RepoInfo) -> dict:
+    """Convert a repo to its JSON object.
+
+    Args:
+        r: Repository info.
+
+    Returns:
+        JSON-serializable dict.
+    """
+    return {
+        "path": str(r.path),
+        "branch": r.branch,
+        "status": r.status.value,
+        "is_main_branch": r.is_main_branch,
+        "ahead_count": r.ahead_count,
+        "behind_count": r.behind_count,
+        "changed_files": r.changed_files,
+        "untracked_files": r.untracked_files,
+        "has_stash": r.has_stash,
+        "ci_status": r.ci_status.value if r.ci_status else None,
+        "warnings": [w.value for w in r.warnings],
+        "error_message": r.error_message,
+    }
+
+
+def _pull_json(p: PullResult) -> dict:
+    """Convert a pull result to its JSON object.
+
+    Args:
+        p: Pull result.
+
+    Returns:
+        JSON-serializable dict.
+    """
+    return {
+        "path": str(p.path),
+        "success": p.success,
+        "message": p.message,
+        "files_changed": p.files_changed,
     }
-    print(json.dumps(output, indent=2))
 
 
 def _display_sync_dry_run(repos: list, pull_existing: bool) -> None:
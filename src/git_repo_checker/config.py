@@ -1,10 +1,22 @@
 """Configuration management for git-repo-checker."""
 
+import hashlib
+import os
+import pickle
+import tempfile
 from pathlib import Path
+from typing import Any
 
 import yaml
 
-from git_repo_checker.models import AutoPullConfig, AutoTrackConfig, Config, OutputConfig
+from git_repo_checker import __version__
+from git_repo_checker.models import (
+    AutoPullConfig,
+    AutoTrackConfig,
+    CIConfig,
+    Config,
+    OutputConfig,
+)
 
 DEFAULT_CONFIG_LOCATIONS = [
     Path("./git-repo-checker.yml"),
@@ -13,6 +25,15 @@ DEFAULT_CONFIG_LOCATIONS = [
     Path.home() / ".config" / "git-repo-checker" / "config.yaml",
 ]
 
+# libyaml's C loader and emitter when PyYAML was built with them; same safe
+# subset, much faster.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+CONFIG_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "git-repo-checker"
+)
+
 DEFAULT_CONFIG_TEMPLATE = """\
 # Directories to scan for git repositories
 scan_paths:
@@ -40,6 +61,7 @@ auto_pull:
   enabled: true
   require_clean: true
   skip_patterns: []
+  fetch_ttl_seconds: 0  # skip re-fetching within this many seconds
 
 # Auto-track: append newly-found repos (with a remote) to repos.yml during scan
 auto_track:
@@ -47,6 +69,10 @@ auto_track:
   # repos_file: ~/.config/git-repo-checker/repos.yml  # optional explicit target
   path_prefix: ~
 
+# CI status checks (scan --ci)
+ci:
+  cache_ttl_seconds: 60  # reuse GitHub workflow results this long (0 = always query)
+
 # Output settings
 output:
   show_clean: true
@@ -107,14 +133,132 @@ def load_config_from_path(config_path: Path) -> Config:
         FileNotFoundError: If file does not exist.
         ValueError: If YAML is invalid or doesn't match schema.
     """
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    try:
+        stat_info = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+    cache_file, cache_key = _config_cache_entry(config_path, stat_info)
+    cached = _read_cached_config(cache_file, cache_key)
+    if cached is not None:
+        return cached
 
     with open(config_path) as f:
-        raw_config = yaml.safe_load(f) or {}
+        raw_config = yaml.load(f, Loader=YAML_LOADER) or {}
+
+    config = expand_paths(parse_raw_config(raw_config))
+    _write_cache_file(cache_file, cache_key, config)
+    return config
+
+
+def _config_cache_entry(config_path: Path, stat_info: os.stat_result) -> tuple[Path, tuple]:
+    """Locate the cache file for a config and the key its contents must match.
+
+    The file name depends only on the config path, so each config has one
+    entry that is overwritten when it misses. The key adds everything
+    expand_paths resolves against (cwd, home), the version, mtime and size.
+
+    Args:
+        config_path: Path to the YAML config file.
+        stat_info: Result of stat on config_path.
+
+    Returns:
+        Tuple of (cache file path, cache key).
+    """
+    location = str(config_path.absolute())
+    digest = hashlib.sha256(location.encode()).hexdigest()[:16]
+    key = (
+        location,
+        os.getcwd(),
+        str(Path.home()),
+        __version__,
+        stat_info.st_mtime_ns,
+        stat_info.st_size,
+    )
+    return CONFIG_CACHE_DIR / f"config-{digest}.pkl", key
+
+
+def _read_cached_config(cache_file: Path, cache_key: tuple) -> Config | None:
+    """Load a cached Config if it was stored under the same key.
+
+    Args:
+        cache_file: Pickle file written by _write_cache_file.
+        cache_key: Key the cached entry must match.
+
+    Returns:
+        Cached Config, or None on a miss or unreadable cache.
+    """
+    config = _read_cache_file(cache_file, cache_key)
+    return config if isinstance(config, Config) else None
+
+
+def _read_cache_file(cache_file: Path, cache_key: object) -> Any:
+    """Load a cached value if it was stored under the same key.
 
-    config = parse_raw_config(raw_config)
-    return expand_paths(config)
+    Args:
+        cache_file: Pickle file written by _write_cache_file.
+        cache_key: Key the cached entry must match.
+
+    Returns:
+        Cached value, or None on a miss or unreadable cache.
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            stored_key, value = pickle.load(f)
+    except Exception:
+        return None
+    return value if stored_key == cache_key else None
+
+
+def _write_cache_file(cache_file: Path, cache_key: object, value: object) -> None:
+    """Atomically store a cached value; failures are ignored.
+
+    Args:
+        cache_file: Destination pickle file.
+        cache_key: Key stored alongside the value.
+        value: Picklable value to cache.
+    """
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((cache_key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_file)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+def load_yaml_cached(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous parse when its bytes are unchanged.
+
+    The cache holds one entry per file path, keyed on a hash of the file
+    contents, so edits are always picked up regardless of mtime.
+
+    Args:
+        path: YAML file to load.
+
+    Returns:
+        Parsed YAML document.
+
+    Raises:
+        FileNotFoundError: If path does not exist.
+        yaml.YAMLError: If the file is not valid YAML.
+    """
+    data = path.read_bytes()
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    location = hashlib.sha256(str(path.absolute()).encode()).hexdigest()[:16]
+    cache_file = CONFIG_CACHE_DIR / f"yaml-{location}.pkl"
+
+    cached = _read_cache_file(cache_file, digest)
+    if cached is not None:
+        return cached
+
+    raw = yaml.load(data, Loader=YAML_LOADER)
+    _write_cache_file(cache_file, digest, raw)
+    return raw
 
 
 def parse_raw_config(raw: dict) -> Config:
@@ -128,6 +272,7 @@ def parse_raw_config(raw: dict) -> Config:
     """
     auto_pull_raw = raw.get("auto_pull", {})
     auto_track_raw = raw.get("auto_track", {})
+    ci_raw = raw.get("ci", {})
     output_raw = raw.get("output", {})
 
     return Config(
@@ -137,28 +282,27 @@ def parse_raw_config(raw: dict) -> Config:
         main_branches=raw.get("main_branches", ["main", "master"]),
         auto_pull=AutoPullConfig(**auto_pull_raw),
         auto_track=AutoTrackConfig(**auto_track_raw),
+        ci=CIConfig(**ci_raw),
         output=OutputConfig(**output_raw),
     )
 
 
 def expand_paths(config: Config) -> Config:
-    """Expand ~ and resolve all paths to absolute paths.
+    """Expand ~ and resolve all paths to absolute paths, in place.
+
+    The path lists are updated on the given Config rather than copied into
+    a new, re-validated one; load_config_from_path passes a freshly parsed
+    Config that nothing else references.
 
     Args:
         config: Config with potentially unexpanded paths.
 
     Returns:
-        Config with all paths expanded and resolved.
+        The same Config with all paths expanded and resolved.
     """
-    return Config(
-        scan_paths=[p.expanduser().resolve() for p in config.scan_paths],
-        exclude_patterns=config.exclude_patterns,
-        exclude_paths=[p.expanduser().resolve() for p in config.exclude_paths],
-        main_branches=config.main_branches,
-        auto_pull=config.auto_pull,
-        auto_track=config.auto_track,
-        output=config.output,
-    )
+    config.scan_paths[:] = [p.expanduser().resolve() for p in config.scan_paths]
+    config.exclude_paths[:] = [p.expanduser().resolve() for p in config.exclude_paths]
+    return config
 
 
 def create_default_config(output_path: Path) -> None:
@@ -1,12 +1,36 @@
 """Git operations - status, pull, branch detection."""
 
+import functools
+import os
 import re
+import stat
 import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import IO, Any, cast
+from urllib.parse import urlsplit
 
 from git_repo_checker.models import PullResult, RepoStatus
 
 DEFAULT_TIMEOUT = 30
+MAX_IO_WORKERS = 64
+MAX_GIT_PROCESSES = MAX_IO_WORKERS
+
+# Caps concurrent git children across every pool in the process (analysis,
+# auto-pull, sync), so nested fan-out cannot fork more than the machine
+# can usefully run.
+_git_process_slots = threading.BoundedSemaphore(MAX_GIT_PROCESSES)
+
+_MtimeKey = tuple[int, int]
+
+_FILES_CHANGED_RE = re.compile(r"(\d+)\s+file")
+
+# Read size for iter_git_output; bounds memory for commands with huge output.
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class GitError(Exception):
@@ -23,6 +47,280 @@ class GitError(Exception):
         super().__init__(message)
 
 
+def _git_mtimes(repo_path: Path) -> _MtimeKey | None:
+    """Return mtimes of .git/HEAD and .git/config used to validate cached lookups.
+
+    Args:
+        repo_path: Path to repository root.
+
+    Returns:
+        Tuple of nanosecond mtimes, or None if either file cannot be read.
+    """
+    git_dir = repo_path / ".git"
+    try:
+        return (git_dir / "HEAD").stat().st_mtime_ns, (git_dir / "config").stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@dataclass
+class GitCache:
+    """Per-process cache of upstream lookups and fetch times, keyed by repo path.
+
+    Upstream answers stay valid until .git/HEAD or .git/config changes (branch
+    switch or tracking edit). Fetches younger than fetch_ttl_seconds are skipped;
+    a TTL of 0 disables fetch caching. Repos not yet fetched by this process
+    fall back to the mtime of .git/FETCH_HEAD, so back-to-back runs also skip.
+    """
+
+    fetch_ttl_seconds: float = 0
+    upstream_refs: dict[Path, tuple[_MtimeKey, bool]] = field(default_factory=dict)
+    fetch_timestamps: dict[Path, float] = field(default_factory=dict)
+
+    def lookup_upstream(self, repo_path: Path) -> bool | None:
+        """Return the cached upstream answer if still valid.
+
+        Args:
+            repo_path: Path to repository root.
+
+        Returns:
+            Cached has-upstream value, or None on miss or stale entry.
+        """
+        cached = self.upstream_refs.get(repo_path)
+        if cached is None or cached[0] != _git_mtimes(repo_path):
+            return None
+        return cached[1]
+
+    def store_upstream(self, repo_path: Path, value: bool) -> None:
+        """Remember whether a repository has an upstream.
+
+        Args:
+            repo_path: Path to repository root.
+            value: Result of the upstream lookup.
+        """
+        key = _git_mtimes(repo_path)
+        if key is not None:
+            self.upstream_refs[repo_path] = (key, value)
+
+    def fetch_is_fresh(self, repo_path: Path) -> bool:
+        """Check whether a repository was fetched within the TTL.
+
+        Args:
+            repo_path: Path to repository root.
+
+        Returns:
+            True if the last fetch is younger than the TTL.
+        """
+        if self.fetch_ttl_seconds <= 0:
+            return False
+        last = self.fetch_timestamps.get(repo_path)
+        if last is None:
+            return fetched_within(repo_path, self.fetch_ttl_seconds)
+        return time.monotonic() - last < self.fetch_ttl_seconds
+
+    def record_fetch(self, repo_path: Path) -> None:
+        """Record a successful fetch.
+
+        Args:
+            repo_path: Path to repository root.
+        """
+        self.fetch_timestamps[repo_path] = time.monotonic()
+
+    def invalidate(self, repo_path: Path) -> None:
+        """Drop all cached state for a repository.
+
+        Args:
+            repo_path: Path to repository root.
+        """
+        self.upstream_refs.pop(repo_path, None)
+        self.fetch_timestamps.pop(repo_path, None)
+
+
+def fetched_within(repo_path: Path, max_age_seconds: float) -> bool:
+    """Check whether any git process fetched a repository recently.
+
+    git rewrites .git/FETCH_HEAD on every fetch and pull, so its mtime
+    survives across grc runs, unlike GitCache's in-process timestamps.
+
+    Args:
+        repo_path: Path to repository root.
+        max_age_seconds: Maximum age of FETCH_HEAD to count as recent.
+
+    Returns:
+        True if FETCH_HEAD exists and is younger than max_age_seconds.
+    """
+    try:
+        mtime = os.stat(os.path.join(repo_path, ".git", "FETCH_HEAD")).st_mtime
+    except OSError:
+        return False
+    return time.time() - mtime < max_age_seconds
+
+
+def is_git_dir(path: str | os.PathLike[str]) -> bool:
+    """Check whether path contains a .git directory, with a single stat call.
+
+    Used on the scan hot path, so it joins strings instead of building Path
+    objects. A .git file (worktree or submodule) does not count.
+
+    Args:
+        path: Directory to check.
+
+    Returns:
+        True if path/.git exists and is a directory.
+    """
+    try:
+        st = os.stat(os.path.join(path, ".git"))
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode)
+
+
+def read_git_files(repo_path: Path, names: tuple[str, ...]) -> dict[str, bytes] | None:
+    """Read small metadata files from a repository's .git directory in-process.
+
+    Args:
+        repo_path: Path to repository root.
+        names: File names relative to .git (e.g. "HEAD", "config").
+
+    Returns:
+        Mapping of name to contents; missing files are omitted. None when .git
+        is not a directory (worktrees, submodules), so callers fall back to git.
+    """
+    git_dir = repo_path / ".git"
+    if not git_dir.is_dir():
+        return None
+
+    contents: dict[str, bytes] = {}
+    for name in names:
+        try:
+            contents[name] = (git_dir / name).read_bytes()
+        except OSError:
+            continue
+    return contents
+
+
+def branch_from_head(head: bytes) -> str | None:
+    """Extract the branch name from the contents of .git/HEAD.
+
+    Args:
+        head: Raw bytes of .git/HEAD.
+
+    Returns:
+        Branch name, or None when HEAD is detached.
+    """
+    ref = head.strip()
+    if not ref.startswith(b"ref: refs/heads/"):
+        return None
+    return ref[len(b"ref: refs/heads/") :].decode(errors="replace")
+
+
+def parse_git_config(raw: bytes) -> dict[tuple[str, str], dict[str, str]] | None:
+    """Parse the subset of git config syntax needed for branch and remote lookups.
+
+    Args:
+        raw: Raw bytes of a git config file.
+
+    Returns:
+        Mapping of (section, subsection) to {key: value}. Section and key names
+        are lowercased as git treats them case-insensitively. None if the file
+        uses include directives, which only git itself can resolve.
+    """
+    sections: dict[tuple[str, str], dict[str, str]] = {}
+    current: dict[str, str] = {}
+    for line in raw.decode(errors="replace").splitlines():
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            name = _parse_config_section(line)
+            if name[0] in ("include", "includeif"):
+                return None
+            current = sections.setdefault(name, {})
+            continue
+        key, _, value = line.partition("=")
+        current[key.strip().lower()] = _strip_config_value(value)
+    return sections
+
+
+def _parse_config_section(line: str) -> tuple[str, str]:
+    """Split a git config section header into (section, subsection).
+
+    Args:
+        line: Header line such as '[branch "main"]' or '[core]'.
+
+    Returns:
+        Lowercased section name and case-preserved subsection.
+    """
+    header = line[1 : line.find("]")]
+    section, _, subsection = header.partition(" ")
+    return section.lower(), subsection.strip().strip('"')
+
+
+def _strip_config_value(value: str) -> str:
+    """Remove surrounding whitespace, quotes and trailing comments from a value.
+
+    Args:
+        value: Raw text after '='.
+
+    Returns:
+        Cleaned value string.
+    """
+    value = value.strip()
+    if value.startswith('"'):
+        return value[1:].partition('"')[0]
+    for marker in (" #", " ;"):
+        value = value.partition(marker)[0]
+    return value.strip()
+
+
+def _upstream_from_files(repo_path: Path) -> bool | None:
+    """Check for a configured upstream by reading .git/HEAD and .git/config.
+
+    Args:
+        repo_path: Path to repository root.
+
+    Returns:
+        Whether the current branch has remote and merge set, or None if the
+        metadata cannot be read directly.
+    """
+    files = read_git_files(repo_path, ("HEAD", "config"))
+    if files is None or "HEAD" not in files:
+        return None
+
+    branch = branch_from_head(files["HEAD"])
+    if branch is None:
+        return False
+
+    config = parse_git_config(files.get("config", b""))
+    if config is None:
+        return None
+    section = config.get(("branch", branch), {})
+    return "remote" in section and "merge" in section
+
+
+def io_worker_count(task_count: int | None, requested: int | None = None) -> int:
+    """Choose a thread count for fan-out over git subprocesses.
+
+    Threads spend nearly all their time blocked on a child process, so the pool
+    can be much larger than the CPU-bound default of min(32, cpu_count + 4).
+    It is never larger than the number of tasks.
+
+    Args:
+        task_count: Number of tasks that will be submitted, or None if unknown
+            (e.g. when tasks are streamed in as they are discovered).
+        requested: Explicit worker count from the caller, used as-is if given.
+
+    Returns:
+        Worker count of at least 1.
+    """
+    if requested is not None:
+        return max(1, requested)
+    limit = min(MAX_IO_WORKERS, (os.cpu_count() or 1) * 8)
+    if task_count is not None:
+        limit = min(limit, task_count)
+    return max(1, limit)
+
+
 def run_git_command(
     repo_path: Path,
     args: list[str],
@@ -30,6 +328,9 @@ def run_git_command(
 ) -> subprocess.CompletedProcess[str]:
     """Run a git command in a repository.
 
+    At most MAX_GIT_PROCESSES commands run at once; extra callers wait
+    for a free slot before forking.
+
     Args:
         repo_path: Path to repository root.
         args: Git command arguments (without 'git' prefix).
@@ -38,20 +339,138 @@ def run_git_command(
     Returns:
         CompletedProcess with stdout/stderr as strings.
 
+    Raises:
+        GitError: If command fails or times out.
+    """
+    return _run_git(repo_path, args, timeout, capture_output=True, text=True)
+
+
+def run_git_command_bytes(
+    repo_path: Path,
+    args: list[str],
+    timeout: int = DEFAULT_TIMEOUT,
+) -> subprocess.CompletedProcess[bytes]:
+    """Run a git command and return its output undecoded.
+
+    For parsers that only look at ASCII markers, so large outputs (e.g. a
+    status listing thousands of paths) skip UTF-8 decoding entirely.
+
+    Args:
+        repo_path: Path to repository root.
+        args: Git command arguments (without 'git' prefix).
+        timeout: Command timeout in seconds.
+
+    Returns:
+        CompletedProcess with stdout/stderr as bytes.
+
+    Raises:
+        GitError: If command fails or times out.
+    """
+    return _run_git(repo_path, args, timeout, capture_output=True)
+
+
+def git_succeeds(repo_path: Path, args: list[str], timeout: int = DEFAULT_TIMEOUT) -> bool:
+    """Run a git command for its exit status only, discarding all output.
+
+    Args:
+        repo_path: Path to repository root.
+        args: Git command arguments (without 'git' prefix).
+        timeout: Command timeout in seconds.
+
+    Returns:
+        True if git exited with status 0.
+
+    Raises:
+        GitError: If command fails or times out.
+    """
+    result = _run_git(
+        repo_path, args, timeout, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return result.returncode == 0
+
+
+def iter_git_output(
+    repo_path: Path,
+    args: list[str],
+    timeout: int = DEFAULT_TIMEOUT,
+) -> Iterator[bytes]:
+    """Run a git command and yield its stdout in chunks as git writes it.
+
+    Memory stays bounded by STREAM_CHUNK_SIZE no matter how much git prints,
+    for callers that only count or scan lines. The process holds one of the
+    MAX_GIT_PROCESSES slots until the iterator is exhausted or closed.
+
+    Args:
+        repo_path: Path to repository root.
+        args: Git command arguments (without 'git' prefix).
+        timeout: Command timeout in seconds.
+
+    Yields:
+        Chunks of stdout; a chunk may end mid-line.
+
+    Raises:
+        GitError: If git cannot start, times out, or exits non-zero.
+    """
+    cmd = ["git", "-C", str(repo_path), *args]
+    # stderr goes to a file rather than a pipe: git may write more than a
+    # pipe buffer there while we are still draining stdout.
+    with _git_process_slots, tempfile.TemporaryFile() as stderr:
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+        except OSError as e:
+            raise GitError(f"Failed to run git: {e}", repo_path) from e
+
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, expire)
+        timer.start()
+        # Popen's context manager closes the stdout pipe and reaps the
+        # process, including when the caller stops iterating early.
+        with proc:
+            stdout = cast(IO[bytes], proc.stdout)
+            try:
+                while chunk := stdout.read(STREAM_CHUNK_SIZE):
+                    yield chunk
+                returncode = proc.wait()
+                stderr.seek(0)
+                message = stderr.read().decode(errors="replace").strip()
+            finally:
+                timer.cancel()
+                if proc.poll() is None:
+                    proc.kill()
+
+    if timed_out.is_set():
+        raise GitError(f"Command timed out after {timeout}s: {' '.join(args)}", repo_path)
+    if returncode != 0:
+        raise GitError(message or f"git exited with status {returncode}", repo_path)
+
+
+def _run_git(
+    repo_path: Path, args: list[str], timeout: int, **kwargs: Any
+) -> subprocess.CompletedProcess[Any]:
+    """Run git under the process cap, mapping launch failures to GitError.
+
+    Args:
+        repo_path: Path to repository root.
+        args: Git command arguments (without 'git' prefix).
+        timeout: Command timeout in seconds.
+        **kwargs: Output handling options passed to subprocess.run.
+
+    Returns:
+        CompletedProcess from subprocess.run.
+
     Raises:
         GitError: If command fails or times out.
     """
     cmd = ["git", "-C", str(repo_path), *args]
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            check=False,
-        )
-        return result
+        with _git_process_slots:
+            return subprocess.run(cmd, timeout=timeout, check=False, **kwargs)
     except subprocess.TimeoutExpired as e:
         raise GitError(f"Command timed out after {timeout}s: {' '.join(args)}", repo_path) from e
     except OSError as e:
@@ -61,6 +480,9 @@ def run_git_command(
 def get_current_branch(repo_path: Path) -> str:
     """Get the current branch name for a repository.
 
+    Reads .git/HEAD in-process when possible and only runs git for
+    layouts where .git is not a plain directory.
+
     Args:
         repo_path: Path to repository root.
 
@@ -70,6 +492,10 @@ def get_current_branch(repo_path: Path) -> str:
     Raises:
         GitError: If git command fails.
     """
+    files = read_git_files(repo_path, ("HEAD",))
+    if files and "HEAD" in files:
+        return branch_from_head(files["HEAD"]) or "HEAD"
+
     result = run_git_command(repo_path, ["rev-parse", "--abbrev-ref", "HEAD"])
 
     if result.returncode != 0:
@@ -89,43 +515,176 @@ def get_repo_status(repo_path: Path) -> tuple[RepoStatus, int, int]:
     Returns:
         Tuple of (RepoStatus, changed_files_count, untracked_files_count).
     """
-    result = run_git_command(repo_path, ["status", "--porcelain"])
+    result = run_git_command_bytes(repo_path, ["status", "--porcelain"])
 
     if result.returncode != 0:
         return RepoStatus.ERROR, 0, 0
 
-    lines = [line for line in result.stdout.strip().split("\n") if line]
-
-    if not lines:
+    output = result.stdout
+    if not output.strip():
         return RepoStatus.CLEAN, 0, 0
 
-    changed = 0
-    untracked = 0
-
-    for line in lines:
-        if line.startswith("??"):
-            untracked += 1
-        else:
-            changed += 1
+    untracked = _count_lines_with_prefix(output, b"??")
+    changed = _count_lines(output) - untracked
 
     if changed > 0:
         return RepoStatus.DIRTY, changed, untracked
     return RepoStatus.UNTRACKED, 0, untracked
 
 
-def has_upstream(repo_path: Path) -> bool:
+def _count_lines(output: bytes) -> int:
+    """Count newline-separated lines, including an unterminated last line.
+
+    Args:
+        output: Non-empty command output.
+
+    Returns:
+        Number of lines.
+    """
+    return output.count(b"\n") + (not output.endswith(b"\n"))
+
+
+def _count_lines_with_prefix(output: bytes, prefix: bytes) -> int:
+    """Count lines starting with prefix in one C-level pass, without splitting.
+
+    Args:
+        output: Command output.
+        prefix: Line prefix such as b"??" or b"? ".
+
+    Returns:
+        Number of matching lines.
+    """
+    return output.startswith(prefix) + output.count(b"\n" + prefix)
+
+
+@dataclass
+class RepoSnapshot:
+    """Branch, working tree, and upstream state from a single git invocation."""
+
+    branch: str = "HEAD"
+    status: RepoStatus = RepoStatus.CLEAN
+    changed: int = 0
+    untracked: int = 0
+    has_upstream: bool = False
+    ahead: int = 0
+    behind: int = 0
+    has_stash: bool = False
+
+
+def get_repo_snapshot(repo_path: Path) -> RepoSnapshot:
+    """Collect branch, status, upstream, ahead/behind and stash state at once.
+
+    Runs `git status --porcelain=v2 --branch --show-stash` so one git process
+    answers what previously took a separate invocation per query.
+
+    Args:
+        repo_path: Path to repository root.
+
+    Returns:
+        RepoSnapshot describing the repository.
+
+    Raises:
+        GitError: If git command fails.
+    """
+    # --no-optional-locks keeps status from rewriting the index, so a
+    # read-only scan does not touch the repo or contend with the user's git.
+    args = ["--no-optional-locks", "status", "--porcelain=v2", "--branch", "--show-stash"]
+
+    # Output is consumed in chunks as git produces it, so a tree with
+    # hundreds of thousands of untracked files never sits in memory at once.
+    # Each block handed on ends at a line boundary.
+    snapshot = RepoSnapshot()
+    pending = b""
+    try:
+        for chunk in iter_git_output(repo_path, args):
+            block = pending + chunk
+            cut = block.rfind(b"\n") + 1
+            pending = block[cut:]
+            _add_status_block(block[:cut], snapshot)
+    except GitError as e:
+        raise GitError(f"Failed to get status: {e}", repo_path) from e
+    _add_status_block(pending, snapshot)
+
+    if snapshot.changed > 0:
+        snapshot.status = RepoStatus.DIRTY
+    elif snapshot.untracked > 0:
+        snapshot.status = RepoStatus.UNTRACKED
+    return snapshot
+
+
+def _add_status_block(block: bytes, snapshot: RepoSnapshot) -> None:
+    """Apply whole lines of porcelain v2 status output to a snapshot.
+
+    Headers come first, then one entry per line (paths containing newlines
+    are quoted). Entries never start with "# ", so a block can be checked for
+    headers wherever it falls. Entries are only counted, never decoded, and
+    bytes.count keeps huge dirty trees off the per-line Python loop.
+
+    Args:
+        block: Output starting at a line boundary.
+        snapshot: Snapshot updated in-place.
+    """
+    start = 0
+    while block.startswith(b"# ", start):
+        end = block.find(b"\n", start)
+        if end < 0:
+            end = len(block)
+        _parse_snapshot_header(block[start + 2 : end].decode(errors="replace"), snapshot)
+        start = end + 1
+
+    body = block[start:]
+    if body:
+        untracked = _count_lines_with_prefix(body, b"? ")
+        ignored = _count_lines_with_prefix(body, b"! ")
+        snapshot.untracked += untracked
+        snapshot.changed += _count_lines(body) - untracked - ignored
+
+
+def _parse_snapshot_header(header: str, snapshot: RepoSnapshot) -> None:
+    """Apply one porcelain v2 header line to a snapshot.
+
+    Args:
+        header: Header line with the leading "# " removed.
+        snapshot: Snapshot updated in-place.
+    """
+    key, _, value = header.partition(" ")
+    if key == "branch.head":
+        snapshot.branch = "HEAD" if value == "(detached)" else value
+    elif key == "branch.ab":
+        ahead, _, behind = value.partition(" ")
+        snapshot.has_upstream = True
+        snapshot.ahead = int(ahead.lstrip("+"))
+        snapshot.behind = int(behind.lstrip("-"))
+    elif key == "stash":
+        snapshot.has_stash = int(value) > 0
+
+
+def has_upstream(repo_path: Path, cache: GitCache | None = None) -> bool:
     """Check if current branch has an upstream configured.
 
+    Reads .git/HEAD and .git/config directly, only running git when the
+    repository layout or config cannot be interpreted in-process.
+
     Args:
         repo_path: Path to repository root.
+        cache: Optional cache consulted before reading anything.
 
     Returns:
         True if upstream is configured.
     """
-    result = run_git_command(
-        repo_path, ["rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{upstream}"]
-    )
-    return result.returncode == 0
+    if cache is not None:
+        cached = cache.lookup_upstream(repo_path)
+        if cached is not None:
+            return cached
+
+    found = _upstream_from_files(repo_path)
+    if found is None:
+        found = git_succeeds(
+            repo_path, ["rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{upstream}"]
+        )
+    if cache is not None:
+        cache.store_upstream(repo_path, found)
+    return found
 
 
 def get_remote_status(repo_path: Path) -> tuple[int, int]:
@@ -184,17 +743,50 @@ def determine_remote_status(ahead: int, behind: int, base_status: RepoStatus) ->
     return base_status
 
 
-def pull_repo(repo_path: Path) -> PullResult:
+def pull_repo(repo_path: Path, cache: GitCache | None = None) -> PullResult:
     """Execute git pull on a repository.
 
     Args:
         repo_path: Path to repository root.
+        cache: Optional cache invalidated for this repo when the pull succeeds.
 
     Returns:
         PullResult with success status, message, and files changed.
     """
     result = run_git_command(repo_path, ["pull", "--ff-only"], timeout=60)
+    return _pull_result(repo_path, result, cache)
+
 
+def fast_forward_repo(repo_path: Path, cache: GitCache | None = None) -> PullResult:
+    """Fast-forward the current branch to its already-fetched upstream.
+
+    The local half of a pull, for callers that have just fetched: it saves
+    the second network round trip git pull would make.
+
+    Args:
+        repo_path: Path to repository root.
+        cache: Optional cache invalidated for this repo when the merge succeeds.
+
+    Returns:
+        PullResult with success status, message, and files changed.
+    """
+    result = run_git_command(repo_path, ["merge", "--ff-only", "@{upstream}"], timeout=60)
+    return _pull_result(repo_path, result, cache)
+
+
+def _pull_result(
+    repo_path: Path, result: subprocess.CompletedProcess[str], cache: GitCache | None
+) -> PullResult:
+    """Build a PullResult from a finished git pull or fast-forward merge.
+
+    Args:
+        repo_path: Path to repository root.
+        result: Completed git command.
+        cache: Optional cache invalidated for this repo on success.
+
+    Returns:
+        PullResult with success status, message, and files changed.
+    """
     if result.returncode != 0:
         return PullResult(
             path=repo_path,
@@ -203,6 +795,9 @@ def pull_repo(repo_path: Path) -> PullResult:
             files_changed=0,
         )
 
+    if cache is not None:
+        cache.invalidate(repo_path)
+
     output = result.stdout.strip()
     files_changed = parse_pull_files_changed(output)
 
@@ -228,34 +823,51 @@ def parse_pull_files_changed(output: str) -> int:
     Returns:
         Number of files changed, or 0 if not found.
     """
-    match = re.search(r"(\d+)\s+file", output)
+    match = _FILES_CHANGED_RE.search(output)
     if match:
         return int(match.group(1))
     return 0
 
 
-def fetch_repo(repo_path: Path) -> bool:
+def fetch_repo(repo_path: Path, cache: GitCache | None = None) -> bool:
     """Fetch updates from remote without merging.
 
     Args:
         repo_path: Path to repository root.
+        cache: Optional cache; a fetch within its TTL is skipped.
 
     Returns:
-        True if fetch succeeded.
+        True if fetch succeeded or was skipped as fresh.
     """
-    result = run_git_command(repo_path, ["fetch"], timeout=60)
-    return result.returncode == 0
+    if cache is not None and cache.fetch_is_fresh(repo_path):
+        return True
+
+    if not git_succeeds(repo_path, ["fetch"], timeout=60):
+        return False
+    if cache is not None:
+        cache.record_fetch(repo_path)
+    return True
 
 
 def has_stash(repo_path: Path) -> bool:
     """Check if repository has stashed changes.
 
+    Looks for refs/stash as a loose ref or in packed-refs, and only runs
+    git stash list when .git is not a plain directory.
+
     Args:
         repo_path: Path to repository root.
 
     Returns:
         True if there are stashed changes.
     """
+    files = read_git_files(repo_path, ("refs/stash", "packed-refs"))
+    if files is not None:
+        if "refs/stash" in files:
+            return True
+        packed = files.get("packed-refs", b"")
+        return any(line.endswith(b" refs/stash") for line in packed.splitlines())
+
     result = run_git_command(repo_path, ["stash", "list"])
     if result.returncode != 0:
         return False
@@ -265,6 +877,9 @@ def has_stash(repo_path: Path) -> bool:
 def get_remote_url(repo_path: Path, remote_name: str = "origin") -> str | None:
     """Get the URL for a remote.
 
+    Reads remote.<name>.url from .git/config in-process when possible, and
+    runs git remote get-url otherwise.
+
     Args:
         repo_path: Path to repository root.
         remote_name: Name of the remote (default: origin).
@@ -272,12 +887,91 @@ def get_remote_url(repo_path: Path, remote_name: str = "origin") -> str | None:
     Returns:
         Remote URL if found, None otherwise.
     """
+    url = _remote_url_from_files(repo_path, remote_name)
+    if url is not None:
+        return url
+
     result = run_git_command(repo_path, ["remote", "get-url", remote_name])
     if result.returncode != 0:
         return None
     return result.stdout.strip()
 
 
+def _remote_url_from_files(repo_path: Path, remote_name: str) -> str | None:
+    """Read a remote's URL from .git/config.
+
+    Args:
+        repo_path: Path to repository root.
+        remote_name: Name of the remote.
+
+    Returns:
+        The configured URL, or None when git must answer instead: the remote
+        is not in the repo config, the config uses includes, or url.*
+        rewrites (insteadOf) could change the result.
+    """
+    if _global_url_rewrites():
+        return None
+    files = read_git_files(repo_path, ("config",))
+    if not files or "config" not in files:
+        return None
+    config = parse_git_config(files["config"])
+    if config is None or any(section == "url" for section, _ in config):
+        return None
+    return config.get(("remote", remote_name), {}).get("url")
+
+
+@functools.cache
+def _global_url_rewrites() -> bool:
+    """Check once whether git config outside any repo defines url.* rewrites.
+
+    Git is asked rather than the files read directly: which files apply
+    depends on GIT_CONFIG_GLOBAL, GIT_CONFIG_SYSTEM, GIT_CONFIG_NOSYSTEM,
+    include directives and the prefix git was installed under (Homebrew,
+    Xcode), and only git resolves all of them. includeIf sections count
+    too, since their conditions depend on the repository.
+
+    Returns:
+        True if any rewrite or conditional include applies, or git could
+        not answer.
+    """
+    try:
+        with _git_process_slots:
+            result = subprocess.run(
+                ["git", "config", "--get-regexp", r"^(url|includeif)\."],
+                cwd=os.path.abspath(os.sep),
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                timeout=DEFAULT_TIMEOUT,
+                check=False,
+            )
+    except (OSError, subprocess.TimeoutExpired):
+        return True
+    # Exit status 1 means no key matched.
+    return result.returncode != 1
+
+
+def remote_host(url: str | None) -> str:
+    """Extract the host name from a git remote URL.
+
+    Handles URL forms (https://host/..., ssh://user@host:22/...) and the
+    scp-like form (user@host:path). Local paths and missing URLs map to "".
+
+    Args:
+        url: Remote URL, or None if the repo has no remote.
+
+    Returns:
+        Lowercased host name, or "" for local or unknown remotes.
+    """
+    if not url:
+        return ""
+    if "://" in url:
+        return (urlsplit(url).hostname or "").lower()
+    host, sep, _ = url.partition(":")
+    if not sep or "/" in host:
+        return ""
+    return host.rpartition("@")[2].lower()
+
+
 def clone_repo(remote: str, target_path: Path, branch: str | None = "main") -> PullResult:
     """Clone a repository from a remote URL.
 
@@ -289,8 +983,6 @@ def clone_repo(remote: str, target_path: Path, branch: str | None = "main") -> P
     Returns:
         PullResult with success status and message.
     """
-    import subprocess
-
     if branch:
         cmd = ["git", "clone", "--branch", branch, remote, str(target_path)]
     else:
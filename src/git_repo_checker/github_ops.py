@@ -1,26 +1,58 @@
 """GitHub operations - CI status checking via gh CLI."""
 
+import functools
 import json
+import os
 import re
 import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+from git_repo_checker import config as config_module
+from git_repo_checker import git_ops
 from git_repo_checker.models import CIStatus
 
 DEFAULT_TIMEOUT = 30
 
+# With a token in the environment, workflow runs are read from the REST API
+# directly instead of starting a gh process per repo.
+GITHUB_API_URL = "https://api.github.com"
+TOKEN_ENV_VARS = ("GH_TOKEN", "GITHUB_TOKEN")
+HTTP_TIMEOUT = 10
 
+# Each CI lookup is a gh subprocess waiting on a GitHub round trip.
+MAX_CI_WORKERS = 16
+
+# Workflow results are reused across runs for this long, per repo slug,
+# unless the caller passes the configured ci.cache_ttl_seconds.
+CI_CACHE_TTL_SECONDS = 60
+CI_CACHE_FILE_NAME = "ci.json"
+NO_CI_CACHE_ENV = "GRC_NO_CI_CACHE"
+
+# git@github.com:owner/repo.git and https://github.com/owner/repo.git
+_SSH_RE = re.compile(r"git@github\.com:([^/]+)/([^/]+?)(?:\.git)?")
+_HTTPS_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+?)(?:\.git)?")
+
+
+@functools.cache
 def is_gh_available() -> bool:
     """Check if the gh CLI is installed and available.
 
+    The result is cached for the life of the process.
+
     Returns:
         True if gh CLI is available.
     """
     try:
         result = subprocess.run(
             ["gh", "--version"],
-            capture_output=True,
-            text=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=5,
             check=False,
         )
@@ -29,8 +61,29 @@ def is_gh_available() -> bool:
         return False
 
 
+def is_ci_available() -> bool:
+    """Check if CI status can be queried, via a GitHub token or the gh CLI.
+
+    Returns:
+        True if a token is set or gh is available.
+    """
+    return _github_token() is not None or is_gh_available()
+
+
+def _github_token() -> str | None:
+    """Return the first GitHub token set in the environment, if any."""
+    for name in TOKEN_ENV_VARS:
+        token = os.environ.get(name)
+        if token:
+            return token
+    return None
+
+
 def get_github_remote(repo_path: Path) -> str | None:
-    """Extract GitHub owner/repo from git remote URL.
+    """Extract GitHub owner/repo from the origin remote URL.
+
+    The URL is read from .git/config when possible, so most repos need no
+    git subprocess.
 
     Args:
         repo_path: Path to repository root.
@@ -39,21 +92,10 @@ def get_github_remote(repo_path: Path) -> str | None:
         String like "owner/repo" or None if not a GitHub repo.
     """
     try:
-        result = subprocess.run(
-            ["git", "-C", str(repo_path), "remote", "get-url", "origin"],
-            capture_output=True,
-            text=True,
-            timeout=DEFAULT_TIMEOUT,
-            check=False,
-        )
-
-        if result.returncode != 0:
-            return None
-
-        url = result.stdout.strip()
-        return parse_github_url(url)
-    except (OSError, subprocess.TimeoutExpired):
+        url = git_ops.get_remote_url(repo_path)
+    except git_ops.GitError:
         return None
+    return parse_github_url(url) if url else None
 
 
 def parse_github_url(url: str) -> str | None:
@@ -69,43 +111,257 @@ def parse_github_url(url: str) -> str | None:
     Returns:
         String like "owner/repo" or None if not GitHub.
     """
-    # SSH format: git@github.com:owner/repo.git
-    ssh_match = re.match(r"git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$", url)
-    if ssh_match:
-        return f"{ssh_match.group(1)}/{ssh_match.group(2)}"
-
-    # HTTPS format: https://github.com/owner/repo.git
-    https_match = re.match(r"https://github\.com/([^/]+)/([^/]+?)(?:\.git)?$", url)
-    if https_match:
-        return f"{https_match.group(1)}/{https_match.group(2)}"
+    match = _SSH_RE.fullmatch(url) or _HTTPS_RE.fullmatch(url)
+    if match:
+        return f"{match.group(1)}/{match.group(2)}"
 
     return None
 
 
-def get_ci_status(repo_path: Path) -> CIStatus:
+def get_ci_status(repo_path: Path, cache_ttl_seconds: float = CI_CACHE_TTL_SECONDS) -> CIStatus:
     """Get GitHub Actions CI status for a repository.
 
-    Uses the gh CLI to query workflow run status.
+    Uses the GitHub REST API when GH_TOKEN or GITHUB_TOKEN is set, and the
+    gh CLI otherwise.
 
     Args:
         repo_path: Path to repository root.
+        cache_ttl_seconds: How long cached results stay valid; 0 disables the cache.
 
     Returns:
         CIStatus indicating the CI state.
     """
-    if not is_gh_available():
+    if not is_ci_available():
         return CIStatus.UNKNOWN
 
+    cache = open_ci_cache(cache_ttl_seconds)
+    status = _query_repo_ci_status(repo_path, cache)
+    if cache is not None:
+        cache.save()
+    return status
+
+
+class CICache:
+    """CI statuses from ci.json, read once and written back once.
+
+    Lookups and stores only touch the in-memory entries, so concurrent CI
+    workers never wait on file I/O. The file is loaded on first use and
+    save writes it only if something was stored.
+    """
+
+    def __init__(self, ttl_seconds: float = CI_CACHE_TTL_SECONDS, path: Path | None = None):
+        """Initialize cache.
+
+        Args:
+            ttl_seconds: How long an entry stays valid.
+            path: Cache file. Defaults to ci.json in the config cache dir.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.path = path if path is not None else _ci_cache_path()
+        self._entries: dict[str, list] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _live_entries(self) -> dict[str, list]:
+        """Return the unexpired entries, loading the file on first call.
+
+        Callers hold self._lock.
+
+        Returns:
+            Dict of slug to [timestamp, status value].
+        """
+        if self._entries is None:
+            now = time.time()
+            self._entries = {
+                slug: entry
+                for slug, entry in _load_ci_cache(self.path).items()
+                if isinstance(entry, list)
+                and len(entry) == 2
+                and isinstance(entry[0], int | float)
+                and now - entry[0] < self.ttl_seconds
+            }
+        return self._entries
+
+    def lookup(self, repo_slug: str) -> CIStatus | None:
+        """Return the cached status for a slug if it is younger than the TTL.
+
+        Args:
+            repo_slug: Repository in "owner/repo" format.
+
+        Returns:
+            Cached CIStatus, or None on a miss or expired entry.
+        """
+        with self._lock:
+            entry = self._live_entries().get(repo_slug)
+        if entry is None or time.time() - entry[0] >= self.ttl_seconds:
+            return None
+        try:
+            return CIStatus(entry[1])
+        except ValueError:
+            return None
+
+    def store(self, repo_slug: str, status: CIStatus) -> None:
+        """Remember a status until the next save.
+
+        Args:
+            repo_slug: Repository in "owner/repo" format.
+            status: Status to cache.
+        """
+        with self._lock:
+            self._live_entries()[repo_slug] = [time.time(), status.value]
+            self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the entries if any were stored; failures are ignored."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            data = json.dumps(self._entries)
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+            os.replace(tmp_name, self.path)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+
+
+def open_ci_cache(ttl_seconds: float = CI_CACHE_TTL_SECONDS) -> CICache | None:
+    """Create a CI cache unless caching is turned off.
+
+    Args:
+        ttl_seconds: How long cached results stay valid.
+
+    Returns:
+        CICache, or None if ttl_seconds is 0 or GRC_NO_CI_CACHE is set.
+    """
+    if ttl_seconds <= 0 or not _ci_cache_enabled():
+        return None
+    return CICache(ttl_seconds)
+
+
+class CIStatusPrefetcher:
+    """Start CI lookups for repos as they are found, before a scan finishes.
+
+    Overlaps the GitHub round trips with the filesystem walk and git status
+    work. Callers check is_ci_available first. Use as a context manager so
+    the worker threads are shut down and the CI cache is saved.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = MAX_CI_WORKERS,
+        cache_ttl_seconds: float = CI_CACHE_TTL_SECONDS,
+    ):
+        """Initialize prefetcher.
+
+        Args:
+            max_workers: Maximum number of concurrent CI queries.
+            cache_ttl_seconds: How long cached results stay valid; 0 disables the cache.
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        self._futures: dict[Path, Future[CIStatus]] = {}
+        self._cache = open_ci_cache(cache_ttl_seconds)
+
+    def __enter__(self) -> "CIStatusPrefetcher":
+        """Return self for use in a with block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the worker threads, dropping lookups that have not started, and save the cache."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._cache is not None:
+            self._cache.save()
+
+    def submit(self, repo_path: Path) -> None:
+        """Queue a CI lookup for a repository; repeats are ignored.
+
+        Args:
+            repo_path: Path to repository root.
+        """
+        if repo_path not in self._futures:
+            self._futures[repo_path] = self._executor.submit(
+                _query_repo_ci_status, repo_path, self._cache
+            )
+
+    def results(self) -> dict[Path, CIStatus]:
+        """Wait for all submitted lookups.
+
+        Returns:
+            Dict mapping each submitted path to its CIStatus.
+        """
+        return {path: future.result() for path, future in self._futures.items()}
+
+
+def get_ci_statuses(
+    repo_paths: list[Path],
+    max_workers: int = MAX_CI_WORKERS,
+    cache_ttl_seconds: float = CI_CACHE_TTL_SECONDS,
+) -> dict[Path, CIStatus]:
+    """Get GitHub Actions CI status for many repositories concurrently.
+
+    Args:
+        repo_paths: Paths to repository roots.
+        max_workers: Maximum number of concurrent gh queries.
+        cache_ttl_seconds: How long cached results stay valid; 0 disables the cache.
+
+    Returns:
+        Dict mapping each path to its CIStatus.
+    """
+    if not repo_paths:
+        return {}
+    if not is_ci_available():
+        return dict.fromkeys(repo_paths, CIStatus.UNKNOWN)
+
+    with CIStatusPrefetcher(min(max_workers, len(repo_paths)), cache_ttl_seconds) as prefetcher:
+        for path in repo_paths:
+            prefetcher.submit(path)
+        return prefetcher.results()
+
+
+def _query_repo_ci_status(repo_path: Path, cache: CICache | None = None) -> CIStatus:
+    """Look up CI status for a repository, assuming a query method is available."""
     repo_slug = get_github_remote(repo_path)
     if not repo_slug:
         return CIStatus.UNKNOWN
 
-    return query_workflow_status(repo_slug)
+    return query_workflow_status(repo_slug, cache)
 
 
-def query_workflow_status(repo_slug: str) -> CIStatus:
+def query_workflow_status(repo_slug: str, cache: CICache | None = None) -> CIStatus:
     """Query GitHub for the latest workflow run status.
 
+    Args:
+        repo_slug: Repository in "owner/repo" format.
+        cache: Optional cache consulted first and updated with known results.
+
+    Returns:
+        CIStatus based on the latest workflow run.
+    """
+    if cache is not None:
+        cached = cache.lookup(repo_slug)
+        if cached is not None:
+            return cached
+
+    token = _github_token()
+    if token:
+        status = _query_workflow_api(repo_slug, token)
+    else:
+        status = _query_workflow_gh(repo_slug)
+
+    if cache is not None and status != CIStatus.UNKNOWN:
+        cache.store(repo_slug, status)
+    return status
+
+
+def _query_workflow_gh(repo_slug: str) -> CIStatus:
+    """Query the latest workflow run with gh run list.
+
     Args:
         repo_slug: Repository in "owner/repo" format.
 
@@ -125,8 +381,8 @@ def query_workflow_status(repo_slug: str) -> CIStatus:
                 "--json",
                 "status,conclusion",
             ],
+            stdin=subprocess.DEVNULL,
             capture_output=True,
-            text=True,
             timeout=DEFAULT_TIMEOUT,
             check=False,
         )
@@ -139,20 +395,80 @@ def query_workflow_status(repo_slug: str) -> CIStatus:
         return CIStatus.UNKNOWN
 
 
-def parse_workflow_response(response: str) -> CIStatus:
+def _query_workflow_api(repo_slug: str, token: str) -> CIStatus:
+    """Query the latest workflow run from the GitHub REST API.
+
+    Args:
+        repo_slug: Repository in "owner/repo" format.
+        token: GitHub token sent as a bearer token.
+
+    Returns:
+        CIStatus based on the latest workflow run.
+    """
+    request = urllib.request.Request(
+        f"{GITHUB_API_URL}/repos/{repo_slug}/actions/runs?per_page=1",
+        headers={
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {token}",
+        },
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
+            data = json.load(response)
+    except (OSError, ValueError):
+        return CIStatus.UNKNOWN
+
+    runs = data.get("workflow_runs") if isinstance(data, dict) else None
+    if not isinstance(runs, list):
+        return CIStatus.UNKNOWN
+    return _status_from_runs(runs)
+
+
+def _ci_cache_enabled() -> bool:
+    """Return False if GRC_NO_CI_CACHE is set to a non-empty, non-zero value."""
+    return os.environ.get(NO_CI_CACHE_ENV, "") in ("", "0")
+
+
+def _ci_cache_path() -> Path:
+    """Return the CI status cache file in the shared cache directory."""
+    return config_module.CONFIG_CACHE_DIR / CI_CACHE_FILE_NAME
+
+
+def _load_ci_cache(path: Path) -> dict:
+    """Load {slug: [timestamp, status]} entries, empty if missing or unreadable."""
+    try:
+        entries = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def parse_workflow_response(response: str | bytes) -> CIStatus:
     """Parse the gh run list JSON response.
 
     Args:
-        response: JSON string from gh run list.
+        response: JSON output from gh run list, as text or raw bytes.
 
     Returns:
         CIStatus based on the response.
     """
     try:
         runs = json.loads(response)
-    except json.JSONDecodeError:
+    except ValueError:
         return CIStatus.UNKNOWN
 
+    return _status_from_runs(runs)
+
+
+def _status_from_runs(runs: list[dict]) -> CIStatus:
+    """Map the newest workflow run to a CIStatus.
+
+    Args:
+        runs: Workflow runs, newest first, with status and conclusion keys.
+
+    Returns:
+        CIStatus for the first run, or NO_WORKFLOWS if there are none.
+    """
     if not runs:
         return CIStatus.NO_WORKFLOWS
 
@@ -0,0 +1,210 @@
+"""Persisted scan results, reused while a repo's git metadata is unchanged."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from git_repo_checker import __version__
+from git_repo_checker import config as config_module
+from git_repo_checker.models import Config, RepoInfo
+
+# Paths under .git that git rewrites on commit, checkout, add, reset and
+# branch updates. FETCH_HEAD is left out so fetches made by watch mode's own
+# analysis do not retrigger it on the next poll.
+WATCHED_GIT_PATHS = ("HEAD", "index", "logs/HEAD", "packed-refs", "refs/heads")
+
+# The manifest also keys on remote-tracking refs, since a fetch that moves
+# them changes ahead/behind. FETCH_HEAD is not used: analysis itself fetches
+# and git rewrites FETCH_HEAD on every fetch, even when nothing changed.
+REMOTE_REFS_DIR = os.path.join("refs", "remotes")
+
+MANIFEST_FILE_NAME = "scan.json"
+
+RepoState = tuple[int, ...]
+
+
+def repo_state(repo_path: Path, names: tuple[str, ...] = WATCHED_GIT_PATHS) -> RepoState:
+    """Fingerprint a repository by the mtimes of its git metadata.
+
+    Args:
+        repo_path: Path to repository root.
+        names: Paths under .git to stat.
+
+    Returns:
+        Tuple of mtime_ns values, 0 for paths that do not exist.
+    """
+    git_dir = os.path.join(repo_path, ".git")
+    state: list[int] = []
+    for name in names:
+        try:
+            state.append(os.stat(os.path.join(git_dir, name)).st_mtime_ns)
+        except OSError:
+            state.append(0)
+    return tuple(state)
+
+
+def remote_refs_state(repo_path: Path) -> RepoState:
+    """Fingerprint remote-tracking refs by the mtimes of their directories.
+
+    Git moves a ref by renaming a lock file over it, which updates the
+    mtime of the directory holding it; a fetch that changes nothing leaves
+    every directory untouched.
+
+    Args:
+        repo_path: Path to repository root.
+
+    Returns:
+        Tuple of mtime_ns values, one per directory under refs/remotes in
+        path order; empty if there are none.
+    """
+    root = os.path.join(repo_path, ".git", REMOTE_REFS_DIR)
+    mtimes: list[tuple[str, int]] = []
+    for dir_path, _dir_names, _file_names in os.walk(root):
+        try:
+            mtimes.append((dir_path, os.stat(dir_path).st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(mtime for _, mtime in sorted(mtimes))
+
+
+def config_fingerprint(config: Config | None) -> str:
+    """Hash the settings that shape a RepoInfo, so changing them drops the manifest.
+
+    Args:
+        config: Application configuration, or None for no config.
+
+    Returns:
+        Hex digest of the relevant settings; empty for None.
+    """
+    if config is None:
+        return ""
+    relevant = {"main_branches": sorted(config.main_branches_lower)}
+    return hashlib.sha256(json.dumps(relevant).encode()).hexdigest()
+
+
+class ScanManifest:
+    """Last scan's RepoInfo per repo, keyed on git metadata mtimes.
+
+    Working-tree edits that have not been staged do not touch .git, so a
+    reused entry can miss them; the manifest is only used when asked for.
+    Only repos seen in the current scan are written back, and a manifest
+    saved under different settings (see config_fingerprint) is discarded.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        entries: dict[str, tuple[RepoState, dict]] | None = None,
+        config_key: str = "",
+    ):
+        """Initialize manifest.
+
+        Args:
+            path: JSON file the manifest is saved to.
+            entries: Previous entries as {repo path: (state, RepoInfo dump)}.
+            config_key: config_fingerprint of the settings for this scan.
+        """
+        self.path = path
+        self.config_key = config_key
+        self.previous = entries or {}
+        self.current: dict[str, tuple[RepoState, dict]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path | None = None, config: Config | None = None) -> "ScanManifest":
+        """Load the manifest, starting empty if it is missing, unreadable or stale.
+
+        Args:
+            path: Manifest file. Defaults to scan.json in the config cache dir.
+            config: Configuration for this scan; entries saved under other
+                settings are dropped.
+
+        Returns:
+            ScanManifest holding the previous scan's entries.
+        """
+        if path is None:
+            path = config_module.CONFIG_CACHE_DIR / MANIFEST_FILE_NAME
+        config_key = config_fingerprint(config)
+        try:
+            data = json.loads(path.read_bytes())
+            if data["version"] != __version__ or data.get("config", "") != config_key:
+                return cls(path, config_key=config_key)
+            entries = {
+                repo: (tuple(entry["state"]), entry["info"])
+                for repo, entry in data["repos"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return cls(path, config_key=config_key)
+        return cls(path, entries, config_key)
+
+    def state(self, repo_path: Path) -> RepoState:
+        """Fingerprint a repository the way manifest entries are keyed.
+
+        Args:
+            repo_path: Path to repository root.
+
+        Returns:
+            Current metadata state.
+        """
+        return repo_state(repo_path) + remote_refs_state(repo_path)
+
+    def lookup(self, repo_path: Path, state: RepoState) -> RepoInfo | None:
+        """Return the previous result if the repo's state is unchanged.
+
+        Args:
+            repo_path: Path to repository root.
+            state: Current state from ScanManifest.state.
+
+        Returns:
+            Reused RepoInfo, or None on a miss.
+        """
+        key = str(repo_path)
+        entry = self.previous.get(key)
+        if entry is None or entry[0] != state:
+            return None
+        try:
+            info = RepoInfo.model_validate(entry[1])
+        except ValidationError:
+            return None
+        with self._lock:
+            self.current[key] = entry
+        return info
+
+    def record(self, repo_path: Path, state: RepoState, info: RepoInfo) -> None:
+        """Store a fresh result under the state read before analyzing it.
+
+        Args:
+            repo_path: Path to repository root.
+            state: State captured before analysis started.
+            info: Analysis result.
+        """
+        entry = (state, info.model_dump(mode="json"))
+        with self._lock:
+            self.current[str(repo_path)] = entry
+
+    def save(self) -> None:
+        """Atomically write the entries seen in this scan; failures are ignored."""
+        data = {
+            "version": __version__,
+            "config": self.config_key,
+            "repos": {
+                repo: {"state": list(state), "info": info}
+                for repo, (state, info) in self.current.items()
+            },
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_name, self.path)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
@@ -3,7 +3,7 @@
 from enum import Enum
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class RepoStatus(str, Enum):
@@ -83,6 +83,7 @@ class AutoPullConfig(BaseModel):
     enabled: bool = True
     require_clean: bool = True
     skip_patterns: list[str] = Field(default_factory=list)
+    fetch_ttl_seconds: int = 0
 
 
 class AutoTrackConfig(BaseModel):
@@ -93,6 +94,12 @@ class AutoTrackConfig(BaseModel):
     path_prefix: str = "~"
 
 
+class CIConfig(BaseModel):
+    """Configuration for CI status checks."""
+
+    cache_ttl_seconds: int = 60
+
+
 class OutputConfig(BaseModel):
     """Configuration for output formatting."""
 
@@ -110,10 +117,26 @@ class Config(BaseModel):
     main_branches: list[str] = Field(default_factory=lambda: ["main", "master"])
     auto_pull: AutoPullConfig = Field(default_factory=AutoPullConfig)
     auto_track: AutoTrackConfig = Field(default_factory=AutoTrackConfig)
+    ci: CIConfig = Field(default_factory=CIConfig)
     output: OutputConfig = Field(default_factory=OutputConfig)
 
     model_config = {"arbitrary_types_allowed": True}
 
+    _main_branches_lower: tuple[tuple[str, ...], frozenset[str]] | None = PrivateAttr(None)
+
+    @property
+    def main_branches_lower(self) -> frozenset[str]:
+        """Lowercased main branch names for O(1) case-insensitive lookup.
+
+        Rebuilt whenever main_branches is reassigned or edited in place.
+        """
+        names = tuple(self.main_branches)
+        cached = self._main_branches_lower
+        if cached is None or cached[0] != names:
+            cached = (names, frozenset(b.lower() for b in names))
+            self._main_branches_lower = cached
+        return cached[1]
+
 
 class TrackedRepo(BaseModel):
     """A repository to track and sync across machines."""
@@ -1,8 +1,14 @@
 """Rich console output formatting."""
 
+import os
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 
@@ -16,6 +22,11 @@ from git_repo_checker.models import (
     WarningType,
 )
 
+_HOME_PREFIX = str(Path.home()).rstrip(os.sep) + os.sep
+
+# Lines the live table uses besides its rows: title, borders, header, caption.
+LIVE_TABLE_CHROME = 6
+
 STATUS_STYLES = {
     RepoStatus.CLEAN: ("green", "clean"),
     RepoStatus.DIRTY: ("red", "dirty"),
@@ -35,6 +46,12 @@ CI_STATUS_STYLES = {
     CIStatus.UNKNOWN: ("dim", "?"),
 }
 
+# Rich markup per status, built once rather than formatted for every row.
+_STATUS_MARKUP = {status: f"[{style}]{text}[/]" for status, (style, text) in STATUS_STYLES.items()}
+_CI_STATUS_MARKUP = {
+    status: f"[{style}]{text}[/]" for status, (style, text) in CI_STATUS_STYLES.items()
+}
+
 WARNING_MESSAGES = {
     WarningType.DIRTY_MAIN: "Uncommitted changes on main branch",
     WarningType.NO_REMOTE: "No upstream remote configured",
@@ -82,6 +99,46 @@ class Reporter:
         if result.pull_results:
             self.display_pull_results(result.pull_results)
 
+    @contextmanager
+    def live_results(self) -> Iterator[Callable[[RepoInfo], None]]:
+        """Show repos in a live table as they arrive.
+
+        Yields a callback to pass as scan_and_analyze's on_repo. The live
+        table is transient and shows only the latest repos that fit on screen
+        under a running count; callers still render the final result with
+        display_results once the scan is complete. On non-terminal consoles
+        or in quiet mode the callback does nothing.
+
+        Yields:
+            Callback that adds one repo to the live table.
+        """
+        if self.config.verbosity == "quiet" or not self.console.is_terminal:
+            yield lambda repo: None
+            return
+
+        # Adding a repo only appends to a bounded deque; Live redraws the
+        # table on its own refresh timer, so large scans stay linear.
+        recent: deque[RepoInfo] = deque(maxlen=max(self.console.height - LIVE_TABLE_CHROME, 1))
+        checked = 0
+        lock = threading.Lock()
+
+        def render() -> Table:
+            with lock:
+                rows, count = list(recent), checked
+            table = self.build_repo_table(rows)
+            table.caption = f"{count} repos checked"
+            return table
+
+        def add(repo: RepoInfo) -> None:
+            nonlocal checked
+            with lock:
+                checked += 1
+                if self.config.show_clean or repo.status != RepoStatus.CLEAN:
+                    recent.append(repo)
+
+        with Live(console=self.console, transient=True, get_renderable=render):
+            yield add
+
     def filter_repos(self, repos: list[RepoInfo]) -> list[RepoInfo]:
         """Filter repos based on output config.
 
@@ -102,6 +159,18 @@ class Reporter:
             repos: List of repository info to display.
             show_ci: Whether to display CI status column.
         """
+        self.console.print(self.build_repo_table(repos, show_ci=show_ci))
+
+    def build_repo_table(self, repos: list[RepoInfo], show_ci: bool = False) -> Table:
+        """Build the repository table without printing it.
+
+        Args:
+            repos: List of repository info to display.
+            show_ci: Whether to include CI status column.
+
+        Returns:
+            Rich table with one row per repo.
+        """
         table = Table(title="Repositories", expand=True)
         table.add_column("Path", style="blue", no_wrap=True)
         table.add_column("Branch", style="cyan")
@@ -112,9 +181,7 @@ class Reporter:
             table.add_column("CI", justify="center")
 
         for repo in repos:
-            status_style, status_text = STATUS_STYLES.get(
-                repo.status, ("white", str(repo.status.value))
-            )
+            status_markup = _STATUS_MARKUP.get(repo.status) or f"[white]{repo.status.value}[/]"
             changes = self.format_changes(repo)
             ahead_behind = self.format_ahead_behind(repo)
             path_str = self.shorten_path(repo.path)
@@ -122,7 +189,7 @@ class Reporter:
             row = [
                 path_str,
                 repo.branch,
-                f"[{status_style}]{status_text}[/]",
+                status_markup,
                 changes,
                 ahead_behind,
             ]
@@ -133,7 +200,7 @@ class Reporter:
 
             table.add_row(*row)
 
-        self.console.print(table)
+        return table
 
     def format_ci_status(self, ci_status: CIStatus | None) -> str:
         """Format CI status for display.
@@ -147,8 +214,7 @@ class Reporter:
         if ci_status is None:
             return "-"
 
-        style, text = CI_STATUS_STYLES.get(ci_status, ("dim", "?"))
-        return f"[{style}]{text}[/]"
+        return _CI_STATUS_MARKUP.get(ci_status, "[dim]?[/]")
 
     def display_warnings(self, repos: list[RepoInfo]) -> None:
         """Display warning panel for repos with issues.
@@ -200,9 +266,14 @@ class Reporter:
             result: Scan result for summary.
         """
         total = result.total_scanned
-        clean = sum(1 for r in result.repos if r.status == RepoStatus.CLEAN)
-        dirty = sum(1 for r in result.repos if r.status == RepoStatus.DIRTY)
-        warnings = sum(1 for r in result.repos if r.warnings)
+        clean = dirty = warnings = 0
+        for repo in result.repos:
+            if repo.status == RepoStatus.CLEAN:
+                clean += 1
+            elif repo.status == RepoStatus.DIRTY:
+                dirty += 1
+            if repo.warnings:
+                warnings += 1
 
         self.console.print(f"\nScanned [bold]{total}[/] repositories")
         self.console.print(f"  [green]{clean}[/] clean, [red]{dirty}[/] dirty, ", end="")
@@ -214,17 +285,21 @@ class Reporter:
         Args:
             result: Scan result for summary.
         """
-        dirty = [r for r in result.repos if r.status == RepoStatus.DIRTY]
-        warnings = [r for r in result.repos if r.warnings]
+        dirty: list[RepoInfo] = []
+        warned: list[RepoInfo] = []
+        for repo in result.repos:
+            if repo.status == RepoStatus.DIRTY:
+                dirty.append(repo)
+            elif repo.warnings:
+                warned.append(repo)
 
         for repo in dirty:
             path_str = self.shorten_path(repo.path)
             self.console.print(f"[red]dirty[/] {path_str} ({repo.branch})")
 
-        for repo in warnings:
-            if repo not in dirty:
-                path_str = self.shorten_path(repo.path)
-                self.console.print(f"[yellow]warn[/] {path_str} ({repo.branch})")
+        for repo in warned:
+            path_str = self.shorten_path(repo.path)
+            self.console.print(f"[yellow]warn[/] {path_str} ({repo.branch})")
 
     def format_changes(self, repo: RepoInfo) -> str:
         """Format change counts for display.
@@ -270,7 +345,7 @@ class Reporter:
         Returns:
             Shortened path string.
         """
-        try:
-            return "~/" + str(path.relative_to(Path.home()))
-        except ValueError:
-            return str(path)
+        path_str = str(path)
+        if path_str.startswith(_HOME_PREFIX):
+            return "~/" + path_str[len(_HOME_PREFIX) :]
+        return path_str
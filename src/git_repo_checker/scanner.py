@@ -1,12 +1,19 @@
 """Filesystem scanning for git repositories."""
 
 import fnmatch
+import functools
+import os
+import re
 from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
 MAX_DEPTH = 20  # Prevent infinite loops from symlinks
 
+_GLOB_CHARS = re.compile(r"[*?[]")
+
+_HOME_PREFIX = str(Path.home()).rstrip(os.sep) + os.sep
+
 
 @dataclass
 class ScanWalkResult:
@@ -18,99 +25,219 @@ class ScanWalkResult:
 
 @dataclass
 class _WalkContext:
-    """Bundled parameters for recursive walk, avoiding long argument lists."""
+    """Bundled parameters for the walk, avoiding long argument lists."""
 
     exclude_patterns: list[str]
     exclude_paths: set[Path]
     visited: set[int]
+    exclude_names: frozenset[str] = field(init=False)
+    patterns: "_CompiledPatterns | None" = field(init=False)
+    exclude_strs: set[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Compile the exclusion rules once for the whole walk."""
+        self.exclude_names, globs = _split_patterns(self.exclude_patterns)
+        self.patterns = _compile_patterns(globs) if globs else None
+        self.exclude_strs = {str(p) for p in self.exclude_paths}
+
+    def excludes_child(self, entry: os.DirEntry[str]) -> bool:
+        """Check a subdirectory whose ancestors have already been checked.
+
+        Only the entry's own name can newly match a per-component pattern,
+        so the component loop of matches_any_pattern is skipped.
+
+        Args:
+            entry: Subdirectory entry.
+
+        Returns:
+            True if the subdirectory should be excluded.
+        """
+        if entry.name in self.exclude_names or entry.path in self.exclude_strs:
+            return True
+        if self.patterns is None:
+            return False
+        return bool(self.patterns.part.match(entry.name) or self.patterns.full.match(entry.path))
 
 
-def _walk(root: Path, ctx: _WalkContext, depth: int, result: ScanWalkResult) -> None:
-    """Recursively walk a directory and collect repos and errors.
+def _scan_error(root: Path, exc: OSError) -> str:
+    """Format a traversal error for display.
+
+    Args:
+        root: Directory that could not be read.
+        exc: The error raised while reading it.
+
+    Returns:
+        Human-readable error message.
+    """
+    if isinstance(exc, PermissionError):
+        return f"Permission denied: {root}"
+    return f"Cannot scan {root}: {exc}"
+
+
+def _walk(root: Path, ctx: _WalkContext, depth: int, errors: list[str]) -> Iterator[Path]:
+    """Walk a directory tree with an explicit stack, yielding repos as found.
+
+    Each directory is listed with a single os.scandir call, which both finds
+    its .git directory and decides which children to descend into.
 
     Args:
         root: Directory to walk.
         ctx: Walk context with exclusion rules and visited inodes.
-        depth: Current recursion depth.
-        result: Accumulates found repos and errors in-place.
+        depth: Depth of root.
+        errors: Accumulates scan errors in-place.
+
+    Yields:
+        Path to each repository root found.
     """
     if depth > MAX_DEPTH:
         return
 
     try:
-        stat_info = root.stat()
-    except (PermissionError, OSError) as exc:
-        msg = (
-            f"Permission denied: {root}"
-            if isinstance(exc, PermissionError)
-            else f"Cannot scan {root}: {exc}"
-        )
-        result.errors.append(msg)
-        return
-
-    if stat_info.st_ino in ctx.visited:
+        root_ino = os.stat(root).st_ino
+    except OSError as exc:
+        errors.append(_scan_error(root, exc))
         return
-    ctx.visited.add(stat_info.st_ino)
 
     if should_exclude(root, ctx.exclude_patterns, ctx.exclude_paths):
         return
 
-    git_dir = root / ".git"
-    if git_dir.exists() and git_dir.is_dir():
-        result.repos.append(root)
-        return
+    stack: list[tuple[str, int, int]] = [(str(root), depth, root_ino)]
+    while stack:
+        dir_path, dir_depth, ino = stack.pop()
+        if ino in ctx.visited:
+            continue
+        ctx.visited.add(ino)
+
+        path = Path(dir_path)
+        has_git, children = _scan_dir(path, errors)
+        if has_git:
+            yield path
+            continue
+
+        if dir_depth >= MAX_DEPTH:
+            continue
 
+        stack.extend(_stack_entries(children, dir_depth + 1, ctx, errors))
+
+
+def _scan_dir(path: Path, errors: list[str]) -> tuple[bool, list[os.DirEntry[str]]]:
+    """List a directory once, noting whether it is a repository root.
+
+    Listing stops as soon as a .git directory is seen, since a repository's
+    children are never descended into.
+
+    Args:
+        path: Directory to list.
+        errors: Accumulates scan errors in-place.
+
+    Returns:
+        Tuple of (has .git directory, non-hidden subdirectory entries).
+    """
+    children = []
     try:
-        entries = list(root.iterdir())
-    except (PermissionError, OSError) as exc:
-        msg = (
-            f"Permission denied: {root}"
-            if isinstance(exc, PermissionError)
-            else f"Cannot scan {root}: {exc}"
-        )
-        result.errors.append(msg)
-        return
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    if entry.name == ".git" and entry.is_dir():
+                        return True, []
+                    continue
+                if entry.is_dir():
+                    children.append(entry)
+    except OSError as exc:
+        errors.append(_scan_error(path, exc))
+        return False, []
+    return False, children
+
+
+def _stack_entries(
+    children: list[os.DirEntry[str]], depth: int, ctx: _WalkContext, errors: list[str]
+) -> list[tuple[str, int, int]]:
+    """Turn subdirectory entries into walk stack entries, dropping excluded ones.
+
+    Only symlinks are stat'ed: a plain directory's inode comes from the
+    listing itself, and only a symlink can lead back to a visited directory.
+
+    Args:
+        children: Subdirectory entries from _scan_dir.
+        depth: Depth of the children.
+        ctx: Walk context with exclusion rules.
+        errors: Accumulates scan errors in-place.
 
-    for entry in entries:
-        if not entry.is_dir():
+    Returns:
+        (path, depth, inode) tuples in reverse name order, so that popping
+        them off the stack visits children in name order.
+    """
+    children.sort(key=lambda e: e.name, reverse=True)
+    entries = []
+    for entry in children:
+        if ctx.excludes_child(entry):
             continue
-        if entry.name.startswith("."):
+        try:
+            ino = entry.stat().st_ino if entry.is_symlink() else entry.inode()
+        except OSError as exc:
+            errors.append(_scan_error(Path(entry.path), exc))
             continue
-        _walk(entry, ctx, depth + 1, result)
+        entries.append((entry.path, depth, ino))
+    return entries
 
 
-def walk_git_repos(
+def iter_git_repos(
     scan_paths: list[Path],
     exclude_patterns: list[str],
     exclude_paths: list[Path],
-) -> ScanWalkResult:
-    """Find all git repositories in given paths, collecting errors.
+    errors: list[str] | None = None,
+) -> Iterator[Path]:
+    """Lazily find git repositories, yielding each one as soon as it is found.
 
-    Walks directory trees looking for .git directories.
-    Records PermissionError and OSError encountered during traversal.
+    Lets callers start work on early repos while the rest of the tree is
+    still being walked. Scan paths and directory entries are visited in
+    sorted order, so repos come out sorted by path.
 
     Args:
         scan_paths: Root directories to scan.
         exclude_patterns: Glob patterns to exclude (e.g., "**/node_modules").
         exclude_paths: Specific absolute paths to exclude.
+        errors: Optional list that collects PermissionError/OSError messages.
 
-    Returns:
-        ScanWalkResult with discovered repos and any scan errors.
+    Yields:
+        Path to each repository root (parent of .git).
     """
-    result = ScanWalkResult()
+    if errors is None:
+        errors = []
     ctx = _WalkContext(
         exclude_patterns=exclude_patterns,
         exclude_paths=set(exclude_paths),
         visited=set(),
     )
 
-    for scan_path in scan_paths:
+    for scan_path in sorted(scan_paths):
         if not scan_path.exists():
             continue
         if not scan_path.is_dir():
             continue
-        _walk(scan_path, ctx, depth=0, result=result)
+        yield from _walk(scan_path, ctx, 0, errors)
+
 
+def walk_git_repos(
+    scan_paths: list[Path],
+    exclude_patterns: list[str],
+    exclude_paths: list[Path],
+) -> ScanWalkResult:
+    """Find all git repositories in given paths, collecting errors.
+
+    Walks directory trees looking for .git directories.
+    Records PermissionError and OSError encountered during traversal.
+
+    Args:
+        scan_paths: Root directories to scan.
+        exclude_patterns: Glob patterns to exclude (e.g., "**/node_modules").
+        exclude_paths: Specific absolute paths to exclude.
+
+    Returns:
+        ScanWalkResult with discovered repos and any scan errors.
+    """
+    result = ScanWalkResult()
+    result.repos.extend(iter_git_repos(scan_paths, exclude_patterns, exclude_paths, result.errors))
     return result
 
 
@@ -121,7 +248,7 @@ def find_git_repos(
 ) -> Iterator[Path]:
     """Find all git repositories in the given paths.
 
-    Thin wrapper around walk_git_repos that drops errors.
+    Thin wrapper around iter_git_repos that drops errors.
     Walks directory trees looking for .git directories.
     Stops descending once a .git directory is found.
 
@@ -133,8 +260,7 @@ def find_git_repos(
     Yields:
         Path to each repository root (parent of .git).
     """
-    walk_result = walk_git_repos(scan_paths, exclude_patterns, exclude_paths)
-    yield from walk_result.repos
+    yield from iter_git_repos(scan_paths, exclude_patterns, exclude_paths)
 
 
 def scan_directory(
@@ -144,14 +270,14 @@ def scan_directory(
     visited: set[int],
     depth: int,
 ) -> Iterator[Path]:
-    """Recursively scan a directory for git repos.
+    """Scan a directory tree for git repos.
 
     Args:
         root: Directory to scan.
         exclude_patterns: Patterns to exclude.
         exclude_paths: Paths to exclude.
         visited: Set of visited inode numbers to prevent loops.
-        depth: Current recursion depth.
+        depth: Depth of root.
 
     Yields:
         Path to each repository root found.
@@ -161,9 +287,7 @@ def scan_directory(
         exclude_paths=exclude_paths,
         visited=visited,
     )
-    sub_result = ScanWalkResult()
-    _walk(root, ctx, depth, sub_result)
-    yield from sub_result.repos
+    yield from _walk(root, ctx, depth, [])
 
 
 def should_exclude(
@@ -187,10 +311,60 @@ def should_exclude(
     return matches_any_pattern(path, exclude_patterns)
 
 
+@dataclass(frozen=True)
+class _CompiledPatterns:
+    """A pattern list translated into two regex unions."""
+
+    full: re.Pattern[str]  # matched against the whole path string
+    part: re.Pattern[str]  # matched against each path component
+
+
+def _split_patterns(patterns: list[str]) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Separate plain directory-name patterns from real globs.
+
+    Patterns like "node_modules" or "**/node_modules" only ever match a
+    directory by its exact name, so they can be checked with a set lookup.
+
+    Args:
+        patterns: Glob patterns.
+
+    Returns:
+        Tuple of (exact directory names, remaining glob patterns).
+    """
+    names = set()
+    globs = []
+    for pattern in patterns:
+        name = pattern.replace("**/", "")
+        if "/" in name or _GLOB_CHARS.search(name):
+            globs.append(pattern)
+        else:
+            names.add(name)
+    return frozenset(names), tuple(globs)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_patterns(patterns: tuple[str, ...]) -> _CompiledPatterns:
+    """Translate glob patterns into regex unions, once per distinct pattern list.
+
+    Args:
+        patterns: Glob patterns.
+
+    Returns:
+        Compiled full-path and per-component matchers.
+    """
+    full = "|".join(fnmatch.translate(p) for p in patterns)
+    part = "|".join(fnmatch.translate(p.replace("**/", "")) for p in patterns)
+    return _CompiledPatterns(full=re.compile(full), part=re.compile(part))
+
+
 def matches_any_pattern(path: Path, patterns: list[str]) -> bool:
     """Check if path matches any of the glob patterns.
 
-    Supports patterns like "**/node_modules" and "vendor/*".
+    Supports patterns like "**/node_modules" and "vendor/*". A pattern matches
+    when it matches the full path, or (with any "**/" removed) a single path
+    component. The pattern list is compiled once and cached, so each call is
+    at most one regex match per component instead of several fnmatch calls
+    per pattern.
 
     Args:
         path: Path to check.
@@ -199,32 +373,35 @@ def matches_any_pattern(path: Path, patterns: list[str]) -> bool:
     Returns:
         True if path matches any pattern.
     """
-    path_str = str(path)
-    path_parts = path.parts
+    if not patterns:
+        return False
 
-    for pattern in patterns:
-        if "**" in pattern:
-            # For ** patterns, check if any part of path matches
-            pattern_name = pattern.replace("**/", "").replace("**", "")
-            if fnmatch.fnmatch(path.name, pattern_name):
-                return True
-            if fnmatch.fnmatch(path_str, pattern):
-                return True
-        elif fnmatch.fnmatch(path.name, pattern):
-            return True
-        elif fnmatch.fnmatch(path_str, pattern):
-            return True
-        # Check if any path component matches
-        for part in path_parts:
-            if fnmatch.fnmatch(part, pattern.replace("**/", "")):
-                return True
+    compiled = _compile_patterns(tuple(patterns))
+    if compiled.full.match(str(path)):
+        return True
+    return any(compiled.part.match(part) for part in path.parts)
 
-    return False
+
+@functools.lru_cache(maxsize=16)
+def _base_prefixes(base_paths: tuple[Path, ...]) -> tuple[str, ...]:
+    """Turn base paths into separator-terminated prefixes, longest first.
+
+    Args:
+        base_paths: Base paths.
+
+    Returns:
+        Distinct prefixes, so the first match gives the shortest relative path.
+    """
+    prefixes = {str(base).rstrip(os.sep) + os.sep for base in base_paths}
+    return tuple(sorted(prefixes, key=len, reverse=True))
 
 
 def get_relative_path(path: Path, base_paths: list[Path]) -> str:
     """Get a short display path relative to scan roots.
 
+    Uses string prefix checks against cached base prefixes rather than
+    trying Path.relative_to on each base.
+
     Args:
         path: Absolute path to shorten.
         base_paths: List of base paths to try making relative to.
@@ -232,15 +409,12 @@ def get_relative_path(path: Path, base_paths: list[Path]) -> str:
     Returns:
         Shortest relative path string, or absolute if not under any base.
     """
-    for base in base_paths:
-        try:
-            rel = path.relative_to(base)
-            return str(rel)
-        except ValueError:
-            continue
+    path_dir = str(path) + os.sep
+    for prefix in _base_prefixes(tuple(base_paths)):
+        if path_dir.startswith(prefix):
+            return path_dir[len(prefix) : -1] or "."
 
     # Fall back to home-relative or absolute
-    try:
-        return "~/" + str(path.relative_to(Path.home()))
-    except ValueError:
-        return str(path)
+    if path_dir.startswith(_HOME_PREFIX):
+        return "~/" + (path_dir[len(_HOME_PREFIX) : -1] or ".")
+    return str(path)
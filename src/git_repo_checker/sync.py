@@ -1,12 +1,21 @@
 """Sync tracked repositories across machines."""
 
+import functools
+import os
 import re
+import shutil
+import stat
+import tempfile
+import urllib.error
 import urllib.request
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import IO, Any
 
 import yaml
 
+from git_repo_checker import config as config_module
 from git_repo_checker import git_ops
 from git_repo_checker.models import (
     RepoInfo,
@@ -43,6 +52,29 @@ repos:
 
 LOCAL_CONFIG_PATH = Path.home() / ".config" / "git-repo-checker" / "local.yml"
 
+# Appended to a fetched repos.yml's name to store the response's ETag
+ETAG_SUFFIX = ".etag"
+
+EXPORT_HEADER = """\
+# Tracked repositories for git-repo-checker sync
+# These repos will be cloned if missing, pulled if they exist
+#
+# Override path_prefix for different machines with --path-prefix or local.yml
+
+"""
+
+_DUMP_OPTIONS: dict[str, Any] = {
+    "Dumper": config_module.YAML_DUMPER,
+    "default_flow_style": False,
+    "sort_keys": False,
+}
+
+# First "fatal:" or "error:" line of git output, capturing the text after it
+_GIT_ERROR_LINE = re.compile(r"^[^\S\n]*(?:fatal|error):[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
+
+# git clone --branch's "Remote branch X not found in upstream origin"
+_BRANCH_NOT_FOUND = re.compile(r"remote branch[^\n]*not found", re.IGNORECASE)
+
 
 def fetch_repos_from_url(url: str, output_path: Path | None = None) -> Path:
     """Fetch repos.yml from a URL and save locally.
@@ -54,6 +86,27 @@ def fetch_repos_from_url(url: str, output_path: Path | None = None) -> Path:
     Returns:
         Path where the file was saved.
 
+    Raises:
+        URLError: If fetch fails.
+    """
+    return download_repos_file(url, output_path)[0]
+
+
+def download_repos_file(url: str, output_path: Path | None = None) -> tuple[Path, bytes | None]:
+    """Fetch repos.yml from a URL, save it, and hand back the downloaded bytes.
+
+    The response's ETag is kept next to the saved file and sent back as
+    If-None-Match on the next fetch, so an unchanged file is not downloaded
+    or rewritten again.
+
+    Args:
+        url: URL to fetch repos.yml from (e.g., GitHub raw URL).
+        output_path: Where to save the file. Defaults to ~/.config/git-repo-checker/repos.yml
+
+    Returns:
+        Tuple of (saved path, content). Content is None when the server
+        reported the saved file unchanged.
+
     Raises:
         URLError: If fetch fails.
     """
@@ -61,25 +114,58 @@ def fetch_repos_from_url(url: str, output_path: Path | None = None) -> Path:
         output_path = Path.home() / ".config" / "git-repo-checker" / "repos.yml"
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    etag_path = output_path.with_name(output_path.name + ETAG_SUFFIX)
 
-    with urllib.request.urlopen(url, timeout=30) as response:
-        content = response.read().decode("utf-8")
+    request = urllib.request.Request(url)
+    if output_path.exists():
+        try:
+            request.add_header("If-None-Match", etag_path.read_text().strip())
+        except OSError:
+            pass
 
-    output_path.write_text(content)
-    return output_path
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            content = response.read()
+            etag = response.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return output_path, None
+        raise
+
+    output_path.write_bytes(content)
+    if etag:
+        etag_path.write_text(etag)
+    else:
+        etag_path.unlink(missing_ok=True)
+    return output_path, content
 
 
 def load_local_config() -> dict:
     """Load local machine config for path overrides.
 
+    The file is parsed once per process.
+
     Returns:
         Dictionary with local config or empty dict if not found.
     """
-    if not LOCAL_CONFIG_PATH.exists():
-        return {}
+    return _load_local_config(LOCAL_CONFIG_PATH)
+
 
-    with open(LOCAL_CONFIG_PATH) as f:
-        return yaml.safe_load(f) or {}
+@functools.lru_cache(maxsize=1)
+def _load_local_config(path: Path) -> dict:
+    """Parse a local config file, memoized on its path.
+
+    Args:
+        path: Location of local.yml.
+
+    Returns:
+        Dictionary with local config or empty dict if not found.
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return {}
+    return yaml.load(data, Loader=config_module.YAML_LOADER) or {}
 
 
 def get_effective_path_prefix(file_prefix: str, cli_prefix: str | None = None) -> str:
@@ -105,25 +191,28 @@ def get_effective_path_prefix(file_prefix: str, cli_prefix: str | None = None) -
     return file_prefix
 
 
-def apply_path_prefix(repo_path: str, prefix: str) -> Path:
+def apply_path_prefix(repo_path: str, prefix: str | Path) -> Path:
     """Apply path prefix to a repo path.
 
     Args:
         repo_path: The repo path (can be relative or absolute).
-        prefix: The path prefix to apply.
+        prefix: The path prefix to apply. A Path is taken as already
+            user-expanded, so callers applying one prefix to many repos
+            can expand it once.
 
     Returns:
-        Resolved absolute path.
+        Normalized absolute path. Symlinks are left unresolved, which saves
+        a readlink per path component for every repo in the file.
     """
     path = Path(repo_path)
 
     # If path is absolute, use it directly
     if path.is_absolute():
-        return path.expanduser().resolve()
+        return Path(os.path.abspath(path))
 
     # Apply prefix for relative paths
-    prefix_path = Path(prefix).expanduser()
-    return (prefix_path / path).resolve()
+    prefix_path = Path(prefix).expanduser() if isinstance(prefix, str) else prefix
+    return Path(os.path.abspath(prefix_path / path))
 
 
 def find_repos_file() -> Path | None:
@@ -183,26 +272,50 @@ def load_repos_from_path(
     if not repos_path.exists():
         raise FileNotFoundError(f"Repos file not found: {repos_path}")
 
-    with open(repos_path) as f:
-        raw = yaml.safe_load(f) or {}
+    return parse_repos_document(config_module.load_yaml_cached(repos_path), path_prefix)
 
-    # Get path prefix from file, with possible override
-    file_prefix = raw.get("path_prefix", "~")
-    effective_prefix = get_effective_path_prefix(file_prefix, path_prefix)
 
+def load_repos_from_bytes(content: bytes, path_prefix: str | None = None) -> list[TrackedRepo]:
+    """Parse repos from repos.yml content already in memory, e.g. just downloaded.
+
+    Args:
+        content: Raw bytes of a repos.yml file.
+        path_prefix: Override path prefix from CLI.
+
+    Returns:
+        List of TrackedRepo objects.
+    """
+    return parse_repos_document(yaml.load(content, Loader=config_module.YAML_LOADER), path_prefix)
+
+
+def parse_repos_document(raw: dict | None, path_prefix: str | None = None) -> list[TrackedRepo]:
+    """Build tracked repos from a parsed repos.yml document.
+
+    Args:
+        raw: Parsed YAML document, or None for an empty file.
+        path_prefix: Override path prefix from CLI.
+
+    Returns:
+        List of TrackedRepo objects.
+    """
+    raw = raw or {}
     repos_raw = raw.get("repos", [])
     if not repos_raw:
         return []
 
-    return [parse_tracked_repo(r, effective_prefix) for r in repos_raw]
+    # Get path prefix from file, with possible override
+    file_prefix = raw.get("path_prefix", "~")
+    effective_prefix = get_effective_path_prefix(file_prefix, path_prefix)
+    prefix_path = Path(effective_prefix).expanduser()
+    return [parse_tracked_repo(r, prefix_path) for r in repos_raw]
 
 
-def parse_tracked_repo(raw: dict, path_prefix: str = "~") -> TrackedRepo:
+def parse_tracked_repo(raw: dict, path_prefix: str | Path = "~") -> TrackedRepo:
     """Parse a single tracked repo entry.
 
     Args:
         raw: Dictionary with path, remote, and optional branch/ignore.
-        path_prefix: Path prefix to apply to relative paths.
+        path_prefix: Path prefix to apply to relative paths; see apply_path_prefix.
 
     Returns:
         TrackedRepo object with expanded path.
@@ -245,15 +358,11 @@ def extract_git_error(message: str) -> str:
     Returns:
         Cleaned up error message.
     """
-    for line in message.split("\n"):
-        line = line.strip()
-        if line.startswith("fatal:"):
-            return line[6:].strip()
-        if line.startswith("error:"):
-            return line[6:].strip()
+    match = _GIT_ERROR_LINE.search(message)
+    if match:
+        return match.group(1)
     # No fatal/error found, return last non-empty line
-    lines = [ln.strip() for ln in message.split("\n") if ln.strip()]
-    return lines[-1] if lines else message
+    return message.rstrip().rsplit("\n", 1)[-1].strip() or message
 
 
 def sync_repo(repo: TrackedRepo, pull_existing: bool = True) -> SyncRepoResult:
@@ -268,24 +377,31 @@ def sync_repo(repo: TrackedRepo, pull_existing: bool = True) -> SyncRepoResult:
     Returns:
         SyncRepoResult with action taken and message.
     """
+    # A single stat of .git covers the common already-cloned case, which
+    # matters on network filesystems where every stat is a round trip.
+    if git_ops.is_git_dir(repo.path):
+        return handle_existing_repo(repo, pull_existing, git_dir_checked=True)
+
     if repo.path.exists():
         return handle_existing_repo(repo, pull_existing)
 
     return clone_tracked_repo(repo)
 
 
-def handle_existing_repo(repo: TrackedRepo, pull_existing: bool) -> SyncRepoResult:
+def handle_existing_repo(
+    repo: TrackedRepo, pull_existing: bool, git_dir_checked: bool = False
+) -> SyncRepoResult:
     """Handle a repo that already exists locally.
 
     Args:
         repo: The tracked repository.
         pull_existing: Whether to pull updates.
+        git_dir_checked: True if the caller already found repo.path/.git.
 
     Returns:
         SyncRepoResult with action taken.
     """
-    git_dir = repo.path / ".git"
-    if not git_dir.exists():
+    if not git_dir_checked and not (repo.path / ".git").exists():
         return SyncRepoResult(
             repo=repo,
             action=SyncAction.ERROR,
@@ -301,6 +417,17 @@ def handle_existing_repo(repo: TrackedRepo, pull_existing: bool) -> SyncRepoResu
 
     # Fetch and pull if behind
     try:
+        # Upstream config is read from .git files, so a branch with nothing
+        # to pull from costs no git processes at all.
+        if not git_ops.has_upstream(repo.path):
+            return SyncRepoResult(
+                repo=repo,
+                action=SyncAction.SKIPPED,
+                message="No upstream configured",
+            )
+
+        # One network round trip: fetch, count locally, then fast-forward to
+        # the fetched upstream instead of letting git pull fetch again.
         git_ops.fetch_repo(repo.path)
         ahead, behind = git_ops.get_remote_status(repo.path)
 
@@ -311,7 +438,7 @@ def handle_existing_repo(repo: TrackedRepo, pull_existing: bool) -> SyncRepoResu
                 message="Already up to date",
             )
 
-        result = git_ops.pull_repo(repo.path)
+        result = git_ops.fast_forward_repo(repo.path)
         if result.success:
             return SyncRepoResult(
                 repo=repo,
@@ -340,8 +467,7 @@ def is_branch_not_found_error(message: str) -> bool:
     Returns:
         True if error indicates branch was not found.
     """
-    lower_msg = message.lower()
-    return "remote branch" in lower_msg and "not found" in lower_msg
+    return _BRANCH_NOT_FOUND.search(message) is not None
 
 
 def clone_tracked_repo(repo: TrackedRepo) -> SyncRepoResult:
@@ -356,8 +482,6 @@ def clone_tracked_repo(repo: TrackedRepo) -> SyncRepoResult:
     Returns:
         SyncRepoResult with clone result.
     """
-    import shutil
-
     try:
         repo.path.parent.mkdir(parents=True, exist_ok=True)
         result = git_ops.clone_repo(repo.remote, repo.path, repo.branch)
@@ -405,7 +529,10 @@ def clone_tracked_repo(repo: TrackedRepo) -> SyncRepoResult:
 
 
 def sync_all(
-    repos: list[TrackedRepo], pull_existing: bool = True, max_workers: int | None = None
+    repos: list[TrackedRepo],
+    pull_existing: bool = True,
+    max_workers: int | None = None,
+    on_result: Callable[[SyncRepoResult], None] | None = None,
 ) -> SyncResult:
     """Sync all tracked repositories.
 
@@ -413,41 +540,47 @@ def sync_all(
         repos: List of repositories to sync.
         pull_existing: Whether to pull repos that already exist.
         max_workers: Maximum number of threads for parallel sync.
-            Defaults to min(32, cpu_count + 4).
+            Defaults to git_ops.io_worker_count.
+        on_result: Called with each repo's result as soon as it finishes,
+            in completion order, e.g. to show progress.
 
     Returns:
         SyncResult with all individual results and counts.
     """
-    results: list[SyncRepoResult] = []
+    # One slot per input repo, so results come back in repos.yml order
+    # without sorting, whatever order the workers finish in.
+    slots: list[SyncRepoResult | None] = [None] * len(repos)
     cloned = 0
     pulled = 0
     skipped = 0
     errors = 0
 
     # Handle ignored repos first (no I/O needed)
-    active_repos = []
-    for repo in repos:
+    active_repos: list[tuple[int, TrackedRepo]] = []
+    for index, repo in enumerate(repos):
         if repo.ignore:
-            results.append(
-                SyncRepoResult(
-                    repo=repo,
-                    action=SyncAction.SKIPPED,
-                    message="Ignored",
-                )
+            slots[index] = SyncRepoResult(
+                repo=repo,
+                action=SyncAction.SKIPPED,
+                message="Ignored",
             )
             skipped += 1
         else:
-            active_repos.append(repo)
-
-    # Sync active repos in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_repo = {
-            executor.submit(sync_repo, repo, pull_existing): repo for repo in active_repos
+            active_repos.append((index, repo))
+
+    # Sync active repos in parallel; threads mostly wait on git fetch/clone,
+    # so the pool is sized for I/O like the scan's rather than for CPUs.
+    workers = git_ops.io_worker_count(len(active_repos), max_workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        future_to_index = {
+            executor.submit(sync_repo, repo, pull_existing): index for index, repo in active_repos
         }
 
-        for future in as_completed(future_to_repo):
+        for future in as_completed(future_to_index):
             result = future.result()
-            results.append(result)
+            slots[future_to_index[future]] = result
+            if on_result is not None:
+                on_result(result)
 
             if result.action == SyncAction.CLONED:
                 cloned += 1
@@ -458,8 +591,7 @@ def sync_all(
             else:
                 errors += 1
 
-    # Sort results by path for consistent output
-    results.sort(key=lambda r: r.repo.path)
+    results = [result for result in slots if result is not None]
 
     return SyncResult(
         results=results,
@@ -542,12 +674,9 @@ def export_repos_to_file(
                 f"Repos file already exists: {output_path}. Use --merge to add to it."
             )
 
-        with open(output_path) as f:
-            existing_data = yaml.safe_load(f) or {}
+        existing_data = yaml.load(output_path.read_bytes(), Loader=config_module.YAML_LOADER) or {}
 
-        existing_repos = existing_data.get("repos", [])
-        existing_remotes = {r.get("remote") for r in existing_repos if r.get("remote")}
-        existing_paths = {r.get("path"): r.get("remote") for r in existing_repos if r.get("path")}
+        existing_remotes, existing_paths = _index_existing_repos(existing_data.get("repos", []))
         # Keep existing path_prefix if merging
         if "path_prefix" not in existing_data:
             existing_data["path_prefix"] = path_prefix
@@ -579,25 +708,63 @@ def export_repos_to_file(
         existing_paths[entry["path"]] = entry["remote"]
         added += 1
 
-    # Write output
+    # Write output to a temp file and swap it in, so an interrupted export
+    # never leaves a truncated repos file behind.
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    mode = stat.S_IMODE(output_path.stat().st_mode) if output_path.exists() else 0o644
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(EXPORT_HEADER)
+            _dump_repos_document(existing_data, f)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
 
-    # Generate YAML with comments
-    header = """\
-# Tracked repositories for git-repo-checker sync
-# These repos will be cloned if missing, pulled if they exist
-#
-# Override path_prefix for different machines with --path-prefix or local.yml
+    return added, skipped, collisions
 
-"""
-    yaml_content = yaml.dump(existing_data, default_flow_style=False, sort_keys=False)
 
-    # Add blank lines between repo entries for readability
-    yaml_content = re.sub(r"\n- path:", r"\n\n- path:", yaml_content)
+def _dump_repos_document(data: dict, stream: IO[str]) -> None:
+    """Write a repos.yml document with a blank line before each repo entry.
 
-    output_path.write_text(header + yaml_content)
+    Top-level keys, and the repos one entry at a time, are dumped straight to
+    the stream, so the full YAML text is never built in memory.
 
-    return added, skipped, collisions
+    Args:
+        data: Document to write, with keys in output order.
+        stream: Text stream to write to.
+    """
+    for key, value in data.items():
+        if key == "repos" and isinstance(value, list) and value:
+            stream.write("repos:\n")
+            for entry in value:
+                stream.write("\n")
+                yaml.dump([entry], stream, **_DUMP_OPTIONS)
+        else:
+            yaml.dump({key: value}, stream, **_DUMP_OPTIONS)
+
+
+def _index_existing_repos(entries: list[Any]) -> tuple[set[str], dict[str, str]]:
+    """Collect the remotes and paths already tracked in a repos.yml, in one pass.
+
+    Args:
+        entries: The file's repos list, as parsed from YAML.
+
+    Returns:
+        Tuple of (tracked remotes, {path: remote}).
+    """
+    remotes: set[str] = set()
+    paths: dict[str, str] = {}
+    for entry in entries:
+        remote = entry.get("remote")
+        path = entry.get("path")
+        if remote:
+            remotes.add(remote)
+        if path:
+            paths[path] = remote
+    return remotes, paths
 
 
 def auto_track_repos(
@@ -0,0 +1,141 @@
+"""Watch mode: keep scan results current by re-analyzing only changed repos."""
+
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from git_repo_checker import analyzer, git_ops, scanner
+from git_repo_checker.manifest import RepoState, repo_state
+from git_repo_checker.models import Config, RepoInfo, ScanResult
+
+
+class RepoWatcher:
+    """Tracks repositories across polls and re-analyzes only those that changed.
+
+    Watch mode is read-only: it never auto-pulls.
+    """
+
+    def __init__(self, config: Config, max_workers: int | None = None) -> None:
+        """Initialize watcher.
+
+        Args:
+            config: Application configuration.
+            max_workers: Maximum threads for re-analysis. Defaults to
+                git_ops.io_worker_count.
+        """
+        self.config = config
+        self.max_workers = max_workers
+        self.cache = git_ops.GitCache(fetch_ttl_seconds=config.auto_pull.fetch_ttl_seconds)
+        self.host_slot = analyzer.make_host_slots()
+        self.repos_by_path: dict[Path, RepoInfo] = {}
+        self.states: dict[Path, RepoState] = {}
+        self.scan_errors: list[str] = []
+
+    def refresh(self) -> list[Path]:
+        """Rediscover repos and re-analyze the new or changed ones.
+
+        A repo is stale when its metadata fingerprint changed or, when
+        auto_pull.fetch_ttl_seconds is set and it has an upstream, its last
+        fetch attempt has expired. Repos that disappeared are dropped.
+
+        Returns:
+            Paths that were re-analyzed, sorted.
+        """
+        errors: list[str] = []
+        current = {
+            path: repo_state(path)
+            for path in scanner.iter_git_repos(
+                scan_paths=self.config.scan_paths,
+                exclude_patterns=self.config.exclude_patterns,
+                exclude_paths=self.config.exclude_paths,
+                errors=errors,
+            )
+        }
+
+        for gone in self.states.keys() - current.keys():
+            self.repos_by_path.pop(gone, None)
+
+        stale = sorted(path for path, state in current.items() if self._is_stale(path, state))
+        self.states = current
+        self.scan_errors = errors
+
+        if stale:
+            workers = git_ops.io_worker_count(len(stale), self.max_workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for info in executor.map(self._analyze, stale):
+                    self.repos_by_path[info.path] = info
+        return stale
+
+    def _is_stale(self, path: Path, state: RepoState) -> bool:
+        """Check whether a repo needs re-analysis on this poll.
+
+        Args:
+            path: Path to repository root.
+            state: Metadata fingerprint from this poll's walk.
+
+        Returns:
+            True if the repo is new, its state changed, or its fetch expired.
+        """
+        if self.states.get(path) != state:
+            return True
+        if self.cache.fetch_ttl_seconds <= 0 or not git_ops.has_upstream(path, self.cache):
+            return False
+        return not self.cache.fetch_is_fresh(path)
+
+    def _analyze(self, path: Path) -> RepoInfo:
+        """Analyze one repo with the watcher's shared cache and fetch limiter.
+
+        Args:
+            path: Path to repository root.
+
+        Returns:
+            Fresh RepoInfo for the repository.
+        """
+        info = analyzer.analyze_repo(path, self.config, self.cache, self.host_slot)
+        # Count a failed fetch as an attempt too, so an unreachable remote is
+        # retried once per TTL rather than on every poll.
+        if not self.cache.fetch_is_fresh(path):
+            self.cache.record_fetch(path)
+        return info
+
+    def repos(self) -> list[RepoInfo]:
+        """Return current repo infos sorted by path.
+
+        Returns:
+            Latest analysis for every tracked repo.
+        """
+        return [self.repos_by_path[p] for p in sorted(self.repos_by_path)]
+
+    def result(self) -> ScanResult:
+        """Return the current state as a ScanResult.
+
+        Returns:
+            ScanResult with the tracked repos and the last walk's errors.
+        """
+        repos = self.repos()
+        return ScanResult(repos=repos, total_scanned=len(repos), scan_errors=self.scan_errors)
+
+
+def run_watch(
+    watcher: RepoWatcher,
+    on_update: Callable[[RepoWatcher, list[Path]], None],
+    interval: float,
+    max_cycles: int | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> None:
+    """Poll for changes until interrupted or max_cycles refreshes have run.
+
+    Args:
+        watcher: Watcher holding the tracked repos.
+        on_update: Called after every refresh with the re-analyzed paths.
+        interval: Seconds to sleep between polls.
+        max_cycles: Stop after this many refreshes; None runs forever.
+        sleep: Sleep function, replaceable in tests.
+    """
+    cycles = 0
+    while max_cycles is None or cycles < max_cycles:
+        on_update(watcher, watcher.refresh())
+        cycles += 1
+        if max_cycles is None or cycles < max_cycles:
+            sleep(interval)
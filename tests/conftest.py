@@ -1,10 +1,13 @@
 """Shared test fixtures."""
 
+import shutil
 import subprocess
 from pathlib import Path
 
 import pytest
 
+from git_repo_checker import config as config_module
+from git_repo_checker import sync
 from git_repo_checker.models import (
     AutoPullConfig,
     Config,
@@ -14,6 +17,13 @@ from git_repo_checker.models import (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_config_cache(tmp_path_factory, monkeypatch):
+    """Keep parsed-config caches out of the real home directory and other tests."""
+    monkeypatch.setattr(config_module, "CONFIG_CACHE_DIR", tmp_path_factory.mktemp("cache"))
+    sync._load_local_config.cache_clear()
+
+
 @pytest.fixture
 def sample_config() -> Config:
     """Create a sample configuration for testing."""
@@ -27,10 +37,10 @@ def sample_config() -> Config:
     )
 
 
-@pytest.fixture
-def temp_git_repo(tmp_path: Path) -> Path:
-    """Create a temporary git repository."""
-    repo_path = tmp_path / "test-repo"
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory) -> Path:
+    """Build the temp_git_repo contents once per session."""
+    repo_path = tmp_path_factory.mktemp("template") / "test-repo"
     repo_path.mkdir()
 
     subprocess.run(["git", "init"], cwd=repo_path, capture_output=True, check=True)
@@ -61,6 +71,14 @@ def temp_git_repo(tmp_path: Path) -> Path:
     return repo_path
 
 
+@pytest.fixture
+def temp_git_repo(tmp_path: Path, _git_repo_template: Path) -> Path:
+    """Create a temporary git repository, copied from the session template."""
+    repo_path = tmp_path / "test-repo"
+    shutil.copytree(_git_repo_template, repo_path, symlinks=True)
+    return repo_path
+
+
 @pytest.fixture
 def temp_git_repo_dirty(temp_git_repo: Path) -> Path:
     """Create a temp git repo with uncommitted changes."""
@@ -109,10 +127,10 @@ def sample_repo_info() -> RepoInfo:
     )
 
 
-@pytest.fixture
-def sample_config_yaml(tmp_path: Path) -> Path:
-    """Create a sample config YAML file."""
-    config_path = tmp_path / "config.yml"
+@pytest.fixture(scope="session")
+def sample_config_yaml(tmp_path_factory) -> Path:
+    """Create a sample config YAML file, once per session; tests only read it."""
+    config_path = tmp_path_factory.mktemp("sample-config") / "config.yml"
     config_path.write_text(
         """\
 scan_paths:
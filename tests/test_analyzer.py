@@ -1,16 +1,18 @@
 """Tests for analyzer module."""
 
+import threading
+import time
 from pathlib import Path
 
-from git_repo_checker import analyzer, scanner
+from git_repo_checker import analyzer, git_ops, scanner
 from git_repo_checker.models import (
     AutoPullConfig,
     Config,
+    PullResult,
     RepoInfo,
     RepoStatus,
     WarningType,
 )
-from git_repo_checker.scanner import ScanWalkResult
 
 
 class TestAnalyzeRepo:
@@ -46,6 +48,11 @@ class TestIsMainBranch:
         assert analyzer.is_main_branch("MAIN", ["main", "master"]) is True
         assert analyzer.is_main_branch("Main", ["main"]) is True
 
+    def test_config_lowercases_main_branches(self):
+        config = Config(main_branches=["Main", "DEVELOP"])
+        assert config.main_branches_lower == frozenset({"main", "develop"})
+        assert analyzer.is_main_branch("develop", config.main_branches_lower) is True
+
 
 class TestDetectWarnings:
     def test_dirty_main_warning(self):
@@ -185,7 +192,217 @@ class TestScanAndAnalyze:
         assert result.pull_results == []
 
     def test_scan_errors_propagated(self, sample_config, monkeypatch):
-        walk_result = ScanWalkResult(repos=[], errors=["Permission denied: /x"])
-        monkeypatch.setattr(scanner, "walk_git_repos", lambda **kw: walk_result)
+        def fake_iter(errors, **kw):
+            errors.append("Permission denied: /x")
+            yield from ()
+
+        monkeypatch.setattr(scanner, "iter_git_repos", fake_iter)
         result = analyzer.scan_and_analyze(sample_config, auto_pull=False)
         assert result.scan_errors == ["Permission denied: /x"]
+
+    def test_repos_sorted_by_path(self, nested_repos, sample_config):
+        sample_config.scan_paths = [nested_repos]
+        result = analyzer.scan_and_analyze(sample_config, auto_pull=False)
+        paths = [r.path for r in result.repos]
+        assert paths == sorted(paths)
+
+    def test_on_repo_called_per_result(self, nested_repos, sample_config):
+        sample_config.scan_paths = [nested_repos]
+        seen: list[RepoInfo] = []
+
+        result = analyzer.scan_and_analyze(sample_config, auto_pull=False, on_repo=seen.append)
+        assert sorted(r.path for r in seen) == [r.path for r in result.repos]
+
+    def test_vanished_repo_leaves_no_gap(self, nested_repos, sample_config, monkeypatch):
+        sample_config.scan_paths = [nested_repos]
+        original = analyzer._analyze_if_present
+
+        def drop_repo2(path, config, cache, manifest=None, host_slot=None):
+            if path.name == "repo2":
+                return None
+            return original(path, config, cache, manifest, host_slot)
+
+        monkeypatch.setattr(analyzer, "_analyze_if_present", drop_repo2)
+        result = analyzer.scan_and_analyze(sample_config, auto_pull=False)
+        assert [r.path.name for r in result.repos] == ["repo1", "repo3"]
+
+    def test_yields_results_before_walk_ends(self, tmp_path, sample_config, monkeypatch):
+        walked: list[Path] = []
+
+        def slow_walk(**kwargs):
+            for i in range(5):
+                walked.append(tmp_path / f"repo{i}")
+                yield walked[-1]
+                time.sleep(0.05)
+
+        def instant(path, config, cache, manifest=None, host_slot=None):
+            return RepoInfo(path=path, branch="main", status=RepoStatus.CLEAN)
+
+        monkeypatch.setattr(scanner, "iter_git_repos", slow_walk)
+        monkeypatch.setattr(analyzer, "_analyze_if_present", instant)
+        stream = analyzer.scan_and_analyze_stream(sample_config)
+
+        next(stream)
+        assert len(walked) < 5
+        assert len(list(stream)) == 4
+
+    def test_single_repo_skips_thread_pool(self, temp_git_repo, sample_config, monkeypatch):
+        sample_config.scan_paths = [temp_git_repo]
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("pool should not be created")
+
+        monkeypatch.setattr(analyzer, "ThreadPoolExecutor", no_pool)
+        result = analyzer.scan_and_analyze(sample_config, auto_pull=False)
+        assert [r.path for r in result.repos] == [temp_git_repo]
+
+    def test_limits_fetches_per_host(self, nested_repos, sample_config, monkeypatch):
+        sample_config.scan_paths = [nested_repos]
+        active = 0
+        peak = 0
+        guard = threading.Lock()
+
+        def fake_fetch(path, cache=None):
+            nonlocal active, peak
+            with guard:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with guard:
+                active -= 1
+            return True
+
+        original = analyzer.make_host_slots
+        monkeypatch.setattr(analyzer, "make_host_slots", lambda: original(limit=1))
+        monkeypatch.setattr(git_ops, "has_upstream", lambda *a: True)
+        monkeypatch.setattr(git_ops, "get_remote_url", lambda *a: "git@github.com:u/r.git")
+        monkeypatch.setattr(git_ops, "fetch_repo", fake_fetch)
+
+        result = analyzer.scan_and_analyze(sample_config, auto_pull=False, max_workers=4)
+
+        assert len(result.repos) >= 3
+        assert peak == 1
+
+
+class TestMakeHostSlots:
+    def test_same_host_shares_a_slot(self, monkeypatch):
+        urls = {
+            Path("/a"): "git@github.com:u/a.git",
+            Path("/b"): "https://github.com/u/b.git",
+            Path("/c"): "https://gitlab.com/u/c.git",
+        }
+        monkeypatch.setattr(git_ops, "get_remote_url", urls.__getitem__)
+        host_slot = analyzer.make_host_slots()
+        assert host_slot(Path("/a")) is host_slot(Path("/b"))
+        assert host_slot(Path("/a")) is not host_slot(Path("/c"))
+
+    def test_limit_bounds_each_host(self, monkeypatch):
+        monkeypatch.setattr(git_ops, "get_remote_url", lambda *a: "https://github.com/u/r.git")
+        slot = analyzer.make_host_slots(limit=2)(Path("/a"))
+        assert slot.acquire(blocking=False)
+        assert slot.acquire(blocking=False)
+        assert not slot.acquire(blocking=False)
+
+
+class TestScanAndAnalyzeStream:
+    def test_yields_repo_infos(self, nested_repos, sample_config):
+        sample_config.scan_paths = [nested_repos]
+        repos = list(analyzer.scan_and_analyze_stream(sample_config))
+        assert len(repos) >= 3
+        assert all(isinstance(r, RepoInfo) for r in repos)
+
+
+class TestAutoPullRepos:
+    def _behind(self, name):
+        return RepoInfo(
+            path=Path(f"/tmp/{name}"), branch="main", status=RepoStatus.BEHIND, behind_count=2
+        )
+
+    def test_pulls_eligible_repos_in_order(self, monkeypatch):
+        config = Config(auto_pull=AutoPullConfig(enabled=True))
+        repos = [
+            self._behind("a"),
+            RepoInfo(path=Path("/tmp/b"), branch="main", status=RepoStatus.CLEAN),
+            self._behind("c"),
+        ]
+        monkeypatch.setattr(git_ops, "get_remote_url", lambda p: "git@github.com:o/r.git")
+        monkeypatch.setattr(
+            git_ops,
+            "pull_repo",
+            lambda p, cache=None: PullResult(path=p, success=p.name == "a", message="x"),
+        )
+
+        results = analyzer.auto_pull_repos(repos, config)
+
+        assert [r.path.name for r in results] == ["a", "c"]
+        assert repos[0].status == RepoStatus.CLEAN
+        assert repos[0].behind_count == 0
+        assert repos[2].status == RepoStatus.BEHIND
+
+    def test_serializes_pulls_per_host(self, monkeypatch):
+        config = Config(auto_pull=AutoPullConfig(enabled=True))
+        repos = [self._behind(f"r{i}") for i in range(4)]
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+        guard = threading.Lock()
+
+        def host_of(path):
+            return f"https://host{int(path.name[1]) % 2}/x.git"
+
+        def fake_pull(path, cache=None):
+            host = host_of(path)
+            with guard:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.01)
+            with guard:
+                active[host] -= 1
+            return PullResult(path=path, success=True, message="ok")
+
+        monkeypatch.setattr(git_ops, "get_remote_url", host_of)
+        monkeypatch.setattr(git_ops, "pull_repo", fake_pull)
+
+        results = analyzer.auto_pull_repos(repos, config)
+
+        assert len(results) == 4
+        assert peak == {"https://host0/x.git": 1, "https://host1/x.git": 1}
+
+    def test_nothing_to_pull(self):
+        config = Config(auto_pull=AutoPullConfig(enabled=False))
+        assert analyzer.auto_pull_repos([self._behind("a")], config) == []
+
+
+class TestMakePullFilter:
+    def test_disabled_rejects_everything(self):
+        pull_filter = analyzer.make_pull_filter(Config(auto_pull=AutoPullConfig(enabled=False)))
+        repo = RepoInfo(
+            path=Path("/tmp/r"), branch="main", status=RepoStatus.BEHIND, behind_count=1
+        )
+        assert pull_filter(repo) is False
+
+    def test_captures_settings_at_build_time(self):
+        config = Config(auto_pull=AutoPullConfig(enabled=True, skip_patterns=["**/skip"]))
+        pull_filter = analyzer.make_pull_filter(config)
+        keep = RepoInfo(
+            path=Path("/tmp/r"), branch="main", status=RepoStatus.BEHIND, behind_count=1
+        )
+        skip = RepoInfo(
+            path=Path("/tmp/skip"), branch="main", status=RepoStatus.BEHIND, behind_count=1
+        )
+        assert pull_filter(keep) is True
+        assert pull_filter(skip) is False
+
+
+class TestAnalyzeIfPresent:
+    def test_skips_vanished_repo_without_git(self, tmp_path, sample_config, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("git should not be called")
+
+        monkeypatch.setattr(git_ops, "_run_git", fail)
+        monkeypatch.setattr(git_ops, "iter_git_output", fail)
+        assert analyzer._analyze_if_present(tmp_path, sample_config, None) is None
+
+    def test_analyzes_present_repo(self, temp_git_repo, sample_config):
+        result = analyzer._analyze_if_present(temp_git_repo, sample_config, None)
+        assert result is not None
+        assert result.path == temp_git_repo
@@ -7,8 +7,11 @@ from unittest.mock import MagicMock, patch
 import pytest
 from typer.testing import CliRunner
 
-from git_repo_checker.cli import app
+from git_repo_checker import config as config_module
+from git_repo_checker.cli import app, get_config, scan
 from git_repo_checker.models import (
+    CIStatus,
+    PullResult,
     RepoInfo,
     RepoStatus,
     ScanResult,
@@ -16,16 +19,87 @@ from git_repo_checker.models import (
     SyncRepoResult,
     SyncResult,
     TrackedRepo,
+    WarningType,
 )
 from git_repo_checker.schedule import ScheduleStatus
 
 runner = CliRunner()
 
+
 # Patch target for auto_track_repos to prevent file writes in tests
-_AUTO_TRACK = "git_repo_checker.cli.sync_module.auto_track_repos"
+_AUTO_TRACK = "git_repo_checker.sync.auto_track_repos"
 _NO_OP_TRACK = (_AUTO_TRACK, MagicMock(return_value=(0, 0, [])))
 
 
+# Canned sync outcomes for one tracked repo, shared by the sync command tests
+_SYNCED_REPO = TrackedRepo(path=Path("/code/repo1"), remote="git@github.com:u/r.git")
+_CLONED_RESULT = SyncResult(
+    results=[SyncRepoResult(repo=_SYNCED_REPO, action=SyncAction.CLONED, message="Cloned")],
+    cloned=1,
+)
+_SKIPPED_RESULT = SyncResult(
+    results=[SyncRepoResult(repo=_SYNCED_REPO, action=SyncAction.SKIPPED, message="Up to date")],
+    skipped=1,
+)
+_ERROR_RESULT = SyncResult(
+    results=[SyncRepoResult(repo=_SYNCED_REPO, action=SyncAction.ERROR, message="Network error")],
+    errors=1,
+)
+_PULLED_RESULT = SyncResult(
+    results=[SyncRepoResult(repo=_SYNCED_REPO, action=SyncAction.PULLED, message="Pulled 3 files")],
+    pulled=1,
+)
+
+
+@pytest.fixture(scope="session")
+def _parsed_configs() -> dict:
+    """Configs parsed so far in this session, keyed by path, mtime and size."""
+    return {}
+
+
+@pytest.fixture(autouse=True)
+def reuse_parsed_configs(_parsed_configs, monkeypatch):
+    """Parse each config file once per session rather than once per invocation.
+
+    Every caller gets its own deep copy, so --verbose/--quiet overrides
+    cannot leak between tests.
+    """
+    real_load = config_module.load_config
+
+    def load_config(config_path=None):
+        if config_path is None:
+            return real_load(config_path)
+        try:
+            stat_info = config_path.stat()
+        except OSError:
+            return real_load(config_path)
+        key = (config_path, stat_info.st_mtime_ns, stat_info.st_size)
+        if key not in _parsed_configs:
+            _parsed_configs[key] = real_load(config_path)
+        return _parsed_configs[key].model_copy(deep=True)
+
+    monkeypatch.setattr(config_module, "load_config", load_config)
+
+
+@pytest.fixture
+def mock_scan(monkeypatch) -> MagicMock:
+    """Stub the scan behind every scanning command; tests set its return_value."""
+    stub = MagicMock(return_value=ScanResult(repos=[], total_scanned=0))
+    monkeypatch.setattr("git_repo_checker.analyzer.scan_and_analyze", stub)
+    return stub
+
+
+@pytest.fixture(scope="module")
+def single_repo_yml(tmp_path_factory) -> Path:
+    """Read-only repos.yml tracking one repo that is never created, shared by the module."""
+    sync_dir = tmp_path_factory.mktemp("sync")
+    repos_path = sync_dir / "repos.yml"
+    repos_path.write_text(
+        f"repos:\n  - path: {sync_dir}/repo1\n    remote: git@github.com:u/r.git\n"
+    )
+    return repos_path
+
+
 def _scan_result_with_repos(tmp_path: Path) -> ScanResult:
     return ScanResult(
         repos=[RepoInfo(path=tmp_path / "repo1", branch="main", status=RepoStatus.CLEAN)],
@@ -35,17 +109,14 @@ def _scan_result_with_repos(tmp_path: Path) -> ScanResult:
 
 class TestMainCommand:
     def test_shows_error_without_config(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(config_module, "DEFAULT_CONFIG_LOCATIONS", [tmp_path / "missing.yml"])
         result = runner.invoke(app)
         assert result.exit_code == 1
         assert "Error" in result.stdout or "config" in result.stdout.lower()
 
-    def test_runs_with_config(self, sample_config_yaml, monkeypatch, tmp_path):
-        monkeypatch.chdir(tmp_path)
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
-            mock_scan.return_value = ScanResult(repos=[], total_scanned=0)
-            result = runner.invoke(app, ["--config", str(sample_config_yaml)])
-            assert result.exit_code == 0
+    def test_runs_with_config(self, sample_config_yaml, mock_scan):
+        result = runner.invoke(app, ["--config", str(sample_config_yaml)])
+        assert result.exit_code == 0
 
 
 class TestScanCommand:
@@ -57,27 +128,18 @@ class TestScanCommand:
             )
         assert result.exit_code == 0
 
-    def test_scan_no_pull_flag(self, sample_config_yaml, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
-            mock_scan.return_value = ScanResult(repos=[], total_scanned=0)
-            result = runner.invoke(
-                app,
-                ["scan", "--no-pull", "--config", str(sample_config_yaml)],
-            )
-            assert result.exit_code == 0
-            call_args = mock_scan.call_args
-            assert call_args[1]["auto_pull"] is False
+    def test_scan_no_pull_flag(self, sample_config_yaml, mock_scan):
+        # Only argument forwarding matters here, so call the command directly
+        scan(config_path=sample_config_yaml, no_pull=True)
+        call_args = mock_scan.call_args
+        assert call_args[1]["auto_pull"] is False
 
-    def test_scan_warnings_only(self, sample_config_yaml, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
-            mock_scan.return_value = ScanResult(repos=[], total_scanned=0)
-            result = runner.invoke(
-                app,
-                ["scan", "--warnings-only", "--config", str(sample_config_yaml)],
-            )
-            assert result.exit_code == 0
+    def test_scan_warnings_only(self, sample_config_yaml, mock_scan):
+        result = runner.invoke(
+            app,
+            ["scan", "--warnings-only", "--config", str(sample_config_yaml)],
+        )
+        assert result.exit_code == 0
 
 
 class TestInitCommand:
@@ -111,10 +173,27 @@ class TestCheckCommand:
         assert result.exit_code == 0
 
 
+class TestWatchCommand:
+    def test_runs_fixed_number_of_polls(self, nested_repos, tmp_path):
+        config_path = tmp_path / "config.yml"
+        config_path.write_text(f"scan_paths:\n  - {nested_repos}\n")
+
+        result = runner.invoke(
+            app, ["watch", "-c", str(config_path), "--count", "1", "--interval", "0"]
+        )
+
+        assert result.exit_code == 0
+        assert "Repositories" in result.stdout
+
+    def test_missing_config_exits(self, tmp_path):
+        result = runner.invoke(app, ["watch", "-c", str(tmp_path / "missing.yml")])
+        assert result.exit_code == 1
+
+
 class TestAddCommand:
     def test_adds_repo(self, tmp_path):
         target = tmp_path / "repos.yml"
-        with patch("git_repo_checker.cli.sync_module.add_repo") as mock_add:
+        with patch("git_repo_checker.sync.add_repo") as mock_add:
             mock_add.return_value = ("added", "git@github.com:u/r.git")
             result = runner.invoke(
                 app, ["add", str(tmp_path / "repo"), "--repos", str(target)]
@@ -124,7 +203,7 @@ class TestAddCommand:
 
     def test_defaults_to_current_directory(self, tmp_path, monkeypatch):
         monkeypatch.chdir(tmp_path)
-        with patch("git_repo_checker.cli.sync_module.add_repo") as mock_add:
+        with patch("git_repo_checker.sync.add_repo") as mock_add:
             mock_add.return_value = ("added", "git@github.com:u/r.git")
             result = runner.invoke(app, ["add", "--repos", str(tmp_path / "repos.yml")])
         assert result.exit_code == 0
@@ -132,35 +211,35 @@ class TestAddCommand:
         assert Path(called_path) == Path(".")
 
     def test_fails_for_non_git(self, tmp_path):
-        with patch("git_repo_checker.cli.sync_module.add_repo") as mock_add:
+        with patch("git_repo_checker.sync.add_repo") as mock_add:
             mock_add.return_value = ("not_git", None)
             result = runner.invoke(app, ["add", str(tmp_path)])
         assert result.exit_code == 1
         assert "Not a git repository" in result.stdout
 
     def test_fails_for_no_remote(self, tmp_path):
-        with patch("git_repo_checker.cli.sync_module.add_repo") as mock_add:
+        with patch("git_repo_checker.sync.add_repo") as mock_add:
             mock_add.return_value = ("no_remote", None)
             result = runner.invoke(app, ["add", str(tmp_path)])
         assert result.exit_code == 1
         assert "remote" in result.stdout.lower()
 
     def test_reports_collision(self, tmp_path):
-        with patch("git_repo_checker.cli.sync_module.add_repo") as mock_add:
+        with patch("git_repo_checker.sync.add_repo") as mock_add:
             mock_add.return_value = ("collision", "git@github.com:u/other.git")
             result = runner.invoke(app, ["add", str(tmp_path)])
         assert result.exit_code == 1
         assert "already tracked" in result.stdout.lower()
 
     def test_already_tracked_succeeds(self, tmp_path):
-        with patch("git_repo_checker.cli.sync_module.add_repo") as mock_add:
+        with patch("git_repo_checker.sync.add_repo") as mock_add:
             mock_add.return_value = ("exists", "git@github.com:u/r.git")
             result = runner.invoke(app, ["add", str(tmp_path)])
         assert result.exit_code == 0
         assert "Already tracked" in result.stdout
 
     def test_grcignore_marker_reported(self, tmp_path):
-        with patch("git_repo_checker.cli.sync_module.add_repo") as mock_add:
+        with patch("git_repo_checker.sync.add_repo") as mock_add:
             mock_add.return_value = ("ignored", None)
             result = runner.invoke(app, ["add", str(tmp_path)])
         assert result.exit_code == 0
@@ -169,21 +248,15 @@ class TestAddCommand:
 
 class TestGetConfig:
     def test_applies_verbose_flag(self, sample_config_yaml):
-        from git_repo_checker.cli import get_config
-
         config = get_config(sample_config_yaml, verbose=True, quiet=False)
         assert config.output.verbosity == "verbose"
 
     def test_applies_quiet_flag(self, sample_config_yaml):
-        from git_repo_checker.cli import get_config
-
         config = get_config(sample_config_yaml, verbose=False, quiet=True)
         assert config.output.verbosity == "quiet"
 
     def test_raises_without_config(self, tmp_path, monkeypatch):
-        from git_repo_checker.cli import get_config
-
-        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(config_module, "DEFAULT_CONFIG_LOCATIONS", [tmp_path / "missing.yml"])
         with pytest.raises(FileNotFoundError):
             get_config(None, verbose=False, quiet=False)
 
@@ -203,9 +276,8 @@ class TestSyncCommand:
         assert result.exit_code == 1
         assert "Error" in result.stdout
 
-    def test_sync_no_repos_file(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        with patch("git_repo_checker.sync.DEFAULT_REPOS_LOCATIONS", [Path("./repos.yml")]):
+    def test_sync_no_repos_file(self, tmp_path):
+        with patch("git_repo_checker.sync.DEFAULT_REPOS_LOCATIONS", [tmp_path / "repos.yml"]):
             result = runner.invoke(app, ["sync"])
         assert result.exit_code == 1
         assert "Error" in result.stdout
@@ -217,149 +289,103 @@ class TestSyncCommand:
         assert result.exit_code == 0
         assert "No repositories" in result.stdout
 
-    def test_sync_with_repos(self, tmp_path):
-        repos_path = tmp_path / "repos.yml"
-        repos_path.write_text(
-            f"""\
-repos:
-  - path: {tmp_path}/repo1
-    remote: git@github.com:u/r.git
-"""
-        )
-        with patch("git_repo_checker.cli.sync_module.sync_all") as mock_sync:
-            mock_sync.return_value = SyncResult(
-                results=[
-                    SyncRepoResult(
-                        repo=TrackedRepo(path=tmp_path / "repo1", remote="git@github.com:u/r.git"),
-                        action=SyncAction.CLONED,
-                        message="Cloned",
-                    )
-                ],
-                cloned=1,
-            )
-            result = runner.invoke(app, ["sync", "-r", str(repos_path)])
+    def test_sync_with_repos(self, single_repo_yml):
+        with patch("git_repo_checker.sync.sync_all") as mock_sync:
+            mock_sync.return_value = _CLONED_RESULT
+            result = runner.invoke(app, ["sync", "-r", str(single_repo_yml)])
             assert result.exit_code == 0
             assert "Syncing" in result.stdout
 
-    def test_sync_quiet_mode(self, tmp_path):
-        repos_path = tmp_path / "repos.yml"
-        repos_path.write_text(
-            f"""\
-repos:
-  - path: {tmp_path}/repo1
-    remote: git@github.com:u/r.git
-"""
-        )
-        with patch("git_repo_checker.cli.sync_module.sync_all") as mock_sync:
-            mock_sync.return_value = SyncResult(
-                results=[
-                    SyncRepoResult(
-                        repo=TrackedRepo(path=tmp_path / "repo1", remote="git@github.com:u/r.git"),
-                        action=SyncAction.SKIPPED,
-                        message="Up to date",
-                    )
-                ],
-                skipped=1,
-            )
-            result = runner.invoke(app, ["sync", "-r", str(repos_path), "-q"])
+    def test_sync_quiet_mode(self, single_repo_yml):
+        with patch("git_repo_checker.sync.sync_all") as mock_sync:
+            mock_sync.return_value = _SKIPPED_RESULT
+            result = runner.invoke(app, ["sync", "-r", str(single_repo_yml), "-q"])
             assert result.exit_code == 0
 
-    def test_sync_shows_errors(self, tmp_path):
-        repos_path = tmp_path / "repos.yml"
-        repos_path.write_text(
-            f"""\
-repos:
-  - path: {tmp_path}/repo1
-    remote: git@github.com:u/r.git
-"""
-        )
-        with patch("git_repo_checker.cli.sync_module.sync_all") as mock_sync:
-            mock_sync.return_value = SyncResult(
-                results=[
-                    SyncRepoResult(
-                        repo=TrackedRepo(path=tmp_path / "repo1", remote="git@github.com:u/r.git"),
-                        action=SyncAction.ERROR,
-                        message="Network error",
-                    )
-                ],
-                errors=1,
-            )
-            result = runner.invoke(app, ["sync", "-r", str(repos_path)])
+    def test_sync_shows_errors(self, single_repo_yml):
+        with patch("git_repo_checker.sync.sync_all") as mock_sync:
+            mock_sync.return_value = _ERROR_RESULT
+            result = runner.invoke(app, ["sync", "-r", str(single_repo_yml)])
             assert result.exit_code == 0
             assert "error" in result.stdout.lower()
 
-    def test_sync_shows_pulled(self, tmp_path):
-        repos_path = tmp_path / "repos.yml"
-        repos_path.write_text(
-            f"""\
-repos:
-  - path: {tmp_path}/repo1
-    remote: git@github.com:u/r.git
-"""
-        )
-        with patch("git_repo_checker.cli.sync_module.sync_all") as mock_sync:
-            mock_sync.return_value = SyncResult(
-                results=[
-                    SyncRepoResult(
-                        repo=TrackedRepo(path=tmp_path / "repo1", remote="git@github.com:u/r.git"),
-                        action=SyncAction.PULLED,
-                        message="Pulled 3 files",
-                    )
-                ],
-                pulled=1,
-            )
-            result = runner.invoke(app, ["sync", "-r", str(repos_path)])
+    def test_sync_shows_pulled(self, single_repo_yml):
+        with patch("git_repo_checker.sync.sync_all") as mock_sync:
+            mock_sync.return_value = _PULLED_RESULT
+            result = runner.invoke(app, ["sync", "-r", str(single_repo_yml)])
             assert result.exit_code == 0
 
-    def test_sync_dry_run(self, tmp_path):
-        repos_path = tmp_path / "repos.yml"
-        repos_path.write_text(
-            f"""\
-repos:
-  - path: {tmp_path}/repo1
-    remote: git@github.com:u/r.git
-"""
-        )
-        result = runner.invoke(app, ["sync", "-r", str(repos_path), "--dry-run"])
+    def test_sync_dry_run(self, single_repo_yml):
+        result = runner.invoke(app, ["sync", "-r", str(single_repo_yml), "--dry-run"])
         assert result.exit_code == 0
         assert "Dry run" in result.stdout
         assert "Would clone" in result.stdout
 
 
+class TestLazyImports:
+    def test_import_does_not_load_models_or_yaml(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, git_repo_checker.cli; "
+            "print(any(m in sys.modules for m in "
+            "('pydantic', 'yaml', 'git_repo_checker.models', 'git_repo_checker.sync')))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert out.stdout.strip() == "False"
+
+
+class TestScanCached:
+    def test_cached_passes_and_saves_manifest(self, sample_config_yaml, tmp_path, mock_scan):
+        from git_repo_checker.manifest import ScanManifest
+
+        mock_scan.return_value = _scan_result_with_repos(tmp_path)
+        with patch(_AUTO_TRACK, return_value=(0, 0, [])):
+            result = runner.invoke(app, ["scan", "--cached", "--config", str(sample_config_yaml)])
+        assert result.exit_code == 0
+        assert isinstance(mock_scan.call_args.kwargs["manifest"], ScanManifest)
+        assert (config_module.CONFIG_CACHE_DIR / "scan.json").exists()
+
+    def test_no_manifest_by_default(self, sample_config_yaml, tmp_path, mock_scan):
+        mock_scan.return_value = _scan_result_with_repos(tmp_path)
+        with patch(_AUTO_TRACK, return_value=(0, 0, [])):
+            runner.invoke(app, ["scan", "--config", str(sample_config_yaml)])
+        assert mock_scan.call_args.kwargs["manifest"] is None
+
+
 class TestScanJsonOutput:
-    def test_json_output_flag(self, sample_config_yaml, tmp_path):
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
-            mock_scan.return_value = _scan_result_with_repos(tmp_path)
-            with patch(_AUTO_TRACK, return_value=(0, 0, [])):
-                result = runner.invoke(
-                    app,
-                    ["scan", "--json", "--config", str(sample_config_yaml)],
-                )
+    def test_json_output_flag(self, sample_config_yaml, tmp_path, mock_scan):
+        mock_scan.return_value = _scan_result_with_repos(tmp_path)
+        with patch(_AUTO_TRACK, return_value=(0, 0, [])):
+            result = runner.invoke(
+                app,
+                ["scan", "--json", "--config", str(sample_config_yaml)],
+            )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["total_scanned"] == 1
         assert len(data["repos"]) == 1
         assert data["repos"][0]["status"] == "clean"
 
-    def test_json_includes_all_fields(self, sample_config_yaml, tmp_path):
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
-            mock_scan.return_value = ScanResult(
-                repos=[
-                    RepoInfo(
-                        path=tmp_path / "repo1",
-                        branch="main",
-                        status=RepoStatus.DIRTY,
-                        changed_files=3,
-                        has_stash=True,
-                    )
-                ],
-                total_scanned=1,
-            )
-            with patch(_AUTO_TRACK, return_value=(0, 0, [])):
-                result = runner.invoke(
-                    app,
-                    ["scan", "--json", "--config", str(sample_config_yaml)],
+    def test_json_includes_all_fields(self, sample_config_yaml, tmp_path, mock_scan):
+        mock_scan.return_value = ScanResult(
+            repos=[
+                RepoInfo(
+                    path=tmp_path / "repo1",
+                    branch="main",
+                    status=RepoStatus.DIRTY,
+                    changed_files=3,
+                    has_stash=True,
                 )
+            ],
+            total_scanned=1,
+        )
+        with patch(_AUTO_TRACK, return_value=(0, 0, [])):
+            result = runner.invoke(
+                app,
+                ["scan", "--json", "--config", str(sample_config_yaml)],
+            )
         data = json.loads(result.stdout)
         repo = data["repos"][0]
         assert "path" in repo
@@ -368,68 +394,169 @@ class TestScanJsonOutput:
         assert "has_stash" in repo
         assert repo["has_stash"] is True
 
+    def test_streamed_output_matches_json_dumps(self, tmp_path, capsys):
+        from git_repo_checker import cli
+
+        scan = ScanResult(
+            repos=[
+                RepoInfo(path=tmp_path / "a", branch="main", status=RepoStatus.CLEAN),
+                RepoInfo(
+                    path=tmp_path / "b",
+                    branch="dev",
+                    status=RepoStatus.DIRTY,
+                    changed_files=2,
+                    warnings=[WarningType.DIRTY_MAIN],
+                ),
+            ],
+            pull_results=[PullResult(path=tmp_path / "a", success=True, message="ok")],
+            total_scanned=2,
+            scan_errors=["Permission denied: /x"],
+        )
+        expected = {
+            "total_scanned": 2,
+            "repos": [cli._repo_json(r) for r in scan.repos],
+            "pull_results": [cli._pull_json(p) for p in scan.pull_results],
+            "scan_errors": ["Permission denied: /x"],
+        }
+
+        cli._output_json(scan)
+
+        assert capsys.readouterr().out == json.dumps(expected, indent=2) + "\n"
+
+    def test_streamed_output_with_empty_lists(self, capsys):
+        from git_repo_checker import cli
+
+        cli._output_json(ScanResult(repos=[], total_scanned=0))
+
+        out = capsys.readouterr().out
+        assert json.loads(out) == {
+            "total_scanned": 0,
+            "repos": [],
+            "pull_results": [],
+            "scan_errors": [],
+        }
+
 
 class TestScanStatusFilter:
-    def test_filters_by_single_status(self, sample_config_yaml, tmp_path):
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
-            mock_scan.return_value = ScanResult(
-                repos=[
-                    RepoInfo(path=tmp_path / "repo1", branch="main", status=RepoStatus.CLEAN),
-                    RepoInfo(path=tmp_path / "repo2", branch="main", status=RepoStatus.DIRTY),
-                ],
-                total_scanned=2,
+    def test_filters_by_single_status(self, sample_config_yaml, tmp_path, mock_scan):
+        mock_scan.return_value = ScanResult(
+            repos=[
+                RepoInfo(path=tmp_path / "repo1", branch="main", status=RepoStatus.CLEAN),
+                RepoInfo(path=tmp_path / "repo2", branch="main", status=RepoStatus.DIRTY),
+            ],
+            total_scanned=2,
+        )
+        with patch(_AUTO_TRACK, return_value=(0, 0, [])):
+            result = runner.invoke(
+                app,
+                ["scan", "--json", "--status", "dirty", "--config", str(sample_config_yaml)],
             )
-            with patch(_AUTO_TRACK, return_value=(0, 0, [])):
-                result = runner.invoke(
-                    app,
-                    ["scan", "--json", "--status", "dirty", "--config", str(sample_config_yaml)],
-                )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert len(data["repos"]) == 1
         assert data["repos"][0]["status"] == "dirty"
 
-    def test_filters_by_multiple_statuses(self, sample_config_yaml, tmp_path):
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
-            mock_scan.return_value = ScanResult(
-                repos=[
-                    RepoInfo(path=tmp_path / "repo1", branch="main", status=RepoStatus.CLEAN),
-                    RepoInfo(path=tmp_path / "repo2", branch="main", status=RepoStatus.DIRTY),
-                    RepoInfo(path=tmp_path / "repo3", branch="main", status=RepoStatus.AHEAD),
+    def test_filters_by_multiple_statuses(self, sample_config_yaml, tmp_path, mock_scan):
+        mock_scan.return_value = ScanResult(
+            repos=[
+                RepoInfo(path=tmp_path / "repo1", branch="main", status=RepoStatus.CLEAN),
+                RepoInfo(path=tmp_path / "repo2", branch="main", status=RepoStatus.DIRTY),
+                RepoInfo(path=tmp_path / "repo3", branch="main", status=RepoStatus.AHEAD),
+            ],
+            total_scanned=3,
+        )
+        with patch(_AUTO_TRACK, return_value=(0, 0, [])):
+            result = runner.invoke(
+                app,
+                [
+                    "scan",
+                    "--json",
+                    "--status",
+                    "dirty,ahead",
+                    "--config",
+                    str(sample_config_yaml),
                 ],
-                total_scanned=3,
             )
-            with patch(_AUTO_TRACK, return_value=(0, 0, [])):
-                result = runner.invoke(
-                    app,
-                    [
-                        "scan",
-                        "--json",
-                        "--status",
-                        "dirty,ahead",
-                        "--config",
-                        str(sample_config_yaml),
-                    ],
-                )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert len(data["repos"]) == 2
         statuses = {r["status"] for r in data["repos"]}
         assert statuses == {"dirty", "ahead"}
 
+    def test_unknown_status_is_ignored(self, tmp_path):
+        from git_repo_checker import cli
+
+        scan = ScanResult(
+            repos=[
+                RepoInfo(path=tmp_path / "a", branch="main", status=RepoStatus.CLEAN),
+                RepoInfo(path=tmp_path / "b", branch="main", status=RepoStatus.DIRTY),
+            ],
+            total_scanned=2,
+        )
+
+        filtered = cli._filter_by_status(scan, " Dirty ,bogus")
+
+        assert [r.path.name for r in filtered.repos] == ["b"]
+        assert filtered.total_scanned == 2
+
 
 class TestScanCiFlag:
-    def test_ci_flag_adds_status(self, sample_config_yaml, tmp_path):
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
+    def test_ci_flag_adds_status(self, sample_config_yaml, tmp_path, mock_scan):
+        mock_scan.return_value = _scan_result_with_repos(tmp_path)
+        with patch("git_repo_checker.cli._scan_with_ci") as mock_ci:
+            mock_ci.return_value = mock_scan.return_value
+            with patch(_AUTO_TRACK, return_value=(0, 0, [])):
+                result = runner.invoke(
+                    app,
+                    ["scan", "--ci", "--config", str(sample_config_yaml)],
+                )
+                assert result.exit_code == 0
+                mock_ci.assert_called_once()
+                mock_scan.assert_not_called()
+
+    def test_ci_lookups_start_during_scan(self, sample_config, tmp_path):
+        from git_repo_checker import github_ops
+        from git_repo_checker.cli import _scan_with_ci
+
+        sample_config.ci.cache_ttl_seconds = 5
+        scanned = _scan_result_with_repos(tmp_path)
+        submitted = []
+        caches = []
+
+        def fake_scan(config, **kwargs):
+            for repo in scanned.repos:
+                kwargs["on_repo"](repo)
+            return scanned
+
+        def fake_query(path, cache=None):
+            submitted.append(path)
+            caches.append(cache)
+            return CIStatus.PASSING
+
+        with (
+            patch("git_repo_checker.analyzer.scan_and_analyze", side_effect=fake_scan),
+            patch.object(github_ops, "is_ci_available", return_value=True),
+            patch.object(github_ops, "_query_repo_ci_status", side_effect=fake_query),
+        ):
+            result = _scan_with_ci(sample_config, None, False)
+
+        assert submitted == [r.path for r in scanned.repos]
+        assert [r.ci_status for r in result.repos] == [CIStatus.PASSING]
+        assert [c.ttl_seconds for c in caches] == [5]
+
+    def test_skips_ci_when_unavailable(self, sample_config, tmp_path):
+        from git_repo_checker import github_ops
+        from git_repo_checker.cli import _scan_with_ci
+
+        with (
+            patch("git_repo_checker.analyzer.scan_and_analyze") as mock_scan,
+            patch.object(github_ops, "is_ci_available", return_value=False),
+        ):
             mock_scan.return_value = _scan_result_with_repos(tmp_path)
-            with patch("git_repo_checker.cli._add_ci_status") as mock_ci:
-                with patch(_AUTO_TRACK, return_value=(0, 0, [])):
-                    result = runner.invoke(
-                        app,
-                        ["scan", "--ci", "--config", str(sample_config_yaml)],
-                    )
-                    assert result.exit_code == 0
-                    mock_ci.assert_called_once()
+            result = _scan_with_ci(sample_config, None, False)
+
+        assert result.repos[0].ci_status is None
+        assert mock_scan.call_args.kwargs["on_repo"] is None
 
 
 class TestSyncDryRunDetails:
@@ -447,7 +574,8 @@ repos:
         )
         result = runner.invoke(app, ["sync", "-r", str(repos_path), "--dry-run"])
         assert result.exit_code == 0
-        assert "check" in result.stdout.lower() or "pull" in result.stdout.lower()
+        output = result.stdout.lower()
+        assert "check" in output or "pull" in output
 
     def test_dry_run_shows_ignored(self, tmp_path):
         repos_path = tmp_path / "repos.yml"
@@ -464,132 +592,208 @@ repos:
         assert "skip" in result.stdout.lower()
 
 
+class TestSyncReposUrl:
+    def test_parses_downloaded_content_in_memory(self, tmp_path):
+        saved = tmp_path / "repos.yml"
+        content = f"repos:\n  - path: {tmp_path}/repo1\n    remote: git@github.com:u/r.git\n"
+        with (
+            patch(
+                "git_repo_checker.sync.download_repos_file",
+                return_value=(saved, content.encode()),
+            ),
+            patch("git_repo_checker.sync.load_repos_from_path") as mock_load,
+        ):
+            result = runner.invoke(app, ["sync", "--repos-url", "https://x/repos.yml", "-n"])
+        assert result.exit_code == 0
+        assert "Saved to" in result.stdout
+        assert "repo1" in result.stdout
+        mock_load.assert_not_called()
+
+    def test_unchanged_file_loaded_from_disk(self, tmp_path):
+        saved = tmp_path / "repos.yml"
+        saved.write_text(
+            f"repos:\n  - path: {tmp_path}/repo2\n    remote: git@github.com:u/r.git\n"
+        )
+        with patch("git_repo_checker.sync.download_repos_file", return_value=(saved, None)):
+            result = runner.invoke(app, ["sync", "--repos-url", "https://x/repos.yml", "-n"])
+        assert result.exit_code == 0
+        assert "Unchanged" in result.stdout
+        assert "repo2" in result.stdout
+
+    def test_fetch_error_exits(self):
+        from urllib.error import URLError
+
+        with patch("git_repo_checker.sync.download_repos_file", side_effect=URLError("down")):
+            result = runner.invoke(app, ["sync", "--repos-url", "https://x/repos.yml"])
+        assert result.exit_code == 1
+        assert "Error fetching URL" in result.stdout
+
+
+class TestSyncProgress:
+    def test_noop_when_not_a_terminal(self, tmp_path):
+        from git_repo_checker.cli import _sync_progress
+
+        repo = TrackedRepo(path=tmp_path / "r", remote="git@github.com:u/r.git")
+        with _sync_progress(1, quiet=False) as on_result:
+            on_result(SyncRepoResult(repo=repo, action=SyncAction.PULLED, message="ok"))
+
+    def test_counts_results_on_terminal(self, tmp_path, monkeypatch):
+        import io
+
+        from rich.console import Console
+
+        from git_repo_checker import cli
+
+        out = io.StringIO()
+        monkeypatch.setattr(cli, "console", Console(file=out, force_terminal=True))
+        repo = TrackedRepo(path=tmp_path / "r", remote="git@github.com:u/r.git")
+        with cli._sync_progress(2, quiet=False) as on_result:
+            on_result(SyncRepoResult(repo=repo, action=SyncAction.PULLED, message="ok"))
+        assert "Synced" in out.getvalue()
+
+
 class TestFilterByStatusHelper:
-    def test_warns_on_invalid_status(self, sample_config_yaml, tmp_path):
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
-            mock_scan.return_value = ScanResult(
-                repos=[RepoInfo(path=tmp_path / "repo1", branch="main", status=RepoStatus.CLEAN)],
-                total_scanned=1,
+    def test_warns_on_invalid_status(self, sample_config_yaml, tmp_path, mock_scan):
+        mock_scan.return_value = ScanResult(
+            repos=[RepoInfo(path=tmp_path / "repo1", branch="main", status=RepoStatus.CLEAN)],
+            total_scanned=1,
+        )
+        with patch(_AUTO_TRACK, return_value=(0, 0, [])):
+            result = runner.invoke(
+                app,
+                ["scan", "--status", "invalid_status", "--config", str(sample_config_yaml)],
             )
-            with patch(_AUTO_TRACK, return_value=(0, 0, [])):
-                result = runner.invoke(
-                    app,
-                    ["scan", "--status", "invalid_status", "--config", str(sample_config_yaml)],
-                )
         assert result.exit_code == 0
         assert "Warning" in result.stdout or "unknown" in result.stdout.lower()
 
+    def test_status_lookup_built_once(self):
+        from git_repo_checker import cli
 
-class TestScanAutoTrack:
-    def test_auto_track_runs_by_default(self, sample_config_yaml, tmp_path):
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
-            mock_scan.return_value = _scan_result_with_repos(tmp_path)
-            with patch(_AUTO_TRACK, return_value=(1, 0, [])) as mock_track:
-                with patch(
-                    "git_repo_checker.cli.sync_module.default_repos_target",
-                    return_value=tmp_path / "repos.yml",
-                ):
-                    result = runner.invoke(
-                        app,
-                        ["scan", "--config", str(sample_config_yaml)],
-                    )
-            assert result.exit_code == 0
-            mock_track.assert_called_once()
-            assert "Tracked" in result.stdout
+        lookup = cli._statuses_by_value()
+        assert cli._statuses_by_value() is lookup
+        assert lookup == {s.value: s for s in RepoStatus}
 
-    def test_no_track_flag_disables(self, sample_config_yaml, tmp_path):
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
-            mock_scan.return_value = _scan_result_with_repos(tmp_path)
-            with patch(_AUTO_TRACK) as mock_track:
+
+class TestShortenPath:
+    def test_shortens_home_path(self):
+        from git_repo_checker.cli import shorten_path
+
+        assert shorten_path(Path.home() / "code" / "repo") == "~/code/repo"
+
+    def test_keeps_path_outside_home(self):
+        from git_repo_checker.cli import shorten_path
+
+        assert shorten_path(Path("/opt/repo")) == "/opt/repo"
+
+    def test_sibling_with_home_as_name_prefix_is_not_shortened(self):
+        from git_repo_checker.cli import shorten_path
+
+        sibling = Path(str(Path.home()) + "-other") / "repo"
+        assert shorten_path(sibling) == str(sibling)
+
+
+class TestScanAutoTrack:
+    def test_auto_track_runs_by_default(self, sample_config_yaml, tmp_path, mock_scan):
+        mock_scan.return_value = _scan_result_with_repos(tmp_path)
+        with patch(_AUTO_TRACK, return_value=(1, 0, [])) as mock_track:
+            with patch(
+                "git_repo_checker.sync.default_repos_target",
+                return_value=tmp_path / "repos.yml",
+            ):
                 result = runner.invoke(
                     app,
-                    ["scan", "--no-track", "--config", str(sample_config_yaml)],
+                    ["scan", "--config", str(sample_config_yaml)],
                 )
         assert result.exit_code == 0
+        mock_track.assert_called_once()
+        assert "Tracked" in result.stdout
+
+    def test_no_track_flag_disables(self, sample_config_yaml, tmp_path, mock_scan):
+        mock_scan.return_value = _scan_result_with_repos(tmp_path)
+        with patch(_AUTO_TRACK) as mock_track:
+            result = runner.invoke(
+                app,
+                ["scan", "--no-track", "--config", str(sample_config_yaml)],
+            )
+        assert result.exit_code == 0
         mock_track.assert_not_called()
 
-    def test_export_repos_still_works(self, sample_config_yaml, tmp_path):
+    def test_export_repos_still_works(self, sample_config_yaml, tmp_path, mock_scan):
         export_path = tmp_path / "out.yml"
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
-            mock_scan.return_value = _scan_result_with_repos(tmp_path)
-            with patch(
-                "git_repo_checker.cli.sync_module.export_repos_to_file",
-                return_value=(1, 0, []),
-            ) as mock_export:
-                with patch(_AUTO_TRACK) as mock_track:
-                    result = runner.invoke(
-                        app,
-                        [
-                            "scan",
-                            "--export-repos",
-                            str(export_path),
-                            "--config",
-                            str(sample_config_yaml),
-                        ],
-                    )
+        mock_scan.return_value = _scan_result_with_repos(tmp_path)
+        with patch(
+            "git_repo_checker.sync.export_repos_to_file",
+            return_value=(1, 0, []),
+        ) as mock_export:
+            with patch(_AUTO_TRACK) as mock_track:
+                result = runner.invoke(
+                    app,
+                    [
+                        "scan",
+                        "--export-repos",
+                        str(export_path),
+                        "--config",
+                        str(sample_config_yaml),
+                    ],
+                )
         assert result.exit_code == 0
         mock_export.assert_called_once()
         mock_track.assert_not_called()
 
-    def test_auto_track_silent_in_json(self, sample_config_yaml, tmp_path):
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
-            mock_scan.return_value = _scan_result_with_repos(tmp_path)
-            with patch(_AUTO_TRACK, return_value=(1, 0, [])):
-                with patch(
-                    "git_repo_checker.cli.sync_module.default_repos_target",
-                    return_value=tmp_path / "repos.yml",
-                ):
-                    result = runner.invoke(
-                        app,
-                        ["scan", "--json", "--config", str(sample_config_yaml)],
-                    )
+    def test_auto_track_silent_in_json(self, sample_config_yaml, tmp_path, mock_scan):
+        mock_scan.return_value = _scan_result_with_repos(tmp_path)
+        with patch(_AUTO_TRACK, return_value=(1, 0, [])):
+            with patch(
+                "git_repo_checker.sync.default_repos_target",
+                return_value=tmp_path / "repos.yml",
+            ):
+                result = runner.invoke(
+                    app,
+                    ["scan", "--json", "--config", str(sample_config_yaml)],
+                )
         assert result.exit_code == 0
         # Should be valid JSON with no human text mixed in
         data = json.loads(result.stdout)
         assert "total_scanned" in data
         assert "Tracked" not in result.stdout
 
-    def test_auto_track_skipped_when_no_repos(self, sample_config_yaml, tmp_path):
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
-            mock_scan.return_value = ScanResult(repos=[], total_scanned=0)
-            with patch(_AUTO_TRACK) as mock_track:
-                result = runner.invoke(
-                    app,
-                    ["scan", "--config", str(sample_config_yaml)],
-                )
+    def test_auto_track_skipped_when_no_repos(self, sample_config_yaml, tmp_path, mock_scan):
+        with patch(_AUTO_TRACK) as mock_track:
+            result = runner.invoke(
+                app,
+                ["scan", "--config", str(sample_config_yaml)],
+            )
         assert result.exit_code == 0
         mock_track.assert_not_called()
 
 
 class TestScanErrorsOutput:
-    def test_json_includes_scan_errors(self, sample_config_yaml, tmp_path):
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
-            mock_scan.return_value = ScanResult(
-                repos=[RepoInfo(path=tmp_path / "r", branch="main", status=RepoStatus.CLEAN)],
-                scan_errors=["Permission denied: /x"],
-                total_scanned=1,
+    def test_json_includes_scan_errors(self, sample_config_yaml, tmp_path, mock_scan):
+        mock_scan.return_value = ScanResult(
+            repos=[RepoInfo(path=tmp_path / "r", branch="main", status=RepoStatus.CLEAN)],
+            scan_errors=["Permission denied: /x"],
+            total_scanned=1,
+        )
+        with patch(_AUTO_TRACK, return_value=(0, 0, [])):
+            result = runner.invoke(
+                app,
+                ["scan", "--json", "--config", str(sample_config_yaml)],
             )
-            with patch(_AUTO_TRACK, return_value=(0, 0, [])):
-                result = runner.invoke(
-                    app,
-                    ["scan", "--json", "--config", str(sample_config_yaml)],
-                )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["scan_errors"] == ["Permission denied: /x"]
 
-    def test_human_output_shows_scan_warnings(self, sample_config_yaml, tmp_path):
-        with patch("git_repo_checker.cli.scan_and_analyze") as mock_scan:
-            mock_scan.return_value = ScanResult(
-                repos=[RepoInfo(path=tmp_path / "r", branch="main", status=RepoStatus.CLEAN)],
-                scan_errors=["Permission denied: /x"],
-                total_scanned=1,
+    def test_human_output_shows_scan_warnings(self, sample_config_yaml, tmp_path, mock_scan):
+        mock_scan.return_value = ScanResult(
+            repos=[RepoInfo(path=tmp_path / "r", branch="main", status=RepoStatus.CLEAN)],
+            scan_errors=["Permission denied: /x"],
+            total_scanned=1,
+        )
+        with patch(_AUTO_TRACK, return_value=(0, 0, [])):
+            result = runner.invoke(
+                app,
+                ["scan", "--config", str(sample_config_yaml)],
             )
-            with patch(_AUTO_TRACK, return_value=(0, 0, [])):
-                result = runner.invoke(
-                    app,
-                    ["scan", "--config", str(sample_config_yaml)],
-                )
         assert result.exit_code == 0
         assert "Scan warnings" in result.stdout
 
@@ -64,6 +64,88 @@ class TestLoadConfigFromPath:
         assert config.scan_paths == []
 
 
+class TestYamlLoader:
+    def test_prefers_libyaml(self):
+        import yaml
+
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        assert config_module.YAML_LOADER is expected
+
+
+class TestConfigCache:
+    def test_second_load_skips_yaml(self, sample_config_yaml, monkeypatch):
+        first = config_module.load_config_from_path(sample_config_yaml)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML should not be parsed")
+
+        monkeypatch.setattr(config_module.yaml, "load", fail)
+        second = config_module.load_config_from_path(sample_config_yaml)
+
+        assert second == first
+        assert second is not first
+
+    def test_reparses_after_change(self, tmp_path):
+        path = tmp_path / "config.yml"
+        path.write_text("main_branches: [main]\n")
+        assert config_module.load_config_from_path(path).main_branches == ["main"]
+
+        path.write_text("main_branches: [trunk, main]\n")
+        assert config_module.load_config_from_path(path).main_branches == ["trunk", "main"]
+
+    def test_corrupt_cache_is_ignored(self, sample_config_yaml):
+        config_module.load_config_from_path(sample_config_yaml)
+        for cache_file in config_module.CONFIG_CACHE_DIR.glob("config-*.pkl"):
+            cache_file.write_bytes(b"not a pickle")
+
+        config = config_module.load_config_from_path(sample_config_yaml)
+        assert config.auto_pull.enabled is True
+
+    def test_one_cache_file_per_config_across_cwds(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.yml"
+        path.write_text("scan_paths: [code]\n")
+        for cwd in ("a", "b"):
+            (tmp_path / cwd).mkdir()
+            monkeypatch.chdir(tmp_path / cwd)
+            config = config_module.load_config_from_path(path)
+            assert config.scan_paths == [tmp_path / cwd / "code"]
+
+        assert len(list(config_module.CONFIG_CACHE_DIR.glob("config-*.pkl"))) == 1
+
+    def test_unwritable_cache_dir_still_loads(self, sample_config_yaml, tmp_path, monkeypatch):
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        monkeypatch.setattr(config_module, "CONFIG_CACHE_DIR", blocker / "cache")
+
+        config = config_module.load_config_from_path(sample_config_yaml)
+        assert config.output.verbosity == "normal"
+
+
+class TestLoadYamlCached:
+    def test_second_load_skips_yaml(self, tmp_path, monkeypatch):
+        path = tmp_path / "repos.yml"
+        path.write_text("repos:\n  - path: a\n    remote: r\n")
+        first = config_module.load_yaml_cached(path)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML should not be parsed")
+
+        monkeypatch.setattr(config_module.yaml, "load", fail)
+        assert config_module.load_yaml_cached(path) == first
+
+    def test_content_change_invalidates(self, tmp_path):
+        path = tmp_path / "repos.yml"
+        path.write_text("path_prefix: ~/a\n")
+        assert config_module.load_yaml_cached(path) == {"path_prefix": "~/a"}
+
+        path.write_text("path_prefix: ~/b\n")
+        assert config_module.load_yaml_cached(path) == {"path_prefix": "~/b"}
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            config_module.load_yaml_cached(tmp_path / "missing.yml")
+
+
 class TestParseRawConfig:
     def test_parses_minimal_config(self):
         raw = {"scan_paths": ["/tmp"]}
@@ -96,6 +178,11 @@ class TestParseRawConfig:
         config = config_module.parse_raw_config(raw)
         assert config.auto_track.enabled is False
 
+    def test_parses_ci_cache_ttl(self):
+        assert config_module.parse_raw_config({}).ci.cache_ttl_seconds == 60
+        config = config_module.parse_raw_config({"ci": {"cache_ttl_seconds": 0}})
+        assert config.ci.cache_ttl_seconds == 0
+
 
 class TestExpandPaths:
     def test_expands_home_directory(self):
@@ -110,6 +197,12 @@ class TestExpandPaths:
         expanded = config_module.expand_paths(config)
         assert expanded.scan_paths[0].is_absolute()
 
+    def test_updates_config_in_place(self, tmp_path):
+        config = Config(scan_paths=[tmp_path], exclude_paths=[Path("~/skip")])
+        expanded = config_module.expand_paths(config)
+        assert expanded is config
+        assert config.exclude_paths == [Path.home().resolve() / "skip"]
+
 
 class TestCreateDefaultConfig:
     def test_creates_config_file(self, tmp_path):
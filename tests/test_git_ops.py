@@ -1,5 +1,7 @@
 """Tests for git_ops module."""
 
+import os
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -9,6 +11,36 @@ from git_repo_checker import git_ops
 from git_repo_checker.models import RepoStatus
 
 
+class TestIoWorkerCount:
+    def test_explicit_request_wins(self):
+        assert git_ops.io_worker_count(100, requested=3) == 3
+
+    def test_never_exceeds_task_count(self):
+        assert git_ops.io_worker_count(2) == 2
+
+    def test_capped_at_max(self):
+        assert git_ops.io_worker_count(10_000) <= git_ops.MAX_IO_WORKERS
+
+    def test_at_least_one(self):
+        assert git_ops.io_worker_count(0) == 1
+        assert git_ops.io_worker_count(5, requested=0) == 1
+
+
+class TestIsGitDir:
+    def test_true_for_git_directory(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        assert git_ops.is_git_dir(tmp_path)
+        assert git_ops.is_git_dir(str(tmp_path))
+
+    def test_false_for_git_file(self, tmp_path):
+        (tmp_path / ".git").write_text("gitdir: /elsewhere\n")
+        assert not git_ops.is_git_dir(tmp_path)
+
+    def test_false_when_missing(self, tmp_path):
+        assert not git_ops.is_git_dir(tmp_path)
+        assert not git_ops.is_git_dir(tmp_path / "nope")
+
+
 class TestRunGitCommand:
     def test_runs_command_successfully(self, temp_git_repo):
         result = git_ops.run_git_command(temp_git_repo, ["status"])
@@ -29,6 +61,50 @@ class TestRunGitCommand:
             with pytest.raises(git_ops.GitError):
                 git_ops.run_git_command(temp_git_repo, ["status"])
 
+    def test_caps_concurrent_git_processes(self, tmp_path, monkeypatch):
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        monkeypatch.setattr(git_ops, "_git_process_slots", threading.BoundedSemaphore(2))
+        active = 0
+        peak = 0
+        guard = threading.Lock()
+
+        def fake_run(*args, **kwargs):
+            nonlocal active, peak
+            with guard:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with guard:
+                active -= 1
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        with patch("subprocess.run", fake_run), ThreadPoolExecutor(max_workers=6) as pool:
+            list(pool.map(lambda _: git_ops.run_git_command(tmp_path, ["status"]), range(6)))
+
+        assert peak == 2
+
+    def test_bytes_variant_skips_decoding(self, temp_git_repo):
+        result = git_ops.run_git_command_bytes(temp_git_repo, ["status", "--porcelain"])
+        assert result.returncode == 0
+        assert isinstance(result.stdout, bytes)
+
+    def test_git_succeeds_reports_exit_status(self, temp_git_repo):
+        assert git_ops.git_succeeds(temp_git_repo, ["rev-parse", "HEAD"]) is True
+        assert git_ops.git_succeeds(temp_git_repo, ["rev-parse", "nope"]) is False
+
+    def test_releases_slot_on_error(self, tmp_path, monkeypatch):
+        import threading
+
+        slots = threading.BoundedSemaphore(1)
+        monkeypatch.setattr(git_ops, "_git_process_slots", slots)
+        with patch("subprocess.run", side_effect=OSError("boom")):
+            with pytest.raises(git_ops.GitError):
+                git_ops.run_git_command(tmp_path, ["status"])
+        assert slots.acquire(blocking=False)
+
 
 class TestGetCurrentBranch:
     def test_returns_branch_name(self, temp_git_repo):
@@ -56,6 +132,18 @@ class TestGetCurrentBranch:
         branch = git_ops.get_current_branch(temp_git_repo)
         assert branch == "HEAD"
 
+    def test_reads_head_without_subprocess(self, temp_git_repo, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("git should not be called")
+
+        monkeypatch.setattr(git_ops, "run_git_command", fail)
+        assert git_ops.get_current_branch(temp_git_repo) in ["master", "main"]
+
+    def test_falls_back_to_git_for_gitdir_file(self, tmp_path):
+        (tmp_path / ".git").write_text("gitdir: /nonexistent\n")
+        with pytest.raises(git_ops.GitError):
+            git_ops.get_current_branch(tmp_path)
+
 
 class TestGetRepoStatus:
     def test_clean_repo(self, temp_git_repo):
@@ -75,12 +163,225 @@ class TestGetRepoStatus:
         assert changed == 0
         assert untracked >= 1
 
+    def test_counts_mixed_output(self, temp_git_repo):
+        output = b" M a.py\nM  b.py\n?? c.txt\n?? d.txt\n?? e.txt"
+        with patch.object(git_ops, "run_git_command_bytes") as mock_cmd:
+            mock_cmd.return_value = MagicMock(returncode=0, stdout=output)
+            status, changed, untracked = git_ops.get_repo_status(temp_git_repo)
+        assert (status, changed, untracked) == (RepoStatus.DIRTY, 2, 3)
+
+
+class TestIterGitOutput:
+    def test_streams_stdout(self, temp_git_repo):
+        output = b"".join(git_ops.iter_git_output(temp_git_repo, ["rev-parse", "--git-dir"]))
+        assert output == b".git\n"
+
+    def test_raises_with_stderr_on_failure(self, tmp_path):
+        with pytest.raises(git_ops.GitError, match="not a git repository"):
+            list(git_ops.iter_git_output(tmp_path, ["status"]))
+
+    def test_large_stderr_does_not_block(self, tmp_path, monkeypatch):
+        import subprocess
+        import sys
+
+        real_popen = subprocess.Popen
+        script = (
+            "import sys; sys.stderr.write('x' * 1_000_000); sys.stdout.write('done'); sys.exit(1)"
+        )
+
+        def noisy(cmd, **kwargs):
+            return real_popen([sys.executable, "-c", script], **kwargs)
+
+        monkeypatch.setattr(git_ops.subprocess, "Popen", noisy)
+        with pytest.raises(git_ops.GitError) as exc_info:
+            list(git_ops.iter_git_output(tmp_path, ["status"], timeout=10))
+        assert "timed out" not in str(exc_info.value)
+        assert len(str(exc_info.value)) == 1_000_000
+
+    def test_times_out(self, tmp_path, monkeypatch):
+        import subprocess
+        import sys
+
+        real_popen = subprocess.Popen
+
+        def sleeper(cmd, **kwargs):
+            return real_popen([sys.executable, "-c", "import time; time.sleep(30)"], **kwargs)
+
+        monkeypatch.setattr(git_ops.subprocess, "Popen", sleeper)
+        with pytest.raises(git_ops.GitError, match="timed out"):
+            list(git_ops.iter_git_output(tmp_path, ["status"], timeout=0.2))
+
+    def test_closing_early_releases_slot(self, temp_git_repo, monkeypatch):
+        import threading
+
+        monkeypatch.setattr(git_ops, "_git_process_slots", threading.BoundedSemaphore(1))
+        monkeypatch.setattr(git_ops, "STREAM_CHUNK_SIZE", 1)
+        stream = git_ops.iter_git_output(temp_git_repo, ["rev-parse", "--git-dir"])
+        assert next(stream) == b"."
+        stream.close()
+        assert git_ops._git_process_slots.acquire(blocking=False)
+
+
+class TestGetRepoSnapshot:
+    def test_clean_repo(self, temp_git_repo):
+        snap = git_ops.get_repo_snapshot(temp_git_repo)
+        assert snap.branch in ["master", "main"]
+        assert snap.status == RepoStatus.CLEAN
+        assert snap.has_upstream is False
+        assert snap.has_stash is False
+
+    def test_dirty_repo(self, temp_git_repo_dirty):
+        snap = git_ops.get_repo_snapshot(temp_git_repo_dirty)
+        assert snap.status == RepoStatus.DIRTY
+        assert snap.changed >= 1
+
+    def test_untracked_only(self, temp_git_repo_untracked):
+        snap = git_ops.get_repo_snapshot(temp_git_repo_untracked)
+        assert snap.status == RepoStatus.UNTRACKED
+        assert snap.changed == 0
+        assert snap.untracked >= 1
+
+    def test_detects_stash(self, temp_git_repo_dirty):
+        import subprocess
+
+        subprocess.run(["git", "stash"], cwd=temp_git_repo_dirty, capture_output=True, check=True)
+        snap = git_ops.get_repo_snapshot(temp_git_repo_dirty)
+        assert snap.has_stash is True
+        assert snap.status == RepoStatus.CLEAN
+
+    def test_parses_upstream_and_detached(self, temp_git_repo):
+        output = b"# branch.oid abc\n# branch.head (detached)\n# branch.ab +2 -5\n"
+        with patch.object(git_ops, "iter_git_output", return_value=iter([output])):
+            snap = git_ops.get_repo_snapshot(temp_git_repo)
+        assert snap.branch == "HEAD"
+        assert snap.has_upstream is True
+        assert snap.ahead == 2
+        assert snap.behind == 5
+
+    def test_counts_entries_from_output(self, temp_git_repo):
+        output = (
+            b"# branch.head main\n"
+            b"1 .M N... 100644 100644 100644 a b changed.py\n"
+            b"2 R. N... 100644 100644 100644 a b R100 new.py\told.py\n"
+            b"? untracked.txt\n"
+            b"! ignored.log\n"
+            b'? "line\\nbreak.txt"'
+        )
+        with patch.object(git_ops, "iter_git_output", return_value=iter([output])):
+            snap = git_ops.get_repo_snapshot(temp_git_repo)
+        assert snap.changed == 2
+        assert snap.untracked == 2
+        assert snap.status == RepoStatus.DIRTY
+
+    def test_counts_entries_split_across_chunks(self, temp_git_repo):
+        output = (
+            b"# branch.head main\n# branch.ab +1 -0\n"
+            + b"? untracked-file.txt\n" * 50
+            + b"1 .M N... 100644 100644 100644 a b changed.py\n" * 30
+            + b"! ignored.log\n" * 20
+        )
+        chunks = [output[i : i + 7] for i in range(0, len(output), 7)]
+        with patch.object(git_ops, "iter_git_output", return_value=iter(chunks)):
+            snap = git_ops.get_repo_snapshot(temp_git_repo)
+        assert (snap.branch, snap.ahead) == ("main", 1)
+        assert (snap.untracked, snap.changed) == (50, 30)
+
+    def test_raises_on_failure(self, tmp_path):
+        with pytest.raises(git_ops.GitError):
+            git_ops.get_repo_snapshot(tmp_path)
+
 
 class TestHasUpstream:
     def test_no_upstream(self, temp_git_repo):
         # Local repo without remote
         assert git_ops.has_upstream(temp_git_repo) is False
 
+    def test_clone_has_upstream_without_git(self, temp_git_repo, tmp_path):
+        import subprocess
+
+        clone = tmp_path / "clone"
+        subprocess.run(
+            ["git", "clone", str(temp_git_repo), str(clone)], capture_output=True, check=True
+        )
+        with patch.object(git_ops, "run_git_command") as mock_cmd:
+            assert git_ops.has_upstream(clone) is True
+            mock_cmd.assert_not_called()
+
+    def test_detached_head_has_no_upstream(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("0123456789abcdef\n")
+        assert git_ops.has_upstream(tmp_path) is False
+
+    def test_falls_back_to_git_for_gitdir_file(self, tmp_path):
+        (tmp_path / ".git").write_text("gitdir: /elsewhere\n")
+        with patch.object(git_ops, "git_succeeds") as mock_cmd:
+            mock_cmd.return_value = True
+            assert git_ops.has_upstream(tmp_path) is True
+            mock_cmd.assert_called_once()
+
+    def test_falls_back_to_git_for_includes(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        (tmp_path / ".git" / "config").write_text("[include]\n\tpath = other\n")
+        with patch.object(git_ops, "git_succeeds") as mock_cmd:
+            mock_cmd.return_value = False
+            assert git_ops.has_upstream(tmp_path) is False
+            mock_cmd.assert_called_once()
+
+
+class TestParseGitConfig:
+    def test_parses_sections_and_values(self):
+        raw = (
+            b"# comment\n"
+            b"[core]\n\tbare = false\n"
+            b'[remote "origin"]\n\turl = git@github.com:u/r.git ; trailing\n'
+            b'[Branch "Feature/X"]\n\tRemote = origin\n\tmerge = "refs/heads/feature/x"\n'
+        )
+        config = git_ops.parse_git_config(raw)
+        assert config is not None
+        assert config[("core", "")] == {"bare": "false"}
+        assert config[("remote", "origin")]["url"] == "git@github.com:u/r.git"
+        assert config[("branch", "Feature/X")] == {
+            "remote": "origin",
+            "merge": "refs/heads/feature/x",
+        }
+
+    def test_include_returns_none(self):
+        assert git_ops.parse_git_config(b'[includeIf "gitdir:~/w/"]\n\tpath = x\n') is None
+
+
+class TestHasStash:
+    def test_no_stash(self, temp_git_repo):
+        assert git_ops.has_stash(temp_git_repo) is False
+
+    def test_loose_stash_ref(self, temp_git_repo_dirty):
+        import subprocess
+
+        subprocess.run(["git", "stash"], cwd=temp_git_repo_dirty, capture_output=True, check=True)
+        assert git_ops.has_stash(temp_git_repo_dirty) is True
+
+    def test_packed_stash_ref(self, temp_git_repo_dirty):
+        import subprocess
+
+        subprocess.run(["git", "stash"], cwd=temp_git_repo_dirty, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "pack-refs", "--all"], cwd=temp_git_repo_dirty, capture_output=True, check=True
+        )
+        assert not (temp_git_repo_dirty / ".git" / "refs" / "stash").exists()
+        assert git_ops.has_stash(temp_git_repo_dirty) is True
+
+    def test_falls_back_to_git_for_gitdir_file(self, tmp_path):
+        (tmp_path / ".git").write_text("gitdir: /nonexistent\n")
+        assert git_ops.has_stash(tmp_path) is False
+
+
+class TestBranchFromHead:
+    def test_symbolic_ref(self):
+        assert git_ops.branch_from_head(b"ref: refs/heads/feature/x\n") == "feature/x"
+
+    def test_detached(self):
+        assert git_ops.branch_from_head(b"0123456789abcdef\n") is None
+
 
 class TestGetRemoteStatus:
     def test_no_upstream_returns_zeros(self, temp_git_repo):
@@ -123,6 +424,24 @@ class TestPullRepo:
         assert isinstance(result.message, str)
 
 
+class TestFastForwardRepo:
+    def test_fails_without_upstream(self, temp_git_repo):
+        result = git_ops.fast_forward_repo(temp_git_repo)
+        assert result.success is False
+        assert result.message
+
+    def test_up_to_date_clone(self, temp_git_repo, tmp_path):
+        import subprocess
+
+        clone = tmp_path / "clone"
+        subprocess.run(
+            ["git", "clone", str(temp_git_repo), str(clone)], capture_output=True, check=True
+        )
+        result = git_ops.fast_forward_repo(clone)
+        assert result.success is True
+        assert result.message == "Already up to date"
+
+
 class TestParsePullFilesChanged:
     def test_parses_file_count(self):
         output = "Updating abc123..def456\nFast-forward\n 3 files changed"
@@ -140,6 +459,148 @@ class TestFetchRepo:
         assert result is True
 
 
+class TestGitCache:
+    def test_upstream_cached_until_config_changes(self, temp_git_repo):
+        cache = git_ops.GitCache()
+        assert git_ops.has_upstream(temp_git_repo, cache) is False
+        with patch.object(git_ops, "run_git_command") as mock_cmd:
+            assert git_ops.has_upstream(temp_git_repo, cache) is False
+            mock_cmd.assert_not_called()
+
+        config_file = temp_git_repo / ".git" / "config"
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert cache.lookup_upstream(temp_git_repo) is None
+
+    def test_no_upstream_cache_outside_repo(self, tmp_path):
+        cache = git_ops.GitCache()
+        cache.store_upstream(tmp_path, True)
+        assert cache.lookup_upstream(tmp_path) is None
+
+    def test_fetch_skipped_within_ttl(self, temp_git_repo):
+        cache = git_ops.GitCache(fetch_ttl_seconds=300)
+        assert git_ops.fetch_repo(temp_git_repo, cache) is True
+        with patch.object(git_ops, "run_git_command") as mock_cmd:
+            assert git_ops.fetch_repo(temp_git_repo, cache) is True
+            mock_cmd.assert_not_called()
+
+    def test_zero_ttl_always_fetches(self, temp_git_repo):
+        cache = git_ops.GitCache(fetch_ttl_seconds=0)
+        cache.record_fetch(temp_git_repo)
+        assert cache.fetch_is_fresh(temp_git_repo) is False
+
+    def test_recent_fetch_head_counts_as_fresh(self, temp_git_repo):
+        (temp_git_repo / ".git" / "FETCH_HEAD").write_text("")
+        cache = git_ops.GitCache(fetch_ttl_seconds=300)
+        with patch.object(git_ops, "git_succeeds") as mock_fetch:
+            assert git_ops.fetch_repo(temp_git_repo, cache) is True
+            mock_fetch.assert_not_called()
+
+    def test_old_fetch_head_is_stale(self, temp_git_repo):
+        fetch_head = temp_git_repo / ".git" / "FETCH_HEAD"
+        fetch_head.write_text("")
+        old = time.time() - 600
+        os.utime(fetch_head, (old, old))
+        assert git_ops.fetched_within(temp_git_repo, 300) is False
+        assert git_ops.GitCache(fetch_ttl_seconds=300).fetch_is_fresh(temp_git_repo) is False
+
+    def test_fetch_head_ignored_with_zero_ttl(self, temp_git_repo):
+        (temp_git_repo / ".git" / "FETCH_HEAD").write_text("")
+        assert git_ops.GitCache(fetch_ttl_seconds=0).fetch_is_fresh(temp_git_repo) is False
+
+    def test_failed_fetch_not_recorded(self, temp_git_repo):
+        cache = git_ops.GitCache(fetch_ttl_seconds=300)
+        with patch.object(git_ops, "git_succeeds", return_value=False):
+            assert git_ops.fetch_repo(temp_git_repo, cache) is False
+        assert temp_git_repo not in cache.fetch_timestamps
+
+    def test_successful_pull_invalidates(self, temp_git_repo):
+        cache = git_ops.GitCache(fetch_ttl_seconds=300)
+        cache.record_fetch(temp_git_repo)
+        cache.store_upstream(temp_git_repo, True)
+        with patch.object(git_ops, "run_git_command") as mock_cmd:
+            mock_cmd.return_value = MagicMock(returncode=0, stdout="Already up to date.\n")
+            git_ops.pull_repo(temp_git_repo, cache)
+        assert temp_git_repo not in cache.fetch_timestamps
+        assert temp_git_repo not in cache.upstream_refs
+
+
+class TestGetRemoteUrl:
+    def _add_origin(self, repo, url):
+        import subprocess
+
+        subprocess.run(
+            ["git", "remote", "add", "origin", url], cwd=repo, capture_output=True, check=True
+        )
+
+    def test_reads_url_without_git(self, temp_git_repo, monkeypatch):
+        self._add_origin(temp_git_repo, "https://example.com/o/r.git")
+        monkeypatch.setattr(git_ops, "_global_url_rewrites", lambda: False)
+        with patch.object(git_ops, "run_git_command", side_effect=AssertionError):
+            assert git_ops.get_remote_url(temp_git_repo) == "https://example.com/o/r.git"
+
+    def test_missing_remote_returns_none(self, temp_git_repo):
+        assert git_ops.get_remote_url(temp_git_repo) is None
+
+    def test_insteadof_rewrite_uses_git(self, temp_git_repo, monkeypatch):
+        import subprocess
+
+        self._add_origin(temp_git_repo, "gh:o/r.git")
+        subprocess.run(
+            ["git", "config", "url.https://github.com/.insteadOf", "gh:"],
+            cwd=temp_git_repo,
+            capture_output=True,
+            check=True,
+        )
+        monkeypatch.setattr(git_ops, "_global_url_rewrites", lambda: False)
+        assert git_ops.get_remote_url(temp_git_repo) == "https://github.com/o/r.git"
+
+    @pytest.mark.parametrize(
+        ("global_config", "expected"),
+        [
+            ("[user]\n\tname = x\n", False),
+            ('[url "https://x/"]\n\tinsteadOf = y:\n', True),
+            ("[include]\n\tpath = rewrites\n", True),
+            ('[includeIf "gitdir:~/work/"]\n\tpath = work\n', True),
+        ],
+    )
+    def test_global_rewrites_detected(self, tmp_path, monkeypatch, global_config, expected):
+        (tmp_path / "rewrites").write_text('[url "https://x/"]\n\tinsteadOf = y:\n')
+        (tmp_path / "gitconfig").write_text(global_config)
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "gitconfig"))
+        monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        git_ops._global_url_rewrites.cache_clear()
+        try:
+            assert git_ops._global_url_rewrites() is expected
+        finally:
+            git_ops._global_url_rewrites.cache_clear()
+
+    def test_global_rewrites_assumed_without_git(self, monkeypatch):
+        monkeypatch.setattr(git_ops.subprocess, "run", MagicMock(side_effect=OSError))
+        git_ops._global_url_rewrites.cache_clear()
+        try:
+            assert git_ops._global_url_rewrites() is True
+        finally:
+            git_ops._global_url_rewrites.cache_clear()
+
+
+class TestRemoteHost:
+    def test_https_url(self):
+        assert git_ops.remote_host("https://GitHub.com/owner/repo.git") == "github.com"
+
+    def test_ssh_url_with_port(self):
+        assert git_ops.remote_host("ssh://git@gitlab.example.com:2222/x.git") == (
+            "gitlab.example.com"
+        )
+
+    def test_scp_like_url(self):
+        assert git_ops.remote_host("git@github.com:owner/repo.git") == "github.com"
+
+    def test_local_path_and_missing(self):
+        assert git_ops.remote_host("/srv/git/repo.git") == ""
+        assert git_ops.remote_host(None) == ""
+
+
 class TestGitError:
     def test_stores_repo_path(self):
         path = Path("/tmp/repo")
@@ -1,11 +1,26 @@
 """Tests for github_ops module."""
 
+import io
+import subprocess
+import time
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from git_repo_checker import github_ops
+from git_repo_checker.git_ops import GitError
 from git_repo_checker.models import CIStatus
 
 
+@pytest.fixture(autouse=True)
+def clear_gh_cache(monkeypatch):
+    for name in github_ops.TOKEN_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    github_ops.is_gh_available.cache_clear()
+    yield
+    github_ops.is_gh_available.cache_clear()
+
+
 class TestParseGithubUrl:
     def test_parses_ssh_url(self):
         url = "git@github.com:owner/repo.git"
@@ -27,6 +42,10 @@ class TestParseGithubUrl:
         result = github_ops.parse_github_url(url)
         assert result == "owner/repo"
 
+    def test_rejects_extra_path_segments(self):
+        url = "https://github.com/owner/repo/tree/main"
+        assert github_ops.parse_github_url(url) is None
+
     def test_returns_none_for_non_github(self):
         url = "git@gitlab.com:owner/repo.git"
         result = github_ops.parse_github_url(url)
@@ -64,6 +83,13 @@ class TestParseWorkflowResponse:
         result = github_ops.parse_workflow_response(response)
         assert result == CIStatus.NO_WORKFLOWS
 
+    def test_parses_bytes(self):
+        response = b'[{"status": "completed", "conclusion": "success"}]'
+        assert github_ops.parse_workflow_response(response) == CIStatus.PASSING
+
+    def test_invalid_utf8_unknown(self):
+        assert github_ops.parse_workflow_response(b"\xff\xfe\x00") == CIStatus.UNKNOWN
+
     def test_invalid_json_unknown(self):
         response = "not json"
         result = github_ops.parse_workflow_response(response)
@@ -115,6 +141,23 @@ class TestGetGithubRemote:
             result = github_ops.get_github_remote(tmp_path)
             assert result is None
 
+    def test_reads_origin_from_config_without_subprocess(self, temp_git_repo, monkeypatch):
+        subprocess.run(
+            ["git", "remote", "add", "origin", "https://github.com/owner/repo.git"],
+            cwd=temp_git_repo,
+            check=True,
+        )
+        monkeypatch.setattr(github_ops.git_ops, "_global_url_rewrites", lambda: False)
+        with patch("subprocess.run") as mock_run:
+            assert github_ops.get_github_remote(temp_git_repo) == "owner/repo"
+        mock_run.assert_not_called()
+
+    def test_returns_none_on_git_error(self, tmp_path):
+        with patch.object(
+            github_ops.git_ops, "get_remote_url", side_effect=GitError("x", tmp_path)
+        ):
+            assert github_ops.get_github_remote(tmp_path) is None
+
 
 class TestQueryWorkflowStatus:
     def test_returns_status_from_gh(self):
@@ -152,3 +195,159 @@ class TestGetCiStatus:
                 ):
                     result = github_ops.get_ci_status(tmp_path)
                     assert result == CIStatus.PASSING
+
+
+class TestGetCiStatuses:
+    def test_empty_list(self):
+        assert github_ops.get_ci_statuses([]) == {}
+
+    def test_all_unknown_when_gh_not_available(self, tmp_path):
+        paths = [tmp_path / "a", tmp_path / "b"]
+        with patch.object(github_ops, "is_gh_available", return_value=False):
+            with patch.object(github_ops, "get_github_remote") as mock_remote:
+                result = github_ops.get_ci_statuses(paths)
+        assert result == dict.fromkeys(paths, CIStatus.UNKNOWN)
+        mock_remote.assert_not_called()
+
+    def test_maps_each_path_to_its_status(self, tmp_path):
+        paths = [tmp_path / "pass", tmp_path / "fail", tmp_path / "local"]
+        slugs = {paths[0]: "o/pass", paths[1]: "o/fail", paths[2]: None}
+        statuses = {"o/pass": CIStatus.PASSING, "o/fail": CIStatus.FAILING}
+        with patch.object(github_ops, "is_gh_available", return_value=True):
+            with patch.object(github_ops, "get_github_remote", side_effect=slugs.get):
+                with patch.object(github_ops, "query_workflow_status", side_effect=statuses.get):
+                    result = github_ops.get_ci_statuses(paths, max_workers=2)
+        assert result == {
+            paths[0]: CIStatus.PASSING,
+            paths[1]: CIStatus.FAILING,
+            paths[2]: CIStatus.UNKNOWN,
+        }
+
+
+class TestIsGhAvailableCache:
+    def test_probe_runs_once(self):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            assert github_ops.is_gh_available() is True
+            assert github_ops.is_gh_available() is True
+        mock_run.assert_called_once()
+
+
+class TestCiCache:
+    _PASSING = '[{"status": "completed", "conclusion": "success"}]'
+
+    def test_second_query_uses_cache(self):
+        cache = github_ops.CICache()
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=self._PASSING)
+            assert github_ops.query_workflow_status("owner/repo", cache) == CIStatus.PASSING
+            assert github_ops.query_workflow_status("owner/repo", cache) == CIStatus.PASSING
+        mock_run.assert_called_once()
+
+    def test_saved_entries_reused_by_next_run(self):
+        first = github_ops.CICache()
+        first.store("owner/repo", CIStatus.FAILING)
+        assert not first.path.exists()
+        first.save()
+        assert github_ops.CICache().lookup("owner/repo") == CIStatus.FAILING
+
+    def test_expired_entry_is_a_miss(self):
+        cache = github_ops.CICache(ttl_seconds=0.001)
+        cache.store("owner/repo", CIStatus.PASSING)
+        cache.save()
+        time.sleep(0.01)
+        assert cache.lookup("owner/repo") is None
+        assert github_ops.CICache(ttl_seconds=0.001).lookup("owner/repo") is None
+
+    def test_file_read_once_and_written_on_exit(self, tmp_path):
+        paths = [tmp_path / f"r{i}" for i in range(4)]
+        slugs = {p: f"o/{p.name}" for p in paths}
+        with patch.object(github_ops, "is_gh_available", return_value=True):
+            with patch.object(github_ops, "get_github_remote", side_effect=slugs.get):
+                with patch("subprocess.run") as mock_run:
+                    mock_run.return_value = MagicMock(returncode=0, stdout=self._PASSING)
+                    with patch.object(
+                        github_ops, "_load_ci_cache", wraps=github_ops._load_ci_cache
+                    ) as mock_load:
+                        with patch.object(
+                            github_ops.tempfile, "mkstemp", wraps=github_ops.tempfile.mkstemp
+                        ) as mock_mkstemp:
+                            result = github_ops.get_ci_statuses(paths, max_workers=4)
+        assert set(result.values()) == {CIStatus.PASSING}
+        mock_load.assert_called_once()
+        mock_mkstemp.assert_called_once()
+        cached = github_ops.CICache()
+        assert all(cached.lookup(slug) == CIStatus.PASSING for slug in slugs.values())
+
+    def test_zero_ttl_disables_cache(self):
+        assert github_ops.open_ci_cache(0) is None
+
+    def test_env_var_disables_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(github_ops.NO_CI_CACHE_ENV, "1")
+        assert github_ops.open_ci_cache() is None
+        with patch.object(github_ops, "is_gh_available", return_value=True):
+            with patch.object(github_ops, "get_github_remote", return_value="owner/repo"):
+                with patch("subprocess.run") as mock_run:
+                    mock_run.return_value = MagicMock(returncode=0, stdout=self._PASSING)
+                    github_ops.get_ci_status(tmp_path)
+                    github_ops.get_ci_status(tmp_path)
+        assert mock_run.call_count == 2
+        assert not github_ops._ci_cache_path().exists()
+
+    def test_unknown_is_not_cached(self):
+        cache = github_ops.CICache()
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="not json")
+            github_ops.query_workflow_status("owner/repo", cache)
+        assert cache.lookup("owner/repo") is None
+
+    def test_corrupt_cache_is_ignored(self):
+        path = github_ops._ci_cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('{"owner/repo": "bad", "other/repo": [0, "bogus"]}')
+        cache = github_ops.CICache()
+        assert cache.lookup("owner/repo") is None
+        cache.store("owner/repo", CIStatus.PENDING)
+        cache.save()
+        assert github_ops.CICache().lookup("owner/repo") == CIStatus.PENDING
+
+    def test_bad_status_value_is_a_miss(self):
+        path = github_ops._ci_cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f'{{"owner/repo": [{time.time()}, "bogus"]}}')
+        assert github_ops.CICache().lookup("owner/repo") is None
+
+
+class TestQueryWorkflowApi:
+    def _response(self, body):
+        response = MagicMock()
+        response.__enter__.return_value = io.BytesIO(body.encode())
+        return response
+
+    def test_uses_api_when_token_set(self, monkeypatch):
+        monkeypatch.setenv("GH_TOKEN", "secret")
+        body = '{"workflow_runs": [{"status": "completed", "conclusion": "success"}]}'
+        with patch("urllib.request.urlopen", return_value=self._response(body)) as mock_open:
+            with patch("subprocess.run") as mock_run:
+                assert github_ops.query_workflow_status("owner/repo") == CIStatus.PASSING
+        mock_run.assert_not_called()
+        request = mock_open.call_args[0][0]
+        assert request.full_url.endswith("/repos/owner/repo/actions/runs?per_page=1")
+        assert request.get_header("Authorization") == "Bearer secret"
+
+    def test_no_runs(self):
+        with patch("urllib.request.urlopen", return_value=self._response('{"workflow_runs": []}')):
+            assert github_ops._query_workflow_api("o/r", "t") == CIStatus.NO_WORKFLOWS
+
+    def test_http_error_is_unknown(self):
+        with patch("urllib.request.urlopen", side_effect=OSError("boom")):
+            assert github_ops._query_workflow_api("o/r", "t") == CIStatus.UNKNOWN
+
+    def test_unexpected_body_is_unknown(self):
+        with patch("urllib.request.urlopen", return_value=self._response('{"message": "x"}')):
+            assert github_ops._query_workflow_api("o/r", "t") == CIStatus.UNKNOWN
+
+    def test_token_makes_ci_available_without_gh(self, monkeypatch):
+        monkeypatch.setenv("GITHUB_TOKEN", "secret")
+        with patch.object(github_ops, "is_gh_available", return_value=False):
+            assert github_ops.is_ci_available() is True
@@ -0,0 +1,169 @@
+"""Tests for manifest module."""
+
+import json
+import subprocess
+
+from git_repo_checker import analyzer, manifest
+from git_repo_checker.models import Config, RepoInfo, RepoStatus
+
+
+class TestRepoState:
+    def test_changes_after_commit(self, temp_git_repo):
+        before = manifest.repo_state(temp_git_repo)
+        (temp_git_repo / "new.txt").write_text("x")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "more"], cwd=temp_git_repo, capture_output=True, check=True
+        )
+        assert manifest.repo_state(temp_git_repo) != before
+
+    def test_missing_paths_are_zero(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        assert manifest.repo_state(tmp_path) == (0,) * len(manifest.WATCHED_GIT_PATHS)
+
+
+class TestRemoteRefsState:
+    def test_empty_without_remotes(self, temp_git_repo):
+        assert manifest.remote_refs_state(temp_git_repo) == ()
+
+    def test_noop_fetch_keeps_state_and_new_commits_change_it(self, temp_git_repo, tmp_path):
+        clone = tmp_path / "clone"
+        subprocess.run(
+            ["git", "clone", str(temp_git_repo), str(clone)], capture_output=True, check=True
+        )
+        before = manifest.remote_refs_state(clone)
+        subprocess.run(["git", "fetch"], cwd=clone, capture_output=True, check=True)
+        assert manifest.remote_refs_state(clone) == before
+
+        (temp_git_repo / "new.txt").write_text("x")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "more"], cwd=temp_git_repo, capture_output=True, check=True
+        )
+        subprocess.run(["git", "fetch"], cwd=clone, capture_output=True, check=True)
+        assert manifest.remote_refs_state(clone) != before
+
+
+class TestScanManifest:
+    def test_round_trip(self, temp_git_repo, tmp_path):
+        path = tmp_path / "scan.json"
+        info = RepoInfo(path=temp_git_repo, branch="main", status=RepoStatus.DIRTY)
+        first = manifest.ScanManifest.load(path)
+        state = first.state(temp_git_repo)
+        first.record(temp_git_repo, state, info)
+        first.save()
+
+        reused = manifest.ScanManifest.load(path).lookup(temp_git_repo, state)
+        assert reused == info
+
+    def test_changed_state_misses(self, temp_git_repo, tmp_path):
+        path = tmp_path / "scan.json"
+        first = manifest.ScanManifest.load(path)
+        info = RepoInfo(path=temp_git_repo, branch="main", status=RepoStatus.CLEAN)
+        first.record(temp_git_repo, (1, 2, 3), info)
+        first.save()
+
+        second = manifest.ScanManifest.load(path)
+        assert second.lookup(temp_git_repo, second.state(temp_git_repo)) is None
+
+    def test_only_seen_repos_are_saved(self, tmp_path):
+        path = tmp_path / "scan.json"
+        info = RepoInfo(path=tmp_path / "gone", branch="main", status=RepoStatus.CLEAN)
+        first = manifest.ScanManifest.load(path)
+        first.record(tmp_path / "gone", (1,), info)
+        first.save()
+
+        manifest.ScanManifest.load(path).save()
+        assert json.loads(path.read_text())["repos"] == {}
+
+    def test_unreadable_or_old_manifest_starts_empty(self, tmp_path):
+        path = tmp_path / "scan.json"
+        path.write_text("not json")
+        assert manifest.ScanManifest.load(path).previous == {}
+
+        path.write_text(json.dumps({"version": "0.0.0-old", "repos": {}}))
+        assert manifest.ScanManifest.load(path).previous == {}
+
+    def test_config_change_starts_empty(self, temp_git_repo, tmp_path, sample_config):
+        path = tmp_path / "scan.json"
+        info = RepoInfo(path=temp_git_repo, branch="main", status=RepoStatus.CLEAN)
+        first = manifest.ScanManifest.load(path, sample_config)
+        first.record(temp_git_repo, (1,), info)
+        first.save()
+        assert manifest.ScanManifest.load(path, sample_config).previous != {}
+
+        other = Config(main_branches=["trunk"])
+        assert manifest.ScanManifest.load(path, other).previous == {}
+
+
+class TestScanWithManifest:
+    def test_unchanged_repos_skip_analysis(self, nested_repos, sample_config, monkeypatch):
+        sample_config.scan_paths = [nested_repos]
+        first = manifest.ScanManifest.load()
+        analyzer.scan_and_analyze(sample_config, auto_pull=False, manifest=first)
+        first.save()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("repo should have been reused")
+
+        monkeypatch.setattr(analyzer, "analyze_repo", fail)
+        result = analyzer.scan_and_analyze(
+            sample_config, auto_pull=False, manifest=manifest.ScanManifest.load()
+        )
+        assert len(result.repos) == 3
+
+    def test_tracking_clone_reused_after_noop_fetch(
+        self, temp_git_repo, tmp_path, sample_config, monkeypatch
+    ):
+        clone = tmp_path / "clone"
+        subprocess.run(
+            ["git", "clone", str(temp_git_repo), str(clone)], capture_output=True, check=True
+        )
+        sample_config.scan_paths = [clone]
+        first = manifest.ScanManifest.load()
+        analyzer.scan_and_analyze(sample_config, auto_pull=False, manifest=first)
+        first.save()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("repo should have been reused")
+
+        monkeypatch.setattr(analyzer, "analyze_repo", fail)
+        result = analyzer.scan_and_analyze(
+            sample_config, auto_pull=False, manifest=manifest.ScanManifest.load()
+        )
+        assert [r.path for r in result.repos] == [clone]
+
+    def test_upstream_commits_show_as_behind(self, temp_git_repo, tmp_path, sample_config):
+        clone = tmp_path / "clone"
+        subprocess.run(
+            ["git", "clone", str(temp_git_repo), str(clone)], capture_output=True, check=True
+        )
+        sample_config.scan_paths = [clone]
+        first = manifest.ScanManifest.load()
+        analyzer.scan_and_analyze(sample_config, auto_pull=False, manifest=first)
+        first.save()
+
+        (temp_git_repo / "new.txt").write_text("x")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "more"], cwd=temp_git_repo, capture_output=True, check=True
+        )
+
+        result = analyzer.scan_and_analyze(
+            sample_config, auto_pull=False, manifest=manifest.ScanManifest.load()
+        )
+        assert result.repos[0].status == RepoStatus.BEHIND
+
+    def test_commit_invalidates_entry(self, temp_git_repo, sample_config):
+        sample_config.scan_paths = [temp_git_repo]
+        first = manifest.ScanManifest.load()
+        analyzer.scan_and_analyze(sample_config, auto_pull=False, manifest=first)
+        first.save()
+
+        (temp_git_repo / "new.txt").write_text("x")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True, check=True)
+
+        result = analyzer.scan_and_analyze(
+            sample_config, auto_pull=False, manifest=manifest.ScanManifest.load()
+        )
+        assert result.repos[0].status == RepoStatus.DIRTY
@@ -5,6 +5,7 @@ from pathlib import Path
 from git_repo_checker.models import (
     AutoPullConfig,
     AutoTrackConfig,
+    CIConfig,
     CIStatus,
     Config,
     OutputConfig,
@@ -153,6 +154,11 @@ class TestAutoTrackConfig:
         assert config.path_prefix == "~/code"
 
 
+class TestCIConfig:
+    def test_defaults(self):
+        assert CIConfig().cache_ttl_seconds == 60
+
+
 class TestOutputConfig:
     def test_defaults(self):
         config = OutputConfig()
@@ -181,6 +187,16 @@ class TestConfig:
         assert len(config.scan_paths) == 1
         assert "**/node_modules" in config.exclude_patterns
 
+    def test_main_branches_lower_follows_edits(self):
+        config = Config(main_branches=["Main"])
+        assert config.main_branches_lower == frozenset({"main"})
+
+        config.main_branches = ["Trunk"]
+        assert config.main_branches_lower == frozenset({"trunk"})
+
+        config.main_branches.append("Dev")
+        assert config.main_branches_lower == frozenset({"trunk", "dev"})
+
 
 class TestTrackedRepo:
     def test_create_minimal(self):
@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 from rich.console import Console
 
+from git_repo_checker import reporter as reporter_module
 from git_repo_checker.models import (
     OutputConfig,
     PullResult,
@@ -69,6 +70,32 @@ class TestDisplayResults:
         assert "dirty" in output
 
 
+class TestLiveResults:
+    def test_renders_repos_as_added(self, reporter, console_capture):
+        with reporter.live_results() as add:
+            add(RepoInfo(path=Path("/tmp/b-repo"), branch="main", status=RepoStatus.DIRTY))
+            add(RepoInfo(path=Path("/tmp/a-repo"), branch="main", status=RepoStatus.CLEAN))
+        assert console_capture.file.getvalue() != ""
+
+    def test_keeps_only_rows_that_fit(self):
+        console = Console(file=StringIO(), force_terminal=True, width=120, height=10)
+        reporter = Reporter(console, OutputConfig())
+        with reporter.live_results() as add:
+            for i in range(20):
+                add(RepoInfo(path=Path(f"/tmp/repo{i:02}"), branch="main", status=RepoStatus.DIRTY))
+        output = console.file.getvalue()
+        assert "20 repos checked" in output
+        assert "/tmp/repo19" in output
+        assert "/tmp/repo00" not in output
+
+    def test_no_output_when_not_terminal(self):
+        console = Console(file=StringIO(), force_terminal=False)
+        reporter = Reporter(console, OutputConfig())
+        with reporter.live_results() as add:
+            add(RepoInfo(path=Path("/tmp/a-repo"), branch="main", status=RepoStatus.CLEAN))
+        assert console.file.getvalue() == ""
+
+
 class TestFilterRepos:
     def test_shows_all_when_show_clean(self, reporter):
         repos = [
@@ -109,6 +136,16 @@ class TestDisplayRepoTable:
         output = console_capture.file.getvalue()
         assert "Repositories" in output
 
+    def test_every_status_has_markup(self, reporter):
+        repos = [
+            RepoInfo(path=Path(f"/tmp/{status.value}"), branch="main", status=status)
+            for status in RepoStatus
+        ]
+        table = reporter.build_repo_table(repos)
+        cells = list(table.columns[2].cells)
+        assert cells == [reporter_module._STATUS_MARKUP[s] for s in RepoStatus]
+        assert cells[0] == "[green]clean[/]"
+
 
 class TestDisplayWarnings:
     def test_displays_warning_panel(self, reporter, console_capture):
@@ -155,6 +192,23 @@ class TestDisplaySummary:
         output = console_capture.file.getvalue()
         assert "2" in output
 
+    def test_counts_each_category(self):
+        console = Console(file=StringIO(), width=120)
+        reporter = Reporter(console, OutputConfig())
+        repos = [
+            RepoInfo(path=Path("/a"), branch="main", status=RepoStatus.CLEAN),
+            RepoInfo(
+                path=Path("/b"),
+                branch="main",
+                status=RepoStatus.DIRTY,
+                warnings=[WarningType.DIRTY_MAIN],
+            ),
+            RepoInfo(path=Path("/c"), branch="main", status=RepoStatus.DIRTY),
+        ]
+        reporter.display_summary(ScanResult(repos=repos, total_scanned=3))
+        output = console.file.getvalue()
+        assert "1 clean, 2 dirty, 1 with warnings" in output
+
 
 class TestDisplayQuietSummary:
     def test_shows_only_dirty(self, console_capture):
@@ -169,6 +223,18 @@ class TestDisplayQuietSummary:
         output = console_capture.file.getvalue()
         assert "dirty" in output
 
+    def test_dirty_repo_with_warnings_listed_once(self):
+        console = Console(file=StringIO(), width=120)
+        reporter = Reporter(console, OutputConfig(verbosity="quiet"))
+        warned = [WarningType.DIRTY_MAIN]
+        repos = [
+            RepoInfo(path=Path("/tmp/d"), branch="main", status=RepoStatus.DIRTY, warnings=warned),
+            RepoInfo(path=Path("/tmp/w"), branch="main", status=RepoStatus.AHEAD, warnings=warned),
+        ]
+        reporter.display_quiet_summary(ScanResult(repos=repos, total_scanned=2))
+        lines = console.file.getvalue().splitlines()
+        assert lines == ["dirty /tmp/d (main)", "warn /tmp/w (main)"]
+
 
 class TestFormatChanges:
     def test_formats_modified(self, reporter):
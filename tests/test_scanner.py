@@ -1,5 +1,6 @@
 """Tests for scanner module."""
 
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -22,18 +23,18 @@ class TestWalkGitRepos:
         assert walk.errors == []
 
     def test_records_permission_error(self, tmp_path):
-        # Create a subdir to trigger permission error during iterdir
+        # Create a subdir to trigger permission error during scandir
         blocked = tmp_path / "blocked"
         blocked.mkdir()
 
-        original_iterdir = Path.iterdir
+        original_scandir = os.scandir
 
-        def patched_iterdir(self):
-            if self == blocked:
+        def patched_scandir(path):
+            if Path(path) == blocked:
                 raise PermissionError("Access denied")
-            return original_iterdir(self)
+            return original_scandir(path)
 
-        with patch.object(Path, "iterdir", patched_iterdir):
+        with patch.object(os, "scandir", patched_scandir):
             walk = scanner.walk_git_repos(
                 scan_paths=[tmp_path],
                 exclude_patterns=[],
@@ -46,14 +47,14 @@ class TestWalkGitRepos:
     def test_records_oserror(self, tmp_path):
         bad = tmp_path / "bad"
         bad.mkdir()
-        original_iterdir = Path.iterdir
+        original_scandir = os.scandir
 
-        def patched_iterdir(self):
-            if self == bad:
+        def patched_scandir(path):
+            if Path(path) == bad:
                 raise OSError("I/O error")
-            return original_iterdir(self)
+            return original_scandir(path)
 
-        with patch.object(Path, "iterdir", patched_iterdir):
+        with patch.object(os, "scandir", patched_scandir):
             walk = scanner.walk_git_repos(
                 scan_paths=[bad],
                 exclude_patterns=[],
@@ -64,6 +65,83 @@ class TestWalkGitRepos:
         assert any("Cannot scan" in e for e in walk.errors)
 
 
+class TestIterGitRepos:
+    def test_yields_repos_lazily(self, nested_repos):
+        it = scanner.iter_git_repos(
+            scan_paths=[nested_repos],
+            exclude_patterns=["**/node_modules"],
+            exclude_paths=[],
+        )
+        first = next(it)
+        assert first.parent == nested_repos
+        rest = list(it)
+        assert len(rest) == 2
+
+    def test_collects_errors(self, tmp_path):
+        blocked = tmp_path / "blocked"
+        blocked.mkdir()
+        original_scandir = os.scandir
+
+        def patched_scandir(path):
+            if Path(path) == blocked:
+                raise PermissionError("Access denied")
+            return original_scandir(path)
+
+        errors: list[str] = []
+        with patch.object(os, "scandir", patched_scandir):
+            list(scanner.iter_git_repos([tmp_path], [], [], errors))
+        assert errors == [f"Permission denied: {blocked}"]
+
+    def test_yields_in_path_order(self, tmp_path):
+        for name in ["zeta", "alpha/inner", "Beta", "alpha-2", "mid/z", "mid/a"]:
+            (tmp_path / "b" / name / ".git").mkdir(parents=True)
+        (tmp_path / "a" / "repo" / ".git").mkdir(parents=True)
+
+        repos = list(scanner.iter_git_repos([tmp_path / "b", tmp_path / "a"], [], []))
+
+        assert len(repos) == 7
+        assert repos == sorted(repos)
+
+    def test_symlink_cycle_visited_once(self, tmp_path):
+        (tmp_path / "code" / "repo" / ".git").mkdir(parents=True)
+        (tmp_path / "code" / "loop").symlink_to(tmp_path / "code")
+
+        repos = list(scanner.iter_git_repos([tmp_path], [], []))
+
+        assert repos == [tmp_path / "code" / "repo"]
+
+    def test_symlink_to_repo_found_once(self, tmp_path):
+        (tmp_path / "b_repo" / ".git").mkdir(parents=True)
+        (tmp_path / "a_link").symlink_to(tmp_path / "b_repo")
+
+        repos = list(scanner.iter_git_repos([tmp_path], [], []))
+
+        assert repos == [tmp_path / "a_link"]
+
+    def test_git_file_is_not_a_repo(self, tmp_path):
+        (tmp_path / "worktree").mkdir()
+        (tmp_path / "worktree" / ".git").write_text("gitdir: elsewhere")
+        (tmp_path / "worktree" / "inner" / ".git").mkdir(parents=True)
+
+        repos = list(scanner.iter_git_repos([tmp_path], [], []))
+
+        assert repos == [tmp_path / "worktree" / "inner"]
+
+    def test_excludes_children_by_name_full_path_and_explicit_path(self, tmp_path):
+        for name in ["keep", "deep/node_modules/pkg", "skipped", "explicit"]:
+            (tmp_path / name / ".git").mkdir(parents=True)
+
+        repos = list(
+            scanner.iter_git_repos(
+                [tmp_path],
+                ["**/node_modules", f"{tmp_path}/skip*"],
+                [tmp_path / "explicit"],
+            )
+        )
+
+        assert repos == [tmp_path / "keep"]
+
+
 class TestFindGitRepos:
     def test_finds_repos_in_directory(self, nested_repos):
         repos = list(
@@ -158,6 +236,27 @@ class TestMatchesAnyPattern:
         src.mkdir()
         assert not scanner.matches_any_pattern(src, ["**/node_modules", "venv"])
 
+    def test_empty_patterns_never_match(self, tmp_path):
+        assert not scanner.matches_any_pattern(tmp_path, [])
+
+    def test_matches_any_component(self):
+        path = Path("/home/user/project/.venv/lib")
+        assert scanner.matches_any_pattern(path, ["**/.venv", "build"])
+
+    def test_compiled_patterns_are_cached(self):
+        first = scanner._compile_patterns(("**/node_modules", "venv"))
+        second = scanner._compile_patterns(("**/node_modules", "venv"))
+        assert first is second
+
+
+class TestSplitPatterns:
+    def test_plain_names_go_to_set(self):
+        names, globs = scanner._split_patterns(
+            ["**/node_modules", "venv", "*.egg-info", "vendor/*", "build/out"]
+        )
+        assert names == frozenset({"node_modules", "venv"})
+        assert globs == ("*.egg-info", "vendor/*", "build/out")
+
 
 class TestGetRelativePath:
     def test_relative_to_base(self, tmp_path):
@@ -178,6 +277,17 @@ class TestGetRelativePath:
         result = scanner.get_relative_path(path, [Path("/other/base")])
         assert result == "/some/absolute/path"
 
+    def test_prefers_deepest_base(self):
+        repo = Path("/code/work/project")
+        assert scanner.get_relative_path(repo, [Path("/code"), Path("/code/work")]) == "project"
+
+    def test_sibling_with_common_prefix_is_not_under_base(self):
+        path = Path("/code-old/repo")
+        assert scanner.get_relative_path(path, [Path("/code")]) == "/code-old/repo"
+
+    def test_base_itself(self):
+        assert scanner.get_relative_path(Path("/code"), [Path("/code")]) == "."
+
 
 class TestScanDirectory:
     def test_finds_git_dir(self, temp_git_repo):
@@ -1,7 +1,10 @@
 """Tests for sync module."""
 
+import io
+from email.message import Message
 from pathlib import Path
 from unittest.mock import MagicMock, patch
+from urllib.error import HTTPError
 
 import pytest
 
@@ -175,7 +178,13 @@ class TestSyncRepo:
                 message="Already exists",
             )
             sync.sync_repo(tracked_repo)
-            mock_handle.assert_called_once()
+            mock_handle.assert_called_once_with(tracked_repo, True, git_dir_checked=True)
+
+    def test_existing_non_git_path_is_an_error(self, tmp_path, tracked_repo):
+        tracked_repo.path = tmp_path
+        result = sync.sync_repo(tracked_repo)
+        assert result.action == SyncAction.ERROR
+        assert "not a git repo" in result.message
 
 
 class TestHandleExistingRepo:
@@ -208,6 +217,35 @@ class TestHandleExistingRepo:
             assert result.action == SyncAction.SKIPPED
             assert "up to date" in result.message
 
+    def test_pulls_behind_clone_with_a_single_fetch(self, temp_git_repo, tmp_path):
+        import subprocess
+
+        clone = tmp_path / "clone"
+        subprocess.run(
+            ["git", "clone", str(temp_git_repo), str(clone)], capture_output=True, check=True
+        )
+        (temp_git_repo / "new.txt").write_text("x")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "more"], cwd=temp_git_repo, capture_output=True, check=True
+        )
+
+        repo = TrackedRepo(path=clone, remote=str(temp_git_repo))
+        with patch.object(sync.git_ops, "pull_repo", side_effect=AssertionError):
+            result = sync.handle_existing_repo(repo, pull_existing=True)
+
+        assert result.action == SyncAction.PULLED
+        assert result.message == "Pulled 1 files"
+        assert (clone / "new.txt").exists()
+
+    def test_skips_without_upstream_before_fetching(self, temp_git_repo):
+        repo = TrackedRepo(path=temp_git_repo, remote="git@github.com:user/repo.git")
+        with patch("git_repo_checker.sync.git_ops.fetch_repo") as mock_fetch:
+            result = sync.handle_existing_repo(repo, pull_existing=True)
+        assert result.action == SyncAction.SKIPPED
+        assert result.message == "No upstream configured"
+        mock_fetch.assert_not_called()
+
 
 class TestCloneTrackedRepo:
     def test_clones_successfully(self, tracked_repo):
@@ -232,6 +270,32 @@ class TestCloneTrackedRepo:
             assert "Network error" in result.message
 
 
+class TestExtractGitError:
+    def test_returns_first_fatal_or_error_line(self):
+        message = "Cloning into 'repo'...\n  error:  bad thing  \r\nfatal: later"
+        assert sync.extract_git_error(message) == "bad thing"
+
+    def test_falls_back_to_last_non_empty_line(self):
+        assert sync.extract_git_error("hint: one\nlast line \n\n") == "last line"
+
+    def test_blank_message_returned_as_is(self):
+        assert sync.extract_git_error("  \n ") == "  \n "
+
+
+class TestIsBranchNotFoundError:
+    def test_matches_git_clone_message(self):
+        message = (
+            "Cloning into 'repo'...\n"
+            "warning: Could not find remote branch dev to clone.\n"
+            "fatal: Remote branch dev not found in upstream origin\n"
+        )
+        assert sync.is_branch_not_found_error(message)
+
+    def test_other_errors_do_not_match(self):
+        assert not sync.is_branch_not_found_error("fatal: repository not found")
+        assert not sync.is_branch_not_found_error("remote branch\nrepository not found")
+
+
 class TestSyncAll:
     def test_syncs_multiple_repos(self, tmp_path):
         repos = [
@@ -296,6 +360,55 @@ class TestSyncAll:
         assert result.skipped == 1
         assert result.results[0].message == "Ignored"
 
+    def test_pool_sized_for_active_repos(self, tmp_path):
+        repos = [
+            TrackedRepo(path=tmp_path / f"repo{i}", remote=f"git@github.com:u/r{i}.git")
+            for i in range(3)
+        ]
+        repos.append(TrackedRepo(path=tmp_path / "skip", remote="r", ignore=True))
+
+        with (
+            patch.object(sync, "sync_repo") as mock_sync,
+            patch.object(sync.git_ops, "io_worker_count", return_value=2) as mock_count,
+        ):
+            mock_sync.side_effect = lambda repo, _pull: sync.SyncRepoResult(
+                repo=repo, action=SyncAction.PULLED, message="ok"
+            )
+            result = sync.sync_all(repos, max_workers=5)
+
+        mock_count.assert_called_once_with(3, 5)
+        assert result.pulled == 3
+
+    def test_results_follow_input_order(self, tmp_path):
+        repos = [
+            TrackedRepo(path=tmp_path / "zeta", remote="git@github.com:u/z.git"),
+            TrackedRepo(path=tmp_path / "beta", remote="git@github.com:u/b.git", ignore=True),
+            TrackedRepo(path=tmp_path / "alpha", remote="git@github.com:u/a.git"),
+        ]
+
+        with patch.object(sync, "sync_repo") as mock_sync:
+            mock_sync.side_effect = lambda repo, _pull: sync.SyncRepoResult(
+                repo=repo, action=SyncAction.PULLED, message="ok"
+            )
+            result = sync.sync_all(repos)
+
+        assert [r.repo for r in result.results] == repos
+
+    def test_reports_each_result_as_it_finishes(self, tmp_path):
+        repos = [
+            TrackedRepo(path=tmp_path / f"repo{i}", remote=f"git@github.com:u/r{i}.git")
+            for i in range(3)
+        ]
+        seen = []
+
+        with patch.object(sync, "sync_repo") as mock_sync:
+            mock_sync.side_effect = lambda repo, _pull: sync.SyncRepoResult(
+                repo=repo, action=SyncAction.PULLED, message="ok"
+            )
+            sync.sync_all(repos, on_result=seen.append)
+
+        assert sorted(r.repo.path for r in seen) == [r.path for r in repos]
+
 
 class TestApplyPathPrefix:
     def test_absolute_path_unchanged(self):
@@ -314,6 +427,21 @@ class TestApplyPathPrefix:
         result = sync.apply_path_prefix("work/project", str(tmp_path))
         assert result == tmp_path / "work" / "project"
 
+    def test_normalizes_without_resolving_symlinks(self, tmp_path):
+        (tmp_path / "real").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        result = sync.apply_path_prefix("link/sub/../repo", str(tmp_path))
+        assert result == tmp_path / "link" / "repo"
+
+    def test_relative_prefix_made_absolute(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        assert sync.apply_path_prefix("repo", ".") == tmp_path / "repo"
+
+    def test_path_prefix_is_not_expanded_again(self, tmp_path):
+        with patch.object(Path, "expanduser", side_effect=AssertionError("expanded")):
+            result = sync.apply_path_prefix("my-repo", tmp_path)
+        assert result == tmp_path / "my-repo"
+
 
 class TestGetEffectivePathPrefix:
     def test_cli_prefix_takes_priority(self, monkeypatch):
@@ -345,6 +473,18 @@ class TestLoadLocalConfig:
         result = sync.load_local_config()
         assert result["path_prefix"] == "/custom/path"
 
+    def test_parsed_once_until_cache_cleared(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "local.yml"
+        config_file.write_text("path_prefix: /first")
+        monkeypatch.setattr(sync, "LOCAL_CONFIG_PATH", config_file)
+        assert sync.load_local_config()["path_prefix"] == "/first"
+
+        config_file.write_text("path_prefix: /second")
+        assert sync.load_local_config()["path_prefix"] == "/first"
+
+        sync._load_local_config.cache_clear()
+        assert sync.load_local_config()["path_prefix"] == "/second"
+
 
 class TestLoadReposWithPathPrefix:
     def test_loads_with_file_prefix(self, tmp_path):
@@ -387,6 +527,22 @@ repos:
         repos = sync.load_repos_from_path(repos_path)
         assert repos[0].path == Path("/absolute/repo")
 
+    def test_empty_file_skips_local_config(self, tmp_path, monkeypatch):
+        repos_path = tmp_path / "repos.yml"
+        repos_path.write_text("path_prefix: ~/code\nrepos: []\n")
+        monkeypatch.setattr(sync, "load_local_config", MagicMock(side_effect=AssertionError))
+        assert sync.load_repos_from_path(repos_path) == []
+
+
+class TestLoadReposFromBytes:
+    def test_parses_content(self, tmp_path):
+        content = f"path_prefix: {tmp_path}\nrepos:\n  - path: repo1\n    remote: r\n".encode()
+        repos = sync.load_repos_from_bytes(content)
+        assert [r.path for r in repos] == [tmp_path / "repo1"]
+
+    def test_empty_content(self):
+        assert sync.load_repos_from_bytes(b"") == []
+
 
 class TestFetchReposFromUrl:
     def test_fetches_and_saves(self, tmp_path):
@@ -396,6 +552,7 @@ class TestFetchReposFromUrl:
         with patch("urllib.request.urlopen") as mock_urlopen:
             mock_response = MagicMock()
             mock_response.read.return_value = mock_content
+            mock_response.headers = {}
             mock_response.__enter__ = lambda s: mock_response
             mock_response.__exit__ = lambda s, *args: None
             mock_urlopen.return_value = mock_response
@@ -413,6 +570,7 @@ class TestFetchReposFromUrl:
         with patch("urllib.request.urlopen") as mock_urlopen:
             mock_response = MagicMock()
             mock_response.read.return_value = mock_content
+            mock_response.headers = {}
             mock_response.__enter__ = lambda s: mock_response
             mock_response.__exit__ = lambda s, *args: None
             mock_urlopen.return_value = mock_response
@@ -422,6 +580,53 @@ class TestFetchReposFromUrl:
             assert result == output_path
             assert output_path.exists()
 
+    def test_saves_etag_and_sends_it_back(self, tmp_path):
+        output_path = tmp_path / "repos.yml"
+
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            mock_response = MagicMock()
+            mock_response.read.return_value = b"repos: []"
+            mock_response.headers = {"ETag": '"abc"'}
+            mock_response.__enter__ = lambda s: mock_response
+            mock_response.__exit__ = lambda s, *args: None
+            mock_urlopen.return_value = mock_response
+            sync.fetch_repos_from_url("https://example.com/repos.yml", output_path)
+
+            mock_urlopen.side_effect = HTTPError(
+                "https://example.com/repos.yml", 304, "Not Modified", Message(), None
+            )
+            output_path.write_text("local: edit")
+            result = sync.fetch_repos_from_url("https://example.com/repos.yml", output_path)
+
+        request = mock_urlopen.call_args.args[0]
+        assert request.get_header("If-none-match") == '"abc"'
+        assert result == output_path
+        assert output_path.read_text() == "local: edit"
+
+    def test_no_etag_sent_without_saved_file(self, tmp_path):
+        output_path = tmp_path / "repos.yml"
+        (tmp_path / "repos.yml.etag").write_text('"stale"')
+
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            mock_response = MagicMock()
+            mock_response.read.return_value = b"repos: []"
+            mock_response.headers = {}
+            mock_response.__enter__ = lambda s: mock_response
+            mock_response.__exit__ = lambda s, *args: None
+            mock_urlopen.return_value = mock_response
+            sync.fetch_repos_from_url("https://example.com/repos.yml", output_path)
+
+        assert not mock_urlopen.call_args.args[0].has_header("If-none-match")
+        assert not (tmp_path / "repos.yml.etag").exists()
+
+    def test_other_http_errors_propagate(self, tmp_path):
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            mock_urlopen.side_effect = HTTPError(
+                "https://example.com/repos.yml", 404, "Not Found", Message(), None
+            )
+            with pytest.raises(HTTPError):
+                sync.fetch_repos_from_url("https://example.com/repos.yml", tmp_path / "r.yml")
+
 
 def _make_repo_info(path: Path) -> RepoInfo:
     return RepoInfo(path=path, branch="main", status=RepoStatus.CLEAN)
@@ -442,6 +647,73 @@ class TestRepoToExportEntry:
         mock_remote.assert_not_called()
 
 
+class TestExportReposToFile:
+    def test_merge_replaces_file_keeping_mode(self, tmp_path):
+        output = tmp_path / "repos.yml"
+        output.write_text("path_prefix: /code\nrepos: []\n")
+        output.chmod(0o600)
+        repo = _make_repo_info(tmp_path / "my-repo")
+
+        with patch("git_repo_checker.sync.git_ops.get_remote_url") as mock_remote:
+            mock_remote.return_value = "git@github.com:u/r.git"
+            added, _skipped, _collisions = sync.export_repos_to_file(
+                [repo], output, path_prefix=str(tmp_path), merge=True
+            )
+
+        assert added == 1
+        assert "git@github.com:u/r.git" in output.read_text()
+        assert output.stat().st_mode & 0o777 == 0o600
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_failed_write_keeps_existing_file(self, tmp_path):
+        output = tmp_path / "repos.yml"
+        original = "path_prefix: /code\nrepos: []\n"
+        output.write_text(original)
+        repo = _make_repo_info(tmp_path / "my-repo")
+
+        with (
+            patch("git_repo_checker.sync.git_ops.get_remote_url") as mock_remote,
+            patch("git_repo_checker.sync._dump_repos_document", side_effect=OSError("disk full")),
+        ):
+            mock_remote.return_value = "git@github.com:u/r.git"
+            with pytest.raises(OSError, match="disk full"):
+                sync.export_repos_to_file([repo], output, path_prefix=str(tmp_path), merge=True)
+
+        assert output.read_text() == original
+        assert list(tmp_path.glob("*.tmp")) == []
+
+
+class TestDumpReposDocument:
+    def test_blank_line_before_each_entry(self):
+        stream = io.StringIO()
+        data = {
+            "path_prefix": "/code",
+            "repos": [{"path": "a", "remote": "r1"}, {"path": "b", "remote": "r2"}],
+        }
+        sync._dump_repos_document(data, stream)
+        assert stream.getvalue() == (
+            "path_prefix: /code\nrepos:\n\n- path: a\n  remote: r1\n\n- path: b\n  remote: r2\n"
+        )
+
+    def test_empty_repos_list(self):
+        stream = io.StringIO()
+        sync._dump_repos_document({"path_prefix": "/code", "repos": []}, stream)
+        assert stream.getvalue() == "path_prefix: /code\nrepos: []\n"
+
+
+class TestIndexExistingRepos:
+    def test_collects_remotes_and_paths(self):
+        remotes, paths = sync._index_existing_repos(
+            [
+                {"path": "a", "remote": "r1"},
+                {"path": "b"},
+                {"remote": "r2"},
+            ]
+        )
+        assert remotes == {"r1", "r2"}
+        assert paths == {"a": "r1", "b": None}
+
+
 class TestAutoTrackRepos:
     def test_creates_file_when_missing(self, tmp_path):
         target = tmp_path / "repos.yml"
@@ -0,0 +1,121 @@
+"""Tests for watch module."""
+
+import subprocess
+
+from git_repo_checker import analyzer, git_ops, watch
+
+
+def _count_analyses(monkeypatch) -> list:
+    calls: list = []
+    original = analyzer.analyze_repo
+
+    def counting(path, config, cache=None, host_slot=None):
+        calls.append(path)
+        return original(path, config, cache, host_slot)
+
+    monkeypatch.setattr(analyzer, "analyze_repo", counting)
+    return calls
+
+
+class TestRepoWatcher:
+    def test_first_refresh_analyzes_all(self, nested_repos, sample_config):
+        sample_config.scan_paths = [nested_repos]
+        watcher = watch.RepoWatcher(sample_config)
+
+        changed = watcher.refresh()
+
+        assert len(changed) == 3
+        assert [r.path for r in watcher.repos()] == sorted(changed)
+        assert watcher.result().total_scanned == 3
+
+    def test_unchanged_repos_are_skipped(self, nested_repos, sample_config, monkeypatch):
+        sample_config.scan_paths = [nested_repos]
+        watcher = watch.RepoWatcher(sample_config)
+        watcher.refresh()
+        calls = _count_analyses(monkeypatch)
+
+        assert watcher.refresh() == []
+        assert calls == []
+
+    def test_only_changed_repo_reanalyzed(self, nested_repos, sample_config):
+        sample_config.scan_paths = [nested_repos]
+        watcher = watch.RepoWatcher(sample_config)
+        watcher.refresh()
+
+        repo = nested_repos / "repo2"
+        (repo / "README.md").write_text("changed")
+        subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
+
+        assert watcher.refresh() == [repo]
+        assert watcher.repos_by_path[repo].changed_files == 1
+
+    def test_removed_repo_dropped(self, nested_repos, sample_config):
+        sample_config.scan_paths = [nested_repos]
+        watcher = watch.RepoWatcher(sample_config)
+        watcher.refresh()
+
+        subprocess.run(["rm", "-rf", str(nested_repos / "repo1")], check=True)
+        watcher.refresh()
+
+        assert nested_repos / "repo1" not in watcher.repos_by_path
+        assert len(watcher.repos()) == 2
+
+    def test_fetch_ttl_ignores_repos_without_upstream(
+        self, nested_repos, sample_config, monkeypatch
+    ):
+        sample_config.scan_paths = [nested_repos]
+        sample_config.auto_pull.fetch_ttl_seconds = 300
+        watcher = watch.RepoWatcher(sample_config)
+        watcher.refresh()
+        calls = _count_analyses(monkeypatch)
+
+        assert watcher.refresh() == []
+        assert watcher.refresh() == []
+        assert calls == []
+
+    def test_failed_fetch_waits_for_ttl(self, temp_git_repo, sample_config, monkeypatch):
+        branch = subprocess.run(
+            ["git", "branch", "--show-current"],
+            cwd=temp_git_repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        for args in (
+            ["remote", "add", "origin", "https://example.com/repo.git"],
+            ["config", f"branch.{branch}.remote", "origin"],
+            ["config", f"branch.{branch}.merge", f"refs/heads/{branch}"],
+        ):
+            subprocess.run(["git", *args], cwd=temp_git_repo, capture_output=True, check=True)
+        fetches: list = []
+        monkeypatch.setattr(git_ops, "fetch_repo", lambda path, cache=None: fetches.append(path))
+        sample_config.scan_paths = [temp_git_repo]
+        sample_config.auto_pull.fetch_ttl_seconds = 300
+        watcher = watch.RepoWatcher(sample_config)
+
+        assert watcher.refresh() == [temp_git_repo]
+        assert watcher.refresh() == []
+        assert fetches == [temp_git_repo]
+
+        watcher.cache.fetch_timestamps[temp_git_repo] -= 300
+        assert watcher.refresh() == [temp_git_repo]
+        assert len(fetches) == 2
+
+
+class TestRunWatch:
+    def test_stops_after_max_cycles(self, nested_repos, sample_config):
+        sample_config.scan_paths = [nested_repos]
+        watcher = watch.RepoWatcher(sample_config)
+        updates: list[int] = []
+        sleeps: list[float] = []
+
+        watch.run_watch(
+            watcher,
+            lambda w, changed: updates.append(len(changed)),
+            interval=2.0,
+            max_cycles=2,
+            sleep=sleeps.append,
+        )
+
+        assert updates == [3, 0]
+        assert sleeps == [2.0]